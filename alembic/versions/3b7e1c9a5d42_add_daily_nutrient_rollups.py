@@ -0,0 +1,52 @@
+"""Add daily_nutrient_rollups table
+
+Revision ID: 3b7e1c9a5d42
+Revises: 0d2d67980bd8
+Create Date: 2026-10-17 10:12:41.203518
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7e1c9a5d42"
+down_revision: Union[str, Sequence[str], None] = "0d2d67980bd8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "daily_nutrient_rollups",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("calories", sa.Float(), nullable=False),
+        sa.Column("carbs", sa.Float(), nullable=False),
+        sa.Column("protein", sa.Float(), nullable=False),
+        sa.Column("fat", sa.Float(), nullable=False),
+        sa.Column("sugar", sa.Float(), nullable=False),
+        sa.Column("fiber", sa.Float(), nullable=False),
+        sa.Column("sodium", sa.Float(), nullable=False),
+        sa.Column("cholesterol", sa.Float(), nullable=False),
+        sa.Column("saturated_fat", sa.Float(), nullable=False),
+        sa.Column("meal_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "user_id", "day", name="uq_daily_nutrient_rollups_user_day"
+        ),
+    )
+    # 기존 데이터는 배포 후 backfill 실행
+    # python -m app.commands.nutrient_rollup backfill
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("daily_nutrient_rollups")
@@ -0,0 +1,41 @@
+"""Add meal_logs(user_id, eaten_at) and meal_items(meal_log_id) indexes
+
+Revision ID: 7c4f2e8b1a96
+Revises: 3b7e1c9a5d42
+Create Date: 2026-10-17 13:40:18.552104
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c4f2e8b1a96"
+down_revision: Union[str, Sequence[str], None] = "3b7e1c9a5d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_meal_logs_user_id_eaten_at",
+        "meal_logs",
+        ["user_id", "eaten_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_meal_items_meal_log_id",
+        "meal_items",
+        ["meal_log_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_meal_items_meal_log_id", table_name="meal_items")
+    op.drop_index("ix_meal_logs_user_id_eaten_at", table_name="meal_logs")
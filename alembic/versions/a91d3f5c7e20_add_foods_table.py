@@ -0,0 +1,40 @@
+"""Add foods table (food nutrition cache)
+
+Revision ID: a91d3f5c7e20
+Revises: 7c4f2e8b1a96
+Create Date: 2026-10-17 15:02:47.318630
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a91d3f5c7e20"
+down_revision: Union[str, Sequence[str], None] = "7c4f2e8b1a96"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "foods",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("name_key", sa.String(length=200), nullable=False),
+        sa.Column("foodname", sa.String(length=200), nullable=False),
+        sa.Column("nutrition", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_foods_name_key"), "foods", ["name_key"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_foods_name_key"), table_name="foods")
+    op.drop_table("foods")
@@ -0,0 +1,45 @@
+"""Add case-insensitive unique indexes on users(lower(email)), users(lower(username))
+
+Revision ID: c5e8d2a71f49
+Revises: a91d3f5c7e20
+Create Date: 2026-10-17 16:05:42.318907
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e8d2a71f49"
+down_revision: Union[str, Sequence[str], None] = "a91d3f5c7e20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 대소문자만 다른 기존 중복 데이터가 있으면 unique index 생성 실패 -> 사전 정리 필요
+# INCLUDE 원본 컬럼: 중복확인 EXISTS 쿼리가 index-only scan 가능
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "uq_users_email_lower",
+        "users",
+        [sa.text("lower(email)")],
+        unique=True,
+        postgresql_include=["email"],
+    )
+    op.create_index(
+        "uq_users_username_lower",
+        "users",
+        [sa.text("lower(username)")],
+        unique=True,
+        postgresql_include=["username"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_users_username_lower", table_name="users")
+    op.drop_index("uq_users_email_lower", table_name="users")
@@ -1,8 +1,10 @@
 import json
 import asyncio
 import httpx
+from contextlib import nullcontext
 from typing import Any, Dict, Optional
 from app.core.settings import settings
+from app.clients.circuit_breaker import CircuitBreaker
 
 # 외부 AI/LLM 서버와 통신하여 음식 이미지 식별 및 영양소 분석을 요청하는 클라이언트 역할
 
@@ -11,15 +13,97 @@ inference_url_v1 = settings.inference_url("v1", "analyze")
 inference_url_v2 = settings.inference_url("v2", "analyze")
 inference_url_v3 = settings.inference_url("v3", "analyze")
 inference_url_v4 = settings.inference_url("v4", "analyze")
+inference_url_v4_by_url = settings.inference_url("v4", "analyze-url")
+inference_url_v4_batch = settings.inference_url("v4", "analyze-batch")
 # llm_url_v1 = settings.llm_url("v1", "nutrition")
 
 
+# 엔드포인트별 timeout (connect / read 분리)
+DETECTION_TIMEOUT = httpx.Timeout(
+    settings.ai_detection_read_timeout, connect=settings.ai_connect_timeout
+)
+LLM_TIMEOUT = httpx.Timeout(
+    settings.ai_llm_read_timeout, connect=settings.ai_connect_timeout
+)
+
+
+def _http2_available() -> bool:
+    # HTTP/2 는 h2 패키지 필요 (https ALPN 협상시에만 사용, http:// 는 HTTP/1.1)
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 class AIClient:
     """
     외부 AI/LLM 서버와 상호작용하기 위한 클라이언트
     음식 객체 감지 및 영양분 분석 요청을 처리
+    - httpx.AsyncClient 1개를 app lifespan 동안 공유 (keep-alive 커넥션 재사용)
     """
 
+    _client: httpx.AsyncClient | None = None
+    _inflight: int = 0
+
+    # --lifecycle-- main.py lifespan에서 호출
+    @classmethod
+    async def startup(cls, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        """
+        공유 client 생성
+        :param transport: 테스트/벤치마크용 transport 주입 (None이면 기본 커넥션 풀)
+        """
+        if cls._client is not None:
+            return
+        cls._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.ai_http_max_connections,
+                max_keepalive_connections=settings.ai_http_max_keepalive,
+                keepalive_expiry=settings.ai_http_keepalive_expiry,
+            ),
+            http2=settings.ai_http2 and _http2_available(),
+            timeout=LLM_TIMEOUT,
+            transport=transport,
+        )
+
+    @classmethod
+    async def shutdown(cls, grace_sec: float | None = None) -> None:
+        """
+        진행중 요청 완료 대기(최대 grace_sec) 후 커넥션 풀 종료
+        """
+        if cls._client is None:
+            return
+        grace_sec = settings.ai_shutdown_grace_sec if grace_sec is None else grace_sec
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + grace_sec
+        while cls._inflight > 0 and loop.time() < deadline:
+            await asyncio.sleep(0.05)
+
+        client, cls._client = cls._client, None
+        await client.aclose()
+
+    @classmethod
+    async def _post(cls, url: str, timeout: httpx.Timeout, **kwargs) -> httpx.Response:
+        # lifespan 밖(CLI, 단독 테스트)에서 호출되면 lazy 생성
+        if cls._client is None:
+            await cls.startup()
+        # 엔드포인트(path)별 circuit breaker: open / 동시 요청 초과시 호출 없이 AIServiceUnavailable
+        guard = (
+            CircuitBreaker.get(httpx.URL(url).path).guard(cls.is_retryable)
+            if settings.ai_breaker_enabled
+            else nullcontext()
+        )
+        async with guard:
+            cls._inflight += 1
+            try:
+                response = await cls._client.post(url, timeout=timeout, **kwargs)
+            finally:
+                cls._inflight -= 1
+            # 5xx 는 breaker 실패로 집계 (raise_for_status 는 호출측에서)
+            if response.status_code >= 500:
+                response.raise_for_status()
+            return response
+
     @staticmethod
     # v4만 실행(임시)
     # TODO: confidence 분기 추가 필요 -> AI 모듈 내부에서 자체 처리 하는걸로? (추후 변동 가능성 있으니 나중에 컨펌 후 TODO 삭제)
@@ -28,20 +112,68 @@ class AIClient:
     ) -> Dict[str, Any]:
         """
         AI 서버에 이미지를 전송하여 음식 감지 요청
+        (AI_DETECTION_BATCH_ENABLED 이면 동시 요청을 모아 배치 전송)
+        """
+        if settings.ai_detection_batch_enabled:
+            from app.clients.detection_batcher import DetectionBatcher
+
+            return await DetectionBatcher.submit(image_data, image_id, content_type)
+
+        try:
+            filename = "image.png" if content_type == "image/png" else "image.jpg"
+            files = {"image": (filename, image_data, content_type)}
+            data = {"image_id": image_id}
 
+            response = await AIClient._post(
+                inference_url_v4, DETECTION_TIMEOUT, data=data, files=files
+            )
+            # 응답 코드가 200번대가 아닐 경우 예외처리
+            response.raise_for_status()
+            return response.json()
+        except Exception:
+            raise
+
+    @staticmethod
+    async def request_detection_batch(
+        items: list[tuple[bytes, str, str]],
+    ) -> list[Dict[str, Any]]:
+        """
+        여러 이미지를 1회 요청으로 감지 (DetectionBatcher 에서 호출)
+        :param items: [(image_data, image_id, content_type), ...]
+        :return: image_id 별 결과 목록 (실패 항목은 {"image_id", "error"})
+        """
+        files = [
+            (
+                "images",
+                (
+                    "image.png" if content_type == "image/png" else "image.jpg",
+                    image_data,
+                    content_type,
+                ),
+            )
+            for image_data, _, content_type in items
+        ]
+        data = {"image_ids": [image_id for _, image_id, _ in items]}
+
+        response = await AIClient._post(
+            inference_url_v4_batch, DETECTION_TIMEOUT, data=data, files=files
+        )
+        response.raise_for_status()
+        return response.json()["results"]
+
+    @staticmethod
+    async def request_detection_by_url(image_url: str, image_id: str) -> Dict[str, Any]:
+        """
+        이미지 URL(presigned GET)을 전달하여 음식 감지 요청 (AI 서버가 S3에서 직접 다운로드)
         """
         try:
-            # 30초 타임아웃시 롤백
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                filename = "image.png" if content_type == "image/png" else "image.jpg"
-                files = {"image": (filename, image_data, content_type)}
-                data = {"image_id": image_id}
-
-                # 실제 연결 시 타임아웃 설정 고려 필요
-                response = await client.post(inference_url_v4, data=data, files=files)
-                # 응답 코드가 200번대가 아닐 경우 예외처리
-                response.raise_for_status()
-                return response.json()
+            payload = {"image_url": image_url, "image_id": image_id}
+
+            response = await AIClient._post(
+                inference_url_v4_by_url, DETECTION_TIMEOUT, json=payload
+            )
+            response.raise_for_status()
+            return response.json()
         except Exception:
             raise
 
@@ -53,30 +185,24 @@ class AIClient:
         LLM 서버에 단일 음식 영양소 분석을 요청
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                payload = {"food_name": foodname}
+            payload = {"food_name": foodname}
 
-                response = await client.post(
-                    settings.llm_url("nutrition"),
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await AIClient._post(
+                settings.llm_url("nutrition"), LLM_TIMEOUT, json=payload
+            )
+            response.raise_for_status()
+            return response.json()
         except Exception:
             raise
 
-    # 다중음식 영양소 분석
     @staticmethod
-    async def request_analysis(foods: list[dict[str, str]]) -> dict[str, Any]:
+    def is_retryable(exc: BaseException) -> bool:
         """
-        LLM 서버에 감지된 음식들의 영양소 분석을 요청 (기존 리스트 방식)
-        단일 분석 API를 병렬로 호출하여 결과를 합침
+        재시도 대상 에러: timeout / 연결 실패 / 5xx
+        (4xx 는 같은 요청 재시도해도 동일 결과)
         """
-        try:
-            tasks = [
-                AIClient.request_single_analysis(item["food_name"]) for item in foods
-            ]
-            results = await asyncio.gather(*tasks)
-            return {"results": results}
-        except Exception:
-            raise
+        if isinstance(exc, (asyncio.TimeoutError, httpx.TimeoutException, httpx.TransportError)):
+            return True
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code >= 500
+        return False
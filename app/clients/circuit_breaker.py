@@ -0,0 +1,197 @@
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable
+
+from app.core.settings import settings
+
+# AI 서버 엔드포인트별 circuit breaker + 동시 요청 제한 (load shedding)
+# - closed   : 정상. 최근 N건(window) 중 실패율/지연율이 임계치 이상이면 open
+# - open     : AI 호출 없이 즉시 실패 (AI_BREAKER_OPEN_SEC 동안) -> 30초 timeout 대기 방지
+# - half_open: open 시간 경과 후 시험 요청 일부만 통과, 모두 성공 -> closed / 실패 -> 다시 open
+# - 엔드포인트별 진행중 요청 수 상한 초과시 즉시 거절 (worker/DB 커넥션 고갈 방지)
+# - 실패 판정은 호출측(is_failure)에서 결정: timeout / 연결 실패 / 5xx (4xx 는 서버 정상)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class AIServiceUnavailable(Exception):
+    """AI 서버 호출 생략 (-> 503 + Retry-After)"""
+
+    def __init__(self, endpoint: str, reason: str, retry_after: int):
+        super().__init__(f"AI service unavailable ({endpoint}): {reason}")
+        self.endpoint = endpoint
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(AIServiceUnavailable):
+    """circuit open (또는 half-open 시험 요청 초과)"""
+
+
+class AIServiceOverloaded(AIServiceUnavailable):
+    """엔드포인트 동시 요청 수 상한 초과"""
+
+
+class CircuitBreaker:
+    _registry: dict[str, "CircuitBreaker"] = {}
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int | None = None,
+        min_calls: int | None = None,
+        failure_rate: float | None = None,
+        slow_call_sec: float | None = None,
+        slow_call_rate: float | None = None,
+        open_sec: float | None = None,
+        half_open_calls: int | None = None,
+        max_inflight: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.min_calls = min_calls or settings.ai_breaker_min_calls
+        self.failure_rate = failure_rate or settings.ai_breaker_failure_rate
+        self.slow_call_sec = slow_call_sec or settings.ai_breaker_slow_call_sec
+        self.slow_call_rate = slow_call_rate or settings.ai_breaker_slow_call_rate
+        self.open_sec = open_sec or settings.ai_breaker_open_sec
+        self.half_open_calls = half_open_calls or settings.ai_breaker_half_open_calls
+        self.max_inflight = max_inflight or settings.ai_max_inflight_per_endpoint
+        self._clock = clock
+
+        # 최근 호출 결과 (failed, slow)
+        self._window: deque[tuple[bool, bool]] = deque(
+            maxlen=window_size or settings.ai_breaker_window_size
+        )
+        self.state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0  # half-open 에서 통과시킨 시험 요청 수
+        self._probe_successes = 0
+        self.inflight = 0
+        self._counters = {
+            "calls": 0,
+            "failures": 0,
+            "slow_calls": 0,
+            "rejected_open": 0,
+            "rejected_overload": 0,
+            "opened": 0,
+        }
+
+    @classmethod
+    def get(cls, name: str) -> "CircuitBreaker":
+        """
+        엔드포인트별 breaker (최초 호출시 생성)
+        """
+        breaker = cls._registry.get(name)
+        if breaker is None:
+            breaker = cls._registry[name] = cls(name)
+        return breaker
+
+    @classmethod
+    def all_stats(cls) -> dict[str, dict[str, Any]]:
+        return {name: breaker.stats() for name, breaker in cls._registry.items()}
+
+    @classmethod
+    def reset_all(cls) -> None:
+        cls._registry.clear()
+
+    @asynccontextmanager
+    async def guard(self, is_failure: Callable[[BaseException], bool]) -> AsyncIterator[None]:
+        """
+        AI 호출을 감싸 상태 판정/동시 요청 제한 적용
+        :param is_failure: 예외가 breaker 실패로 집계되는지 (False 면 성공으로 간주)
+        :raises CircuitOpenError, AIServiceOverloaded: 호출 생략
+        """
+        probe = self._acquire()
+        start = self._clock()
+        self.inflight += 1
+        failed = False
+        try:
+            yield
+        except BaseException as e:
+            failed = isinstance(e, Exception) and is_failure(e)
+            raise
+        finally:
+            self.inflight -= 1
+            self._record(failed, self._clock() - start >= self.slow_call_sec, probe)
+
+    def _acquire(self) -> bool:
+        """
+        호출 허용 여부 판정
+        :return: half-open 시험 요청 여부
+        """
+        if self.state == OPEN:
+            if self._clock() - self._opened_at < self.open_sec:
+                self._counters["rejected_open"] += 1
+                raise CircuitOpenError(self.name, "circuit open", self._retry_after())
+            self.state, self._probes, self._probe_successes = HALF_OPEN, 0, 0
+
+        # 동시 요청 제한은 half-open 시험 요청에도 적용 (시험 슬롯 소모 전에 판정)
+        if self.inflight >= self.max_inflight:
+            self._counters["rejected_overload"] += 1
+            raise AIServiceOverloaded(self.name, "too many in-flight requests", 1)
+
+        if self.state == HALF_OPEN:
+            if self._probes >= self.half_open_calls:
+                self._counters["rejected_open"] += 1
+                raise CircuitOpenError(self.name, "circuit half-open", 1)
+            self._probes += 1
+            return True
+        return False
+
+    def _record(self, failed: bool, slow: bool, probe: bool) -> None:
+        self._counters["calls"] += 1
+        self._counters["failures"] += failed
+        self._counters["slow_calls"] += slow
+
+        if probe:
+            if self.state != HALF_OPEN:  # 다른 시험 요청이 이미 open 으로 전환
+                return
+            if failed or slow:
+                self._open()
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_calls:
+                self.state = CLOSED
+                self._window.clear()
+            return
+
+        if self.state != CLOSED:
+            return
+        self._window.append((failed, slow))
+        if len(self._window) < self.min_calls:
+            return
+        failures = sum(f for f, _ in self._window)
+        slow_calls = sum(s for _, s in self._window)
+        if (
+            failures / len(self._window) >= self.failure_rate
+            or slow_calls / len(self._window) >= self.slow_call_rate
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self._opened_at = self._clock()
+        self._window.clear()
+        self._counters["opened"] += 1
+
+    def _retry_after(self) -> int:
+        remaining = self.open_sec - (self._clock() - self._opened_at)
+        return max(1, int(remaining + 0.999))
+
+    def stats(self) -> dict[str, Any]:
+        window = len(self._window)
+        return {
+            "state": self.state,
+            "inflight": self.inflight,
+            "max_inflight": self.max_inflight,
+            "window_calls": window,
+            "window_failure_rate": (
+                round(sum(f for f, _ in self._window) / window, 3) if window else 0.0
+            ),
+            "window_slow_rate": (
+                round(sum(s for _, s in self._window) / window, 3) if window else 0.0
+            ),
+            "retry_after": self._retry_after() if self.state == OPEN else 0,
+            **self._counters,
+        }
@@ -0,0 +1,151 @@
+import asyncio
+from typing import Any, Dict
+
+from app.clients.ai_client import AIClient
+from app.core.settings import settings
+
+# 감지 요청 micro-batching (AI_DETECTION_BATCH_ENABLED=true)
+# - 동시에 들어온 AIClient.request_detection 호출을 최대 N장 / M ms 까지 모아 1회 multi-image 요청
+# - 결과는 image_id 기준으로 각 호출자에게 분배 (요청 실패시 batch 전체 호출자에게 같은 예외)
+# - 배치 계약: POST /api/inference/v4/analyze-batch
+#     request : multipart images(file) x N + image_ids(form) x N (같은 순서)
+#     response: {"results": [{"image_id": ..., "food_name": ..., "candidates": [...]}
+#                            | {"image_id": ..., "error": "..."}]}
+# - main.py lifespan 에서 startup/shutdown
+
+
+class DetectionBatchItemError(Exception):
+    """배치 내 개별 이미지 감지 실패 (AI 서버가 해당 image_id 에 error 반환)"""
+
+
+class DetectionBatcher:
+    _queue: asyncio.Queue | None = None
+    _collector: asyncio.Task | None = None
+    _dispatches: set[asyncio.Task] = set()
+    _semaphore: asyncio.Semaphore | None = None
+    _max_batch_size: int = 1
+    _max_wait_sec: float = 0.0
+    _counters = {"requests": 0, "batches": 0, "failed_batches": 0, "max_batch_size": 0}
+
+    # --lifecycle-- main.py lifespan에서 호출
+    @classmethod
+    def startup(
+        cls,
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """
+        :param max_batch_size: 배치당 최대 이미지 수 (N)
+        :param max_wait_ms: 첫 요청 도착 후 배치를 모으는 최대 대기 시간 (M)
+        :param max_concurrency: 동시에 전송중인 배치 수 상한 (초과시 다음 배치는 대기하며 계속 모음)
+        """
+        if cls._queue is not None:
+            return
+        cls._max_batch_size = max_batch_size or settings.ai_detection_batch_max_size
+        cls._max_wait_sec = (
+            settings.ai_detection_batch_max_wait_ms if max_wait_ms is None else max_wait_ms
+        ) / 1000
+        cls._semaphore = asyncio.Semaphore(
+            max_concurrency or settings.ai_detection_batch_max_concurrency
+        )
+        cls._queue = asyncio.Queue()
+        cls._collector = asyncio.create_task(cls._collect(), name="detection-batcher")
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """
+        대기중 요청까지 전송 후 종료 (진행중 배치 응답 대기)
+        """
+        if cls._queue is None:
+            return
+        cls._queue.put_nowait(None)  # 종료 신호 (앞서 들어온 요청은 모두 전송)
+        await cls._collector
+        await asyncio.gather(*cls._dispatches, return_exceptions=True)
+        cls._queue, cls._collector, cls._semaphore = None, None, None
+
+    @classmethod
+    async def submit(
+        cls, image_data: bytes, image_id: str, content_type: str = "image/jpeg"
+    ) -> Dict[str, Any]:
+        # lifespan 밖(단독 테스트 등)에서 호출되면 lazy 시작
+        if cls._queue is None:
+            cls.startup()
+        future = asyncio.get_running_loop().create_future()
+        cls._queue.put_nowait(((image_data, image_id, content_type), future))
+        cls._counters["requests"] += 1
+        return await future
+
+    @classmethod
+    async def _collect(cls) -> None:
+        loop = asyncio.get_running_loop()
+        queue = cls._queue
+        stopping = False
+        while not stopping:
+            first = await queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = loop.time() + cls._max_wait_sec
+            while len(batch) < cls._max_batch_size:
+                remaining = deadline - loop.time()
+                try:
+                    entry = (
+                        queue.get_nowait()
+                        if remaining <= 0 or not queue.empty()
+                        else await asyncio.wait_for(queue.get(), remaining)
+                    )
+                except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            # 전송중 배치 수 상한 -> 대기하는 동안 들어온 요청은 다음 배치로
+            semaphore = cls._semaphore
+            await semaphore.acquire()
+            task = asyncio.create_task(cls._dispatch(batch))
+            cls._dispatches.add(task)
+            task.add_done_callback(lambda t: (cls._dispatches.discard(t), semaphore.release()))
+
+    @classmethod
+    async def _dispatch(cls, batch: list) -> None:
+        cls._counters["batches"] += 1
+        cls._counters["max_batch_size"] = max(cls._counters["max_batch_size"], len(batch))
+        try:
+            results = await AIClient.request_detection_batch([item for item, _ in batch])
+        except Exception as e:
+            cls._counters["failed_batches"] += 1
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_id = {result.get("image_id"): result for result in results}
+        for (_, image_id, _), future in batch:
+            if future.done():  # 호출자 요청 취소
+                continue
+            result = by_id.get(image_id)
+            if result is None or "error" in result:
+                reason = result["error"] if result else "missing result"
+                future.set_exception(DetectionBatchItemError(f"{image_id}: {reason}"))
+            else:
+                future.set_result(result)
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        batches = cls._counters["batches"]
+        return {
+            "enabled": settings.ai_detection_batch_enabled,
+            "running": cls._queue is not None,
+            "pending": cls._queue.qsize() if cls._queue is not None else 0,
+            "inflight_batches": len(cls._dispatches),
+            **cls._counters,
+            "avg_batch_size": round(cls._counters["requests"] / batches, 2) if batches else 0.0,
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        for key in cls._counters:
+            cls._counters[key] = 0
@@ -1,12 +1,27 @@
 import mimetypes
 import logging
+from typing import Any
+from urllib.parse import unquote, urlparse
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from fastapi.concurrency import run_in_threadpool
 from app.core.settings import settings
+from app.common.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
-# TODO: 추후 트래픽 증가시 upload_file 내부 로직에 run_in_threadpool 적용 고려 (Non-blocking I/O)
+MB = 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class S3ObjectTooLarge(Exception):
+    """
+    download_bytes 의 max_bytes 초과
+    """
+
+# boto3 호출은 동기(blocking) -> async 코드에서는 *_async 메서드 사용 (threadpool 실행)
 
 
 class S3Client:
@@ -14,6 +29,7 @@ class S3Client:
     AWS S3 Client (Static Interface)
     - 책임: S3 업로드/삭제 (인프라 계층)
     - 특징: MealImageService에서 static하게 호출 가능하도록 설계
+    - async 코드에서는 upload_file_async / delete_file_async / generate_presigned_url_async 사용
     """
 
     # Boto3 Client (Lazy loading or Module level)
@@ -23,10 +39,32 @@ class S3Client:
         _client_kwargs["aws_access_key_id"] = settings.aws_access_key_id
         _client_kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
 
-    _client = boto3.client("s3", **_client_kwargs)
+    # 동시 업로드(MealImageService) + multipart part 업로드가 커넥션 풀을 공유
+    _client = boto3.client(
+        "s3",
+        config=Config(max_pool_connections=settings.s3_max_pool_connections),
+        **_client_kwargs,
+    )
+    # multipart upload: threshold 이상 파일은 chunksize 단위 part 병렬 업로드
+    _transfer_config = TransferConfig(
+        multipart_threshold=settings.s3_multipart_threshold_mb * MB,
+        multipart_chunksize=settings.s3_multipart_chunksize_mb * MB,
+        max_concurrency=settings.s3_multipart_max_concurrency,
+    )
     _bucket = settings.s3_bucket_name
     _region = settings.aws_region
 
+    # presigned url 캐시: object key -> url (event loop 에서만 접근)
+    # 만료 refresh_margin 전까지 재사용 -> 응답받은 url 은 최소 margin 만큼 유효
+    _presigned_cache = TTLCache(
+        maxsize=settings.s3_presigned_cache_maxsize,
+        ttl_sec=max(
+            settings.s3_presigned_expire_sec - settings.s3_presigned_refresh_margin_sec,
+            0,
+        ),
+    )
+    _presign_counters = {"generated": 0, "reused": 0, "failed": 0}
+
     @classmethod
     def _generate_s3_url(cls, object_name: str) -> str:
         return f"https://{cls._bucket}.s3.{cls._region}.amazonaws.com/{object_name}"
@@ -48,6 +86,7 @@ class S3Client:
                 Bucket=cls._bucket,
                 Key=object_name,
                 ExtraArgs=extra_args,
+                Config=cls._transfer_config,
             )
         except ClientError as e:
             logger.error(f"S3 upload failed: {e}")
@@ -55,6 +94,13 @@ class S3Client:
 
         return cls._generate_s3_url(object_name)
 
+    @classmethod
+    async def upload_file_async(cls, file_path: str, object_name: str) -> str:
+        """
+        upload_file 의 non-blocking 버전 (threadpool 실행)
+        """
+        return await run_in_threadpool(cls.upload_file, file_path, object_name)
+
     @staticmethod
     def delete_file(object_name: str):
         """
@@ -68,9 +114,147 @@ class S3Client:
             # 필요 시 raise
             pass
 
+    @classmethod
+    async def delete_file_async(cls, object_name: str) -> None:
+        await run_in_threadpool(cls.delete_file, object_name)
+
+    # --- direct upload (client -> S3 presigned POST) ---
+    @classmethod
+    def generate_presigned_post(
+        cls, object_name: str, content_type: str, max_bytes: int, expiration: int
+    ) -> dict[str, Any]:
+        """
+        클라이언트가 S3에 직접 업로드할 presigned POST 생성
+        - policy 로 key / Content-Type / 최대 크기 고정 (S3가 검증)
+        :return: {"url": ..., "fields": {...}} (form fields + file 로 POST)
+        """
+        try:
+            return cls._client.generate_presigned_post(
+                Bucket=cls._bucket,
+                Key=object_name,
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    {"Content-Type": content_type},
+                    ["content-length-range", 1, max_bytes],
+                ],
+                ExpiresIn=expiration,
+            )
+        except ClientError as e:
+            logger.error(f"S3 presigned post generation failed: {e}")
+            raise Exception(f"S3 Presign Error: {str(e)}")
+
+    @classmethod
+    def head_object(cls, object_name: str) -> dict[str, Any] | None:
+        """
+        객체 메타데이터 조회 (없으면 None)
+        """
+        try:
+            return cls._client.head_object(Bucket=cls._bucket, Key=object_name)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return None
+            logger.error(f"S3 head failed: {e}")
+            raise Exception(f"S3 Head Error: {str(e)}")
+
+    @classmethod
+    def download_bytes(
+        cls, object_name: str, max_bytes: int | None = None
+    ) -> tuple[bytes, str] | None:
+        """
+        객체 다운로드 (없으면 None)
+        - max_bytes 지정시 chunk 단위로 읽다가 초과하면 S3ObjectTooLarge (전체를 메모리에 올리지 않음)
+        :return: (bytes, content_type)
+        """
+        try:
+            response = cls._client.get_object(Bucket=cls._bucket, Key=object_name)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return None
+            logger.error(f"S3 download failed: {e}")
+            raise Exception(f"S3 Download Error: {str(e)}")
+        content_type = response.get("ContentType", "image/jpeg")
+        with response["Body"] as body:
+            if max_bytes is None:
+                return body.read(), content_type
+            if response.get("ContentLength", 0) > max_bytes:
+                raise S3ObjectTooLarge(object_name)
+            chunks, total = [], 0
+            while chunk := body.read(DOWNLOAD_CHUNK_SIZE):
+                total += len(chunk)
+                if total > max_bytes:
+                    raise S3ObjectTooLarge(object_name)
+                chunks.append(chunk)
+        return b"".join(chunks), content_type
+
+    @classmethod
+    def read_header(cls, object_name: str, size: int) -> bytes | None:
+        """
+        객체 앞부분 size bytes 만 조회 (Range GET, 없으면 None)
+        - magic bytes 포맷 판별용
+        """
+        try:
+            response = cls._client.get_object(
+                Bucket=cls._bucket, Key=object_name, Range=f"bytes=0-{size - 1}"
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return None
+            logger.error(f"S3 range download failed: {e}")
+            raise Exception(f"S3 Download Error: {str(e)}")
+        with response["Body"] as body:
+            return body.read(size)
+
+    @classmethod
+    def copy_object(cls, source_name: str, object_name: str) -> str | None:
+        """
+        버킷 내 server-side copy (데이터가 API 서버를 거치지 않음)
+        :return: 복사된 객체 S3 URL (원본 없으면 None)
+        """
+        try:
+            cls._client.copy_object(
+                Bucket=cls._bucket,
+                Key=object_name,
+                CopySource={"Bucket": cls._bucket, "Key": source_name},
+                MetadataDirective="COPY",
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return None
+            logger.error(f"S3 copy failed: {e}")
+            raise Exception(f"S3 Copy Error: {str(e)}")
+        return cls._generate_s3_url(object_name)
+
+    @classmethod
+    async def generate_presigned_post_async(
+        cls, object_name: str, content_type: str, max_bytes: int, expiration: int
+    ) -> dict[str, Any]:
+        return await run_in_threadpool(
+            cls.generate_presigned_post, object_name, content_type, max_bytes, expiration
+        )
+
+    @classmethod
+    async def head_object_async(cls, object_name: str) -> dict[str, Any] | None:
+        return await run_in_threadpool(cls.head_object, object_name)
+
+    @classmethod
+    async def download_bytes_async(
+        cls, object_name: str, max_bytes: int | None = None
+    ) -> tuple[bytes, str] | None:
+        return await run_in_threadpool(cls.download_bytes, object_name, max_bytes)
+
+    @classmethod
+    async def read_header_async(cls, object_name: str, size: int) -> bytes | None:
+        return await run_in_threadpool(cls.read_header, object_name, size)
+
+    @classmethod
+    async def copy_object_async(cls, source_name: str, object_name: str) -> str | None:
+        return await run_in_threadpool(cls.copy_object, source_name, object_name)
+
     # presigned url 생성(S3요청 boto3)
     @classmethod
-    def generate_presigned_url(cls, object_name: str, expiration: int = 3600) -> str:
+    def generate_presigned_url(
+        cls, object_name: str, expiration: int = settings.s3_presigned_expire_sec
+    ) -> str:
         """
         Private S3 객체에 접근 가능한 Presigned URL 생성
         """
@@ -85,25 +269,106 @@ class S3Client:
             logger.error(f"S3 presigned url generation failed: {e}")
             return ""
 
+    @classmethod
+    async def generate_presigned_url_async(
+        cls, object_name: str, expiration: int = settings.s3_presigned_expire_sec
+    ) -> str:
+        return await run_in_threadpool(
+            cls.generate_presigned_url, object_name, expiration
+        )
+
+    @classmethod
+    def extract_object_key(cls, url: str) -> str | None:
+        """
+        저장된 URL에서 object key 추출
+        - virtual-hosted : https://{bucket}.s3.{region}.amazonaws.com/{key}
+        - path-style     : https://s3.{region}.amazonaws.com/{bucket}/{key}
+        - s3 uri         : s3://{bucket}/{key}
+        - key 그대로     : meals/{uuid}.jpg
+        """
+        parsed = urlparse(url)
+        path = unquote(parsed.path).lstrip("/")
+
+        if parsed.scheme in ("http", "https"):
+            if not parsed.netloc.startswith(f"{cls._bucket}.") and path.startswith(
+                f"{cls._bucket}/"
+            ):
+                path = path[len(cls._bucket) + 1 :]  # path-style: bucket 제거
+        elif parsed.scheme != "s3":
+            path = url.lstrip("/")
+
+        return path or None
+
+    @classmethod
+    def get_presigned_url(cls, object_name: str) -> str:
+        """
+        캐시된 presigned url 반환, 없거나 만료 임박시 새로 서명
+        서명 실패시 "" 반환 (캐시 x)
+        """
+        cached = cls._presigned_cache.get(object_name)
+        if cached is not None:
+            cls._presign_counters["reused"] += 1
+            return cached
+
+        signed_url = cls.generate_presigned_url(
+            object_name, settings.s3_presigned_expire_sec
+        )
+        if not signed_url:
+            cls._presign_counters["failed"] += 1
+            return ""
+
+        cls._presign_counters["generated"] += 1
+        cls._presigned_cache.set(object_name, signed_url)
+        return signed_url
+
+    # DB저장된 image_url들을 presigned url로 일괄 변환 (조회 페이지 단위)
+    @classmethod
+    def convert_to_presigned_urls(cls, original_urls: list[str]) -> list[str]:
+        """
+        URL 목록을 Presigned URL 목록으로 변환 (순서 유지)
+        - 같은 key 는 한 번만 서명 (캐시 공유)
+        - key 추출/서명 실패한 URL 은 원본 그대로 반환
+        """
+        signed_urls = []
+        for original_url in original_urls:
+            if not original_url:
+                signed_urls.append(original_url)
+                continue
+
+            key = cls.extract_object_key(original_url)
+            if not key:
+                logger.warning(f"Failed to extract S3 key from url: {original_url}")
+                signed_urls.append(original_url)
+                continue
+
+            signed_url = cls.get_presigned_url(key)
+            signed_urls.append(signed_url or original_url)
+        return signed_urls
+
     # DB저장된 image_url을 presigned url로 변환
     @classmethod
     def convert_to_presigned_url(cls, original_url: str) -> str:
         """
-        기존 Full URL을 파싱하여 Presigned URL로 변환
-        - Key 추출 로직 포함 (Infrastructure Responsibility)
+        기존 Full URL을 파싱하여 Presigned URL로 변환 (실패시 원본 반환)
         """
-        if not original_url:
-            return original_url
+        return cls.convert_to_presigned_urls([original_url])[0]
 
-        try:
-            # Extract Key from URL
-            # Assumption: URL ends with /ObjectKey (Simple logic for now)
-            # e.g., https://bucket.../meals/uuid.jpg -> meals/uuid.jpg
-            # TODO: 추후 URL 파싱 로직 강화 (urllib.parse 등 활용)
-            key = "/".join(original_url.split("/")[-2:])
-
-            signed_url = cls.generate_presigned_url(key)
-            return signed_url if signed_url else original_url
-        except Exception as e:
-            logger.warning(f"Failed to convert url: {original_url}, error: {e}")
-            return original_url
+    @classmethod
+    def presign_stats(cls) -> dict[str, Any]:
+        """
+        presigned url 서명 생성/재사용 현황 (프로세스 단위)
+        """
+        total = cls._presign_counters["generated"] + cls._presign_counters["reused"]
+        return {
+            **cls._presign_counters,
+            "reuse_ratio": round(cls._presign_counters["reused"] / total, 4)
+            if total
+            else 0.0,
+            "cache_size": len(cls._presigned_cache),
+        }
+
+    @classmethod
+    def reset_presign_cache(cls) -> None:
+        cls._presigned_cache.clear()
+        for key in cls._presign_counters:
+            cls._presign_counters[key] = 0
@@ -0,0 +1,78 @@
+"""
+daily_nutrient_rollups 관리 커맨드
+
+사용법:
+    python -m app.commands.nutrient_rollup backfill [--user-id 1]
+    python -m app.commands.nutrient_rollup check [--user-id 1]
+
+- backfill : 원본 meal_logs/meal_items 기준으로 유저별 집계 row 재생성
+- check    : 저장된 집계 row와 원본 재계산 결과 비교 (불일치 있으면 exit code 1)
+"""
+
+import argparse
+import asyncio
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=".env")
+
+from app.db.database import AsyncSessionLocal, async_engine
+from app.db.crud.user import UserCrud
+from app.services.nutrient_rollup import NutrientRollupService
+
+
+async def _target_user_ids(user_id: int | None) -> list[int]:
+    if user_id is not None:
+        return [user_id]
+    async with AsyncSessionLocal() as db:
+        users = await UserCrud.get_all_user(db)
+        return [user.id for user in users]
+
+
+async def backfill(user_id: int | None = None) -> None:
+    user_ids = await _target_user_ids(user_id)
+    total_rows = 0
+    for uid in user_ids:
+        # 유저 단위 트랜잭션 (중간 실패시 해당 유저만 rollback)
+        async with AsyncSessionLocal() as db:
+            rows = await NutrientRollupService.backfill_user(db, uid)
+        total_rows += rows
+        print(f"[backfill] user_id={uid} rows={rows}")
+    print(f"[backfill] done users={len(user_ids)} rows={total_rows}")
+
+
+async def check(user_id: int | None = None) -> int:
+    user_ids = await _target_user_ids(user_id)
+    mismatch_count = 0
+    for uid in user_ids:
+        async with AsyncSessionLocal() as db:
+            diffs = await NutrientRollupService.find_inconsistencies(db, uid)
+        for diff in diffs:
+            print(
+                f"[check] user_id={uid} day={diff['day']} {diff['column']}: "
+                f"stored={diff['stored']} expected={diff['expected']}"
+            )
+        mismatch_count += len(diffs)
+    print(f"[check] done users={len(user_ids)} mismatches={mismatch_count}")
+    return mismatch_count
+
+
+async def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.commands.nutrient_rollup")
+    parser.add_argument("command", choices=["backfill", "check"])
+    parser.add_argument("--user-id", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "backfill":
+            await backfill(args.user_id)
+            return 0
+        mismatches = await check(args.user_id)
+        return 1 if mismatches else 0
+    finally:
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
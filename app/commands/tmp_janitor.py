@@ -0,0 +1,43 @@
+"""
+고아 tmp 이미지 정리 one-shot 커맨드 (cron 배포용, app lifespan 주기 실행과 같은 로직)
+
+사용법:
+    python -m app.commands.tmp_janitor [--ttl-sec 86400] [--quota-mb 1024] [--dry-run]
+
+- TTL 초과 파일 삭제 후, 남은 용량이 quota 초과면 오래된 파일부터 삭제
+- --dry-run : 삭제 없이 대상 통계만 출력
+"""
+
+import argparse
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=".env")
+
+from app.services.tmp_janitor import TmpJanitor
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.commands.tmp_janitor")
+    parser.add_argument("--ttl-sec", type=float, default=None)
+    parser.add_argument("--quota-mb", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    stats = TmpJanitor.sweep(
+        ttl_sec=args.ttl_sec,
+        quota_bytes=args.quota_mb * 1024 * 1024 if args.quota_mb is not None else None,
+        dry_run=args.dry_run,
+    )
+    print(
+        f"[tmp_janitor] scanned={stats['scanned_files']} expired={stats['expired_files']} "
+        f"evicted={stats['evicted_files']} reclaimed_bytes={stats['reclaimed_bytes']} "
+        f"remaining={stats['remaining_files']} ({stats['remaining_bytes']}B) "
+        f"errors={stats['errors']} dry_run={stats['dry_run']} {stats['duration_ms']}ms"
+    )
+    return 1 if stats["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
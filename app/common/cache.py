@@ -0,0 +1,90 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+# in-process 캐시 유틸 (프로세스 단위, worker 간 공유 x)
+# - TTLCache   : LRU + TTL
+# - SingleFlight : 같은 key 동시 miss -> 1회만 실행, 나머지는 결과 공유
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    LRU + TTL 캐시 (asyncio 단일 스레드 사용 전제, lock x)
+    """
+
+    def __init__(self, maxsize: int, ttl_sec: float):
+        self.maxsize = maxsize
+        self.ttl_sec = ttl_sec
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)  # 최근 사용
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_sec: float | None = None) -> None:
+        ttl = self.ttl_sec if ttl_sec is None else ttl_sec
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)  # 가장 오래 사용 안 한 항목 제거
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class SingleFlight:
+    """
+    key별 진행중 작업 공유
+    - 첫 호출(leader)만 fn 실행, 동시 호출(follower)은 같은 결과/예외를 받음
+    - 작업은 별도 Task로 실행 -> 한 호출자가 취소되어도 나머지에 영향 x
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, bool]:
+        """
+        :return: (결과, shared) shared=True 이면 다른 호출의 결과를 공유받음
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        return await asyncio.shield(task), shared
+
+    def forget(self, key: Hashable) -> None:
+        """
+        진행중 작업을 공유 대상에서 제외 -> 다음 do() 는 새 작업 실행
+        (기존 작업은 취소하지 않음, 이미 기다리던 호출자는 그 결과를 받음)
+        """
+        self._inflight.pop(key, None)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        # forget() 후 새로 등록된 작업은 유지
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # 대기자가 모두 취소된 경우 "never retrieved" 경고 방지
@@ -0,0 +1,79 @@
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.core.settings import settings
+
+# 이미지 처리(PIL decode/resize/encode) 전용 실행기
+# - CPU 작업을 event loop 밖에서 실행 -> 다른 요청 블로킹 방지
+# - 대기+실행중 작업 수 제한 (IMAGE_EXECUTOR_MAX_PENDING), 초과시 ImageExecutorBusy -> 503
+# - main.py lifespan 에서 startup/shutdown
+
+
+class ImageExecutorBusy(Exception):
+    """이미지 처리 대기열 포화"""
+
+
+class ImageExecutor:
+    _executor: Executor | None = None
+    _mode: str | None = None  # None = 미시작
+    _pending: int = 0
+
+    @classmethod
+    def startup(cls, mode: str | None = None, workers: int | None = None) -> None:
+        if cls._mode is not None:
+            return
+        cls._mode = mode or settings.image_executor
+        workers = workers or settings.image_executor_workers
+
+        if cls._mode == "process":
+            # spawn: 부모 프로세스의 스레드/커넥션 상태를 복제하지 않음 (fork 안전성)
+            cls._executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        elif cls._mode == "thread":
+            cls._executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="image"
+            )
+        elif cls._mode != "inline":
+            mode, cls._mode = cls._mode, None
+            raise ValueError(f"Unknown IMAGE_EXECUTOR: {mode}")
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        대기중 작업 완료 후 worker 종료
+        """
+        executor, cls._executor, cls._mode = cls._executor, None, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @classmethod
+    def pending(cls) -> int:
+        return cls._pending
+
+    @classmethod
+    async def run(cls, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        fn(*args, **kwargs) 실행 (process 모드: fn/인자/결과 모두 pickle 가능해야 함)
+        :raises ImageExecutorBusy: 대기열 포화
+        """
+        if cls._pending >= settings.image_executor_max_pending:
+            raise ImageExecutorBusy(f"image executor saturated ({cls._pending} pending)")
+
+        # lifespan 밖(CLI, 단독 테스트)에서 호출되면 lazy 생성
+        if cls._mode is None:
+            cls.startup()
+
+        cls._pending += 1
+        try:
+            if cls._executor is None:
+                return fn(*args, **kwargs)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                cls._executor, functools.partial(fn, *args, **kwargs)
+            )
+        finally:
+            cls._pending -= 1
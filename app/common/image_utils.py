@@ -1,33 +1,149 @@
-from PIL import Image
+from PIL import Image, ImageOps
 import io
 
 # use TM's boilerplate
 # TODO: ai model input size 변경시 수정
+# ImageExecutor(process pool)에서 실행됨 -> settings 등 app 의존성 import x, 설정값은 인자로 전달
+
+# EXIF Orientation 중 90/270도 회전 (가로/세로 뒤바뀜)
+_TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+# magic bytes 검사에 필요한 헤더 길이
+SNIFF_HEADER_SIZE = 12
+
+
+def sniff_image_format(header: bytes) -> str | None:
+    """
+    파일 앞부분(magic bytes)으로 이미지 포맷 판별 (확장자/Content-Type 신뢰 x)
+    :return: "JPEG", "PNG", "WEBP" 또는 None (지원하지 않는 포맷)
+    """
+    if header.startswith(b"\xff\xd8\xff"):
+        return "JPEG"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "PNG"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "WEBP"
+    return None
 
 
 def resize_image(
-    image_bytes: bytes, size: tuple = (640, 640), format: str = "JPEG"
+    image_bytes: bytes | str,
+    size: tuple = (640, 640),
+    format: str = "JPEG",
+    fast: bool = False,
+    resample: str = "lanczos",
+    quality: int = 85,
+    reducing_gap: float | None = 3.0,
 ) -> bytes:
     """
     AI 모델 입력을 위해 이미지를 리사이징합니다.
     지정된 포맷의 바이트를 반환합니다.
+    :param image_bytes: 이미지 bytes 또는 파일 경로 (대용량 업로드는 디스크 spool 경로 전달)
+    :param fast: fast path 사용 (JPEG draft 디코딩 + reducing_gap, EXIF 회전 반영, 동일 크기/포맷 재인코딩 생략)
+    :param resample: 리샘플링 필터 이름 (nearest, bilinear, bicubic, lanczos ...)
+    :param quality: JPEG 저장 품질
+    :param reducing_gap: fast path 전용, 정수배 축소(reduce) 후 리샘플링 (None이면 미사용)
     """
+    if fast:
+        return _resize_image_fast(image_bytes, size, format, resample, quality, reducing_gap)
+
     try:
-        image = Image.open(io.BytesIO(image_bytes))
+        image = Image.open(_as_file(image_bytes))
 
         # RGB로 변환 (채널 표준화 - AI 모델 입력용)
         if image.mode != "RGB":
             image = image.convert("RGB")
 
         # 고품질 리샘플링을 사용하여 리사이즈
-        image = image.resize(size, Image.Resampling.LANCZOS)
+        image = image.resize(size, _resample_filter(resample))
 
         # 버퍼에 저장
         buffer = io.BytesIO()
-        image.save(buffer, format=format, quality=85)  # TODO
+        image.save(buffer, format=format, quality=quality)
         buffer.seek(0)
 
         return buffer.getvalue()
     except Exception as e:
         # 리사이징 실패 시 로그를 남기거나 다시 발생시킵니다. 현재는 다시 발생시킵니다.
         raise ValueError(f"이미지 처리 실패: {str(e)}")
+
+
+def _resize_image_fast(
+    image_bytes: bytes | str,
+    size: tuple,
+    format: str,
+    resample: str,
+    quality: int,
+    reducing_gap: float | None,
+) -> bytes:
+    try:
+        image = Image.open(_as_file(image_bytes))
+        orientation = image.getexif().get(0x0112, 1)  # EXIF Orientation
+
+        # 이미 목표 크기/포맷/RGB + 회전 불필요 -> 원본 그대로 (디코딩/재인코딩 생략)
+        if (
+            image.size == tuple(size)
+            and image.format == format.upper()
+            and image.mode == "RGB"
+            and orientation == 1
+        ):
+            if isinstance(image_bytes, str):
+                with open(image_bytes, "rb") as f:
+                    return f.read()
+            return image_bytes
+
+        # JPEG: DCT scaling 으로 목표 크기 이상 중 가장 작은 1/2, 1/4, 1/8 크기로 디코딩
+        # (회전될 이미지는 회전 전 기준으로 가로/세로 뒤바꿔 요청)
+        if image.format == "JPEG":
+            draft_size = size[::-1] if orientation in _TRANSPOSED_ORIENTATIONS else size
+            image.draft("RGB", tuple(draft_size))
+
+        # EXIF 회전 반영 (휴대폰 세로 사진)
+        image = ImageOps.exif_transpose(image)
+
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        # reducing_gap: 정수배 box 축소 후 남은 배율만 리샘플링 (대형 이미지 비용 감소)
+        image = image.resize(
+            tuple(size), _resample_filter(resample), reducing_gap=reducing_gap
+        )
+
+        buffer = io.BytesIO()
+        image.save(buffer, format=format, quality=quality)
+        return buffer.getvalue()
+    except Exception as e:
+        raise ValueError(f"이미지 처리 실패: {str(e)}")
+
+
+def perceptual_hash(image_bytes: bytes, hash_size: int = 8) -> str:
+    """
+    dHash (difference hash): 흑백 (hash_size+1)x(hash_size) 축소 후 좌우 밝기 비교 비트열
+    재인코딩/미세한 화질 차이에도 같은 값 -> 같은 사진 재업로드 판별용
+    :return: hex 문자열 (hash_size=8 -> 64bit, 16자)
+    """
+    try:
+        image = Image.open(io.BytesIO(image_bytes)).convert("L")
+        image = image.resize((hash_size + 1, hash_size), Image.Resampling.BILINEAR)
+    except Exception as e:
+        raise ValueError(f"이미지 처리 실패: {str(e)}")
+
+    pixels = image.tobytes()
+    bits = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return f"{bits:0{hash_size * hash_size // 4}x}"
+
+
+def _resample_filter(name: str) -> Image.Resampling:
+    try:
+        return Image.Resampling[name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown resample filter: {name}")
+
+
+def _as_file(image_bytes: bytes | str):
+    # bytes -> 메모리 버퍼, str -> 파일 경로 그대로 (Image.open 이 직접 읽음)
+    return image_bytes if isinstance(image_bytes, str) else io.BytesIO(image_bytes)
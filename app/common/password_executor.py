@@ -0,0 +1,71 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.core.settings import settings
+
+# 비밀번호 해시/검증(bcrypt) 전용 실행기
+# - bcrypt 는 의도적으로 느린 CPU 작업(cost 12 기준 ~200ms) -> event loop 에서 실행시 worker 전체 정지
+# - bcrypt 는 해시 계산 중 GIL 해제 -> thread pool 로 충분 (process pool 불필요)
+# - 대기+실행중 작업 수 제한 (PASSWORD_HASH_MAX_PENDING), 초과시 PasswordExecutorBusy -> 503
+# - main.py lifespan 에서 startup/shutdown
+
+
+class PasswordExecutorBusy(Exception):
+    """비밀번호 처리 대기열 포화"""
+
+
+class PasswordExecutor:
+    _executor: ThreadPoolExecutor | None = None
+    _mode: str | None = None  # None = 미시작
+    _pending: int = 0
+
+    @classmethod
+    def startup(cls, mode: str = "thread", workers: int | None = None) -> None:
+        """
+        :param mode: "thread" 또는 "inline" (event loop 에서 직접 실행, 벤치마크 비교용)
+        """
+        if cls._mode is not None:
+            return
+        if mode not in ("thread", "inline"):
+            raise ValueError(f"Unknown password executor mode: {mode}")
+        cls._mode = mode
+        if mode == "thread":
+            cls._executor = ThreadPoolExecutor(
+                max_workers=workers or settings.password_hash_workers,
+                thread_name_prefix="bcrypt",
+            )
+
+    @classmethod
+    def shutdown(cls) -> None:
+        executor, cls._executor, cls._mode = cls._executor, None, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @classmethod
+    def pending(cls) -> int:
+        return cls._pending
+
+    @classmethod
+    async def run(cls, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        :raises PasswordExecutorBusy: 대기열 포화
+        """
+        if cls._pending >= settings.password_hash_max_pending:
+            raise PasswordExecutorBusy(f"password executor saturated ({cls._pending} pending)")
+
+        # lifespan 밖(CLI, 단독 테스트)에서 호출되면 lazy 생성
+        if cls._mode is None:
+            cls.startup()
+
+        cls._pending += 1
+        try:
+            if cls._executor is None:
+                return fn(*args, **kwargs)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                cls._executor, functools.partial(fn, *args, **kwargs)
+            )
+        finally:
+            cls._pending -= 1
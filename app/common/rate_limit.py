@@ -0,0 +1,203 @@
+import time
+from typing import Any, Protocol
+
+from fastapi import HTTPException, Request, status
+
+from app.common.cache import TTLCache
+from app.core.settings import settings
+
+# 인증 엔드포인트 rate limit (token bucket)
+# - 키(계정/IP)별 bucket: capacity 만큼 연속 허용, 이후 period 동안 capacity 개 비율로 충전
+# - 초과시 429 + Retry-After, DB 조회/bcrypt 전에 검사 -> credential stuffing 이 CPU 소모로 이어지지 않음
+# - backend: memory(프로세스 단위, 기본) / redis(worker·인스턴스 간 공유, EVAL 1회로 원자적 처리)
+# - main.py lifespan 에서 startup/shutdown (미호출시 memory backend 로 lazy 시작)
+
+
+def parse_rate(rate: str) -> tuple[int, float]:
+    """
+    "5/60" -> (capacity 5, period 60초)
+    """
+    capacity, period = rate.split("/")
+    return int(capacity), float(period)
+
+
+class RateLimitBackend(Protocol):
+    async def hit(self, key: str, capacity: int, period_sec: float) -> float:
+        """
+        토큰 1개 소비
+        :return: 0 이면 허용, 아니면 다음 토큰까지 대기 초
+        """
+        ...
+
+
+class MemoryRateLimitBackend:
+    """
+    프로세스 내 token bucket (key -> (tokens, updated_at))
+    가득 찬 bucket 과 같은 상태가 되는 시점(period) 후 만료 -> 키 수 bounded
+    """
+
+    def __init__(self, maxsize: int, clock=time.monotonic):
+        self._buckets = TTLCache(maxsize, ttl_sec=60.0)
+        self._clock = clock
+
+    async def hit(self, key: str, capacity: int, period_sec: float) -> float:
+        now = self._clock()
+        rate = capacity / period_sec
+        tokens, updated_at = self._buckets.get(key, (float(capacity), now))
+        tokens = min(float(capacity), tokens + (now - updated_at) * rate)
+
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / rate
+        self._buckets.set(key, (tokens, now), ttl_sec=period_sec)
+        return retry_after
+
+
+# KEYS[1]=bucket key, ARGV=capacity, period_sec -> 대기 초 (문자열, Lua number -> 정수 변환 방지)
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local rate = capacity / period
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local retry = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(period) + 1)
+return tostring(retry)
+"""
+
+
+class RedisRateLimitBackend:
+    """
+    Redis token bucket (redis.asyncio 호환 client: async eval 만 사용)
+    """
+
+    def __init__(self, client: Any, prefix: str = "ratelimit:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def hit(self, key: str, capacity: int, period_sec: float) -> float:
+        retry_after = await self.client.eval(
+            _TOKEN_BUCKET_LUA, 1, self.prefix + key, capacity, period_sec
+        )
+        if isinstance(retry_after, bytes):
+            retry_after = retry_after.decode()
+        return float(retry_after)
+
+
+class RateLimiter:
+    _backend: RateLimitBackend | None = None
+    _counters = {"allowed": 0, "limited": 0, "backend_errors": 0}
+
+    # --lifecycle-- main.py lifespan에서 호출
+    @classmethod
+    def startup(cls, backend: RateLimitBackend | None = None) -> None:
+        """
+        :param backend: 테스트/벤치마크용 backend 주입 (None 이면 RATE_LIMIT_BACKEND 설정)
+        """
+        if cls._backend is not None:
+            return
+        if backend is not None:
+            cls._backend = backend
+        elif settings.rate_limit_backend == "redis":
+            import redis.asyncio as redis  # optional dependency (pip install redis)
+
+            cls._backend = RedisRateLimitBackend(redis.from_url(settings.rate_limit_redis_url))
+        elif settings.rate_limit_backend == "memory":
+            cls._backend = MemoryRateLimitBackend(settings.rate_limit_max_keys)
+        else:
+            raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {settings.rate_limit_backend}")
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        backend, cls._backend = cls._backend, None
+        client = getattr(backend, "client", None)
+        if client is not None and hasattr(client, "aclose"):
+            await client.aclose()
+
+    @classmethod
+    async def enforce(cls, *limits: tuple[str, str]) -> None:
+        """
+        (key, rate) 순서대로 검사, 하나라도 초과시 429
+        :param limits: ("login:ip:1.2.3.4", "20/60") ...
+        :raises HTTPException: 429 + Retry-After
+        """
+        if not settings.rate_limit_enabled:
+            return
+        # lifespan 밖(CLI, 단독 테스트)에서 호출되면 lazy 생성
+        if cls._backend is None:
+            cls.startup()
+
+        for key, rate in limits:
+            capacity, period_sec = parse_rate(rate)
+            try:
+                retry_after = await cls._backend.hit(key, capacity, period_sec)
+            except Exception as e:
+                # backend(redis) 장애시 인증 자체를 막지 않음 (fail-open)
+                cls._counters["backend_errors"] += 1
+                print(f"[RateLimit Error] {key}: {e}")
+                continue
+            if retry_after > 0:
+                cls._counters["limited"] += 1
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many requests. Please retry later.",
+                    headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+                )
+        cls._counters["allowed"] += 1
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        return {
+            "enabled": settings.rate_limit_enabled,
+            "backend": type(cls._backend).__name__ if cls._backend else None,
+            **cls._counters,
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._backend = None
+        for key in cls._counters:
+            cls._counters[key] = 0
+
+
+def client_ip(request: Request) -> str:
+    """
+    rate limit 키용 클라이언트 IP
+    - 신뢰 프록시 N 개(RATE_LIMIT_TRUSTED_PROXIES) 뒤: X-Forwarded-For 오른쪽에서 N 번째 항목
+      (각 프록시가 직전 peer 주소를 오른쪽에 추가 -> 그보다 왼쪽은 클라이언트 위조 가능)
+    - 헤더 없음 / N=0: 연결 peer 주소
+    """
+    hops = settings.rate_limit_trusted_proxies
+    forwarded = request.headers.get("x-forwarded-for") if hops > 0 else None
+    if forwarded:
+        entries = [entry.strip() for entry in forwarded.split(",") if entry.strip()]
+        if entries:
+            # 항목 수 < N: 모두 신뢰 프록시가 추가한 값 -> 가장 먼 프록시가 본 주소
+            return entries[-hops] if len(entries) >= hops else entries[0]
+    return request.client.host if request.client else "unknown"
+
+
+def limit_by_ip(scope: str, rate_setting: str):
+    """
+    IP 기준 rate limit dependency (라우트 dependencies=[...] 에 등록 -> 본문/DB 처리 전 실행)
+    :param rate_setting: settings 필드명 (요청시점 값 사용)
+    """
+
+    async def dependency(request: Request) -> None:
+        await RateLimiter.enforce(
+            (f"{scope}:ip:{client_ip(request)}", getattr(settings, rate_setting))
+        )
+
+    return dependency
@@ -0,0 +1,37 @@
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from app.core.settings import settings
+
+# 날짜 <-> timestamptz 변환 유틸
+# "하루"의 기준은 서비스 타임존(APP_TIMEZONE)
+# DB 필터는 cast(eaten_at, Date) 대신 half-open 범위 [start, end) 사용 -> (user_id, eaten_at) 인덱스 사용 가능
+
+
+def app_tz() -> ZoneInfo:
+    return ZoneInfo(settings.app_timezone)
+
+
+def local_date(dt: datetime) -> date:
+    """
+    datetime -> 서비스 타임존 기준 날짜 (naive datetime은 그대로 날짜 사용)
+    """
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(app_tz())
+    return dt.date()
+
+
+def local_today() -> date:
+    return datetime.now(app_tz()).date()
+
+
+def day_range(start_date: date, end_date: date | None = None) -> tuple[datetime, datetime]:
+    """
+    [start_date 00:00, end_date 다음날 00:00) 서비스 타임존 기준 aware datetime 범위
+    :param end_date: 없으면 start_date 하루
+    """
+    end_date = end_date or start_date
+    tz = app_tz()
+    start = datetime.combine(start_date, time.min, tzinfo=tz)
+    end = datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=tz)
+    return start, end
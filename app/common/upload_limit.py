@@ -0,0 +1,35 @@
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# 업로드 요청 크기 조기 차단 (multipart 파싱/spool 전에 Content-Length 로 413)
+# Content-Length 없는 chunked 요청은 FileManager.spool_upload 청크 읽기에서 제한
+
+# multipart boundary / part header 여유분
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """
+    지정 경로 POST 요청의 Content-Length 가 max_bytes 초과시 body 를 읽지 않고 413 반환
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int, paths: tuple[str, ...]):
+        self.app = app
+        self.max_bytes = max_bytes + MULTIPART_OVERHEAD_BYTES
+        self.paths = paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["method"] == "POST"
+            and scope["path"] in self.paths
+        ):
+            content_length = dict(scope["headers"]).get(b"content-length", b"")
+            if content_length.isdigit() and int(content_length) > self.max_bytes:
+                response = JSONResponse(
+                    {"detail": "Request body too large"}, status_code=413
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
@@ -1,8 +1,13 @@
+from dataclasses import dataclass
+from datetime import datetime
+
 from fastapi import Request, Response, HTTPException, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.cache import TTLCache
 from app.db.crud.user import UserCrud
 from app.db.database import get_db
+from app.db.models.user import User
 from app.core.settings import settings
 from app.core.jwt_context import verify_token
 import jwt
@@ -61,14 +66,65 @@ async def get_user_id(request: Request) -> int:
     return user_id
 
 
+# 인증된 유저 정보 (세션 분리된 읽기 전용 객체, password 미포함)
+# UserRead 응답 변환 가능 (from_attributes), 수정/비밀번호 확인은 service 에서 DB 조회
+@dataclass(frozen=True)
+class CurrentUser:
+    id: int
+    email: str
+    username: str
+    nickname: str | None
+    created_at: datetime
+    phone: str | None
+    is_active: bool
+    email_verified: bool | None
+
+    @classmethod
+    def from_user(cls, user: User) -> "CurrentUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            nickname=user.nickname,
+            created_at=user.created_at,
+            phone=user.phone,
+            is_active=user.is_active,
+            email_verified=user.email_verified,
+        )
+
+
+# user_id -> CurrentUser 캐시 (인증 요청마다 users SELECT 생략)
+# 정보 변경/탈퇴시 invalidate_current_user 호출 (프로세스 단위 -> 다른 worker 는 TTL 만료까지 이전 값)
+_current_user_cache = TTLCache(
+    settings.auth_user_cache_maxsize, settings.auth_user_cache_ttl_sec
+)
+
+
+def invalidate_current_user(user_id: int) -> None:
+    _current_user_cache.delete(user_id)
+
+
+def clear_current_user_cache() -> None:
+    _current_user_cache.clear()
+
+
 # 로그인한 유저확인(본인 정보확인용도)
-async def get_current_user(request: Request, db: AsyncSession = Depends(get_db)):
+async def get_current_user(
+    request: Request, db: AsyncSession = Depends(get_db)
+) -> CurrentUser:
     user_id = await get_user_id(request)
 
+    cached = _current_user_cache.get(user_id)
+    if cached is not None:
+        return cached
+
     # db조회
-    current_user = await UserCrud.get_user_by_id(db, user_id)
-    if not current_user:
+    user = await UserCrud.get_user_by_id(db, user_id)
+    if not user:
         raise HTTPException(status_code=404, detail="유저 없음")
+    current_user = CurrentUser.from_user(user)
+    if settings.auth_user_cache_ttl_sec > 0:
+        _current_user_cache.set(user_id, current_user)
     return current_user
 
     # jwt 검증
@@ -5,14 +5,15 @@ from jwt import ExpiredSignatureError, InvalidTokenError
 from fastapi import HTTPException, status
 
 from app.core.settings import settings
+from app.common.password_executor import PasswordExecutor, PasswordExecutorBusy
 import uuid
 
 # 1) 비밀번호 해싱
-# 해시값 저장 async 필요x
-def get_pwd_hash(password: str) -> str:
+# CPU 작업(bcrypt) -> 요청 처리 중에는 async 버전 사용 (PasswordExecutor thread pool)
+def get_pwd_hash(password: str, rounds: int | None = None) -> str:
     # bcrypt.hashpw returns bytes, so decode -> str
     pwd_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds or settings.bcrypt_rounds)
     hashed_bytes = bcrypt.hashpw(pwd_bytes, salt)
     return hashed_bytes.decode('utf-8')
 
@@ -25,6 +26,34 @@ def verify_pwd(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(pwd_bytes, hashed_bytes)
 
 
+# 저장된 해시의 cost 가 현재 설정(BCRYPT_ROUNDS)과 다른지 -> 로그인 성공시 재해시
+# bcrypt 형식: $2b$<cost>$<salt+hash>
+def pwd_needs_rehash(hashed_password: str) -> bool:
+    try:
+        return int(hashed_password.split("$")[2]) != settings.bcrypt_rounds
+    except (IndexError, ValueError):
+        return False
+
+
+async def get_pwd_hash_async(password: str) -> str:
+    return await _run_pwd(get_pwd_hash, password)
+
+
+async def verify_pwd_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_pwd(verify_pwd, plain_password, hashed_password)
+
+
+async def _run_pwd(fn, *args):
+    try:
+        return await PasswordExecutor.run(fn, *args)
+    except PasswordExecutorBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many authentication requests. Please retry shortly.",
+            headers={"Retry-After": "1"},
+        )
+
+
 # --------------------------------
 
 
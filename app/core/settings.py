@@ -11,6 +11,18 @@ class Settings(BaseSettings):
     db_port: str = Field("5432", alias="DB_PORT")  # postgresql port=5432
     db_name: str = Field(..., alias="DB_NAME")  # caloreat
 
+    # DB 커넥션 풀 (요청당 세션 1개 -> 동시 요청 수 > pool_size + max_overflow 이면 checkout 대기)
+    # pool_timeout 초과시 503 / 연결 상태는 GET /logs/db-pool
+    db_pool_size: int = Field(10, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout_sec: float = Field(5.0, alias="DB_POOL_TIMEOUT_SEC")
+    db_pool_recycle_sec: int = Field(1800, alias="DB_POOL_RECYCLE_SEC")  # -1 이면 미사용
+    db_pool_pre_ping: bool = Field(True, alias="DB_POOL_PRE_PING")  # checkout 시 끊긴 연결 감지
+    # asyncpg prepared statement cache (연결당), pgbouncer transaction mode 사용시 0
+    db_statement_cache_size: int = Field(100, alias="DB_STATEMENT_CACHE_SIZE")
+    db_statement_timeout_ms: int = Field(30000, alias="DB_STATEMENT_TIMEOUT_MS")  # 0 이면 미사용
+    db_application_name: str = Field("caloreat-api", alias="DB_APPLICATION_NAME")  # pg_stat_activity 식별
+
     # JWT settings
     secret_key: str = Field(..., alias="SECRET_KEY")
     jwt_algo: str = Field("HS256", alias="JWT_ALGORITHM")
@@ -46,6 +58,34 @@ class Settings(BaseSettings):
     def refresh_token_expire(self) -> timedelta:
         return timedelta(seconds=self.refresh_token_expire_sec)
 
+    # 비밀번호 해시: bcrypt cost (변경시 기존 해시는 로그인 성공할 때 재해시)
+    # 해시/검증은 전용 thread pool 에서 실행, 대기+실행중 작업 수 초과시 503
+    bcrypt_rounds: int = Field(12, alias="BCRYPT_ROUNDS")
+    password_hash_workers: int = Field(4, alias="PASSWORD_HASH_WORKERS")
+    password_hash_max_pending: int = Field(32, alias="PASSWORD_HASH_MAX_PENDING")
+
+    # 인증 엔드포인트 rate limit (token bucket, "허용수/초" -> 초과시 429)
+    # backend: memory(프로세스 단위) / redis(worker 간 공유, pip install redis 필요)
+    rate_limit_enabled: bool = Field(True, alias="RATE_LIMIT_ENABLED")
+    rate_limit_backend: str = Field("memory", alias="RATE_LIMIT_BACKEND")
+    rate_limit_redis_url: str = Field("redis://localhost:6379/0", alias="RATE_LIMIT_REDIS_URL")
+    rate_limit_max_keys: int = Field(100000, alias="RATE_LIMIT_MAX_KEYS")  # memory backend
+    # X-Forwarded-For 를 추가하는 신뢰 프록시 수 (AWS ALB 뒤 배포 = 1, 프록시 없이 직접 노출 = 0)
+    # 오른쪽에서 N 번째 항목을 클라이언트 IP 로 사용 (왼쪽 항목은 클라이언트가 임의로 넣을 수 있음)
+    rate_limit_trusted_proxies: int = Field(1, alias="RATE_LIMIT_TRUSTED_PROXIES")
+    rate_limit_login_account: str = Field("5/60", alias="RATE_LIMIT_LOGIN_ACCOUNT")
+    rate_limit_login_ip: str = Field("20/60", alias="RATE_LIMIT_LOGIN_IP")
+    rate_limit_signup_ip: str = Field("5/60", alias="RATE_LIMIT_SIGNUP_IP")
+    rate_limit_check_ip: str = Field("30/60", alias="RATE_LIMIT_CHECK_IP")
+
+    # get_current_user 유저 캐시 (TTL 0 이면 미사용, 매 요청 DB 조회)
+    auth_user_cache_ttl_sec: float = Field(30.0, alias="AUTH_USER_CACHE_TTL_SEC")
+    auth_user_cache_maxsize: int = Field(10000, alias="AUTH_USER_CACHE_MAXSIZE")
+
+    # 날짜 집계 기준 타임존 (일간/주간/월간 통계, 일별 rollup)
+    # 변경시 rollup backfill 필요: python -m app.commands.nutrient_rollup backfill
+    app_timezone: str = Field("UTC", alias="APP_TIMEZONE")
+
     # AI Service URL
     ai_service_url: str = Field(..., alias="AI_SERVICE_URL")
 
@@ -64,11 +104,111 @@ class Settings(BaseSettings):
         return f"{base}/{path}"
         # return f"{base}/api/llm/{version}/{path}"
 
+    # AI 서버 HTTP client (app lifespan 동안 공유, 커넥션 풀 재사용)
+    ai_http_max_connections: int = Field(100, alias="AI_HTTP_MAX_CONNECTIONS")
+    ai_http_max_keepalive: int = Field(20, alias="AI_HTTP_MAX_KEEPALIVE")
+    ai_http_keepalive_expiry: float = Field(30.0, alias="AI_HTTP_KEEPALIVE_EXPIRY")
+    ai_http2: bool = Field(True, alias="AI_HTTP2")  # h2 설치 + https 일때만 적용
+    ai_connect_timeout: float = Field(5.0, alias="AI_CONNECT_TIMEOUT")
+    ai_detection_read_timeout: float = Field(30.0, alias="AI_DETECTION_READ_TIMEOUT")
+    ai_llm_read_timeout: float = Field(30.0, alias="AI_LLM_READ_TIMEOUT")
+    ai_shutdown_grace_sec: float = Field(10.0, alias="AI_SHUTDOWN_GRACE_SEC")
+
+    # AI 엔드포인트별 circuit breaker: 최근 N건 중 실패율/지연율 임계치 초과시 open (즉시 503)
+    ai_breaker_enabled: bool = Field(True, alias="AI_BREAKER_ENABLED")
+    ai_breaker_window_size: int = Field(20, alias="AI_BREAKER_WINDOW_SIZE")
+    ai_breaker_min_calls: int = Field(10, alias="AI_BREAKER_MIN_CALLS")  # 판정 최소 호출 수
+    ai_breaker_failure_rate: float = Field(0.5, alias="AI_BREAKER_FAILURE_RATE")
+    ai_breaker_slow_call_sec: float = Field(10.0, alias="AI_BREAKER_SLOW_CALL_SEC")
+    ai_breaker_slow_call_rate: float = Field(0.8, alias="AI_BREAKER_SLOW_CALL_RATE")
+    ai_breaker_open_sec: float = Field(30.0, alias="AI_BREAKER_OPEN_SEC")  # open 유지 후 half-open
+    ai_breaker_half_open_calls: int = Field(2, alias="AI_BREAKER_HALF_OPEN_CALLS")  # 시험 요청 수
+    ai_max_inflight_per_endpoint: int = Field(32, alias="AI_MAX_INFLIGHT_PER_ENDPOINT")  # 초과시 503
+
+    # 감지 요청 micro-batching: 최대 N장 / M ms 까지 모아 analyze-batch 1회 요청 (AI 서버 배치 지원 필요)
+    ai_detection_batch_enabled: bool = Field(False, alias="AI_DETECTION_BATCH_ENABLED")
+    ai_detection_batch_max_size: int = Field(8, alias="AI_DETECTION_BATCH_MAX_SIZE")
+    ai_detection_batch_max_wait_ms: float = Field(10.0, alias="AI_DETECTION_BATCH_MAX_WAIT_MS")
+    ai_detection_batch_max_concurrency: int = Field(4, alias="AI_DETECTION_BATCH_MAX_CONCURRENCY")
+
+    # 음식 영양소 캐시 (in-process LRU -> foods 테이블 -> LLM)
+    food_cache_maxsize: int = Field(2048, alias="FOOD_CACHE_MAXSIZE")
+    food_cache_ttl_sec: float = Field(3600.0, alias="FOOD_CACHE_TTL_SEC")
+
+    # 다중 음식 영양소 분석 (/meals/analyze)
+    analysis_concurrency: int = Field(4, alias="ANALYSIS_CONCURRENCY")  # 요청당 동시 LLM 호출 수
+    analysis_item_timeout_sec: float = Field(20.0, alias="ANALYSIS_ITEM_TIMEOUT_SEC")  # 시도 1회 기준
+    analysis_max_retries: int = Field(2, alias="ANALYSIS_MAX_RETRIES")  # 5xx/timeout 재시도 횟수
+    analysis_retry_base_sec: float = Field(0.2, alias="ANALYSIS_RETRY_BASE_SEC")
+
+    # 이미지 디코딩/리사이즈 실행기 (event loop 블로킹 방지)
+    # process: CPU 코어 활용 (GIL 영향 x) / thread: 가벼운 오프로딩 / inline: event loop 에서 직접 실행
+    image_executor: str = Field("process", alias="IMAGE_EXECUTOR")
+    image_executor_workers: int = Field(2, alias="IMAGE_EXECUTOR_WORKERS")
+    image_executor_max_pending: int = Field(32, alias="IMAGE_EXECUTOR_MAX_PENDING")  # 초과시 503
+
+    # 이미지 업로드 (/meals/upload): 청크 단위 읽기, 최대 크기 초과시 413
+    upload_max_mb: int = Field(10, alias="UPLOAD_MAX_MB")
+    upload_spool_threshold_kb: int = Field(1024, alias="UPLOAD_SPOOL_THRESHOLD_KB")  # 초과시 디스크 spool
+    upload_chunk_kb: int = Field(64, alias="UPLOAD_CHUNK_KB")
+
+    # 비동기 감지 job (POST /meals/upload/jobs): 백그라운드 worker 수 / 대기열 크기(초과시 503) / 결과 보관
+    detection_job_workers: int = Field(4, alias="DETECTION_JOB_WORKERS")
+    detection_job_max_queue: int = Field(100, alias="DETECTION_JOB_MAX_QUEUE")
+    detection_job_ttl_sec: float = Field(600.0, alias="DETECTION_JOB_TTL_SEC")
+    detection_job_maxsize: int = Field(10000, alias="DETECTION_JOB_MAXSIZE")
+    detection_job_sse_keepalive_sec: float = Field(15.0, alias="DETECTION_JOB_SSE_KEEPALIVE_SEC")
+
+    # PredictionLog 배치 저장: N건 / T ms 단위 bulk INSERT, 큐 포화시 최대 대기 후 drop
+    prediction_log_writer_enabled: bool = Field(True, alias="PREDICTION_LOG_WRITER_ENABLED")
+    prediction_log_batch_size: int = Field(100, alias="PREDICTION_LOG_BATCH_SIZE")
+    prediction_log_flush_ms: float = Field(200.0, alias="PREDICTION_LOG_FLUSH_MS")
+    prediction_log_max_queue: int = Field(10000, alias="PREDICTION_LOG_MAX_QUEUE")
+    prediction_log_enqueue_timeout_sec: float = Field(0.05, alias="PREDICTION_LOG_ENQUEUE_TIMEOUT_SEC")
+
+    # 같은 사진 재업로드 감지 결과 재사용 (fingerprint: 리사이즈 결과 sha256, 옵션 perceptual hash)
+    upload_dedup_enabled: bool = Field(True, alias="UPLOAD_DEDUP_ENABLED")
+    upload_dedup_window_sec: float = Field(600.0, alias="UPLOAD_DEDUP_WINDOW_SEC")
+    upload_dedup_maxsize: int = Field(4096, alias="UPLOAD_DEDUP_MAXSIZE")
+    upload_dedup_phash: bool = Field(False, alias="UPLOAD_DEDUP_PHASH")
+
+    # 고아 tmp 이미지 정리 (app.services.tmp_janitor)
+    tmp_janitor_enabled: bool = Field(True, alias="TMP_JANITOR_ENABLED")
+    tmp_janitor_interval_sec: float = Field(600.0, alias="TMP_JANITOR_INTERVAL_SEC")
+    tmp_image_ttl_sec: float = Field(86400.0, alias="TMP_IMAGE_TTL_SEC")  # 업로드 후 식단 미저장 보관 기간
+    tmp_quota_mb: int = Field(1024, alias="TMP_QUOTA_MB")  # 초과시 오래된 파일부터 삭제
+
+    # 이미지 리사이즈 옵션 (app.common.image_utils.resize_image)
+    # fast: JPEG draft + reducing_gap + EXIF 회전 -> 기존 결과와 픽셀이 달라짐 (AI 모델 입력 검증 후 opt-in)
+    image_resize_fast: bool = Field(False, alias="IMAGE_RESIZE_FAST")
+    image_resample: str = Field("lanczos", alias="IMAGE_RESAMPLE")
+    image_jpeg_quality: int = Field(85, alias="IMAGE_JPEG_QUALITY")
+    image_reducing_gap: float | None = Field(3.0, alias="IMAGE_REDUCING_GAP")
+
     # AWS S3 설정
     aws_access_key_id: str | None = Field(None, alias="AWS_ACCESS_KEY_ID")
     aws_secret_access_key: str | None = Field(None, alias="AWS_SECRET_ACCESS_KEY")
     aws_region: str = Field("ap-northeast-2", alias="AWS_REGION")
     s3_bucket_name: str = Field(..., alias="S3_BUCKET_NAME")
+    s3_upload_concurrency: int = Field(4, alias="S3_UPLOAD_CONCURRENCY")  # 식단 1건 이미지 동시 업로드 수
+    s3_max_pool_connections: int = Field(16, alias="S3_MAX_POOL_CONNECTIONS")
+    s3_multipart_threshold_mb: int = Field(8, alias="S3_MULTIPART_THRESHOLD_MB")
+    s3_multipart_chunksize_mb: int = Field(8, alias="S3_MULTIPART_CHUNKSIZE_MB")  # S3 최소 part 5MB
+    s3_multipart_max_concurrency: int = Field(4, alias="S3_MULTIPART_MAX_CONCURRENCY")
+
+    # presigned url (GET) 만료 / 캐시 (만료 refresh_margin 전까지 같은 서명 재사용)
+    s3_presigned_expire_sec: int = Field(3600, alias="S3_PRESIGNED_EXPIRE_SEC")
+    s3_presigned_refresh_margin_sec: int = Field(300, alias="S3_PRESIGNED_REFRESH_MARGIN_SEC")
+    s3_presigned_cache_maxsize: int = Field(10000, alias="S3_PRESIGNED_CACHE_MAXSIZE")
+
+    # direct upload: 클라이언트 -> S3(tmp/{user_id}/ prefix) presigned POST, API 서버는 이미지 bytes 중계 x
+    # tmp/ prefix 는 버킷 lifecycle rule 로 만료 처리 권장 (식단 미저장 업로드 정리)
+    s3_direct_upload: bool = Field(False, alias="S3_DIRECT_UPLOAD")
+    s3_direct_upload_max_mb: int = Field(10, alias="S3_DIRECT_UPLOAD_MAX_MB")
+    s3_direct_upload_expire_sec: int = Field(300, alias="S3_DIRECT_UPLOAD_EXPIRE_SEC")
+    # url: presigned GET url 을 analyze-url 로 전달 (API 서버 bytes 처리 x)
+    # fetch: tmp 객체 다운로드(최대 S3_DIRECT_UPLOAD_MAX_MB) -> 리사이즈 -> analyze, AI 서버 analyze-url 미지원시 fallback
+    s3_direct_upload_detection: str = Field("url", alias="S3_DIRECT_UPLOAD_DETECTION")
 
 
 settings = Settings()
@@ -0,0 +1,96 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from datetime import date
+
+from app.db.models.daily_nutrient_rollup import DailyNutrientRollup
+
+# CRUD 계층 - daily_nutrient_rollups 조회/증분갱신
+# commit은 service(MealLogService, NutrientRollupService)에서 관리
+
+# 증분 갱신 대상 컬럼 (meal_count 포함)
+ROLLUP_COLUMNS = (
+    "calories",
+    "carbs",
+    "protein",
+    "fat",
+    "sugar",
+    "fiber",
+    "sodium",
+    "cholesterol",
+    "saturated_fat",
+    "meal_count",
+)
+
+
+class DailyNutrientRollupCrud:
+    # --read--
+    @staticmethod
+    async def get_rollups_by_range_db(
+        db: AsyncSession, user_id: int, start_date: date, end_date: date
+    ) -> list[DailyNutrientRollup]:
+        """
+        기간 내 일별 집계 row 조회 (최대 31row)
+        """
+        result = await db.execute(
+            select(DailyNutrientRollup)
+            .where(DailyNutrientRollup.user_id == user_id)
+            .where(DailyNutrientRollup.day >= start_date)
+            .where(DailyNutrientRollup.day <= end_date)
+            .order_by(DailyNutrientRollup.day.asc())
+        )
+        return result.scalars().all()
+
+    # --upsert (증분)--
+    @staticmethod
+    async def apply_delta_db(
+        db: AsyncSession, user_id: int, day: date, delta: dict
+    ) -> None:
+        """
+        (user_id, day) row에 delta를 더함 (없으면 생성)
+        INSERT ... ON CONFLICT DO UPDATE SET col = col + excluded.col : 동시요청에도 원자적
+        :param delta: ROLLUP_COLUMNS 키를 가진 dict (음수 = 차감)
+        """
+        values = {col: delta.get(col, 0) for col in ROLLUP_COLUMNS}
+        table = DailyNutrientRollup.__table__
+
+        stmt = insert(table).values(user_id=user_id, day=day, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.day],
+            set_={
+                **{col: table.c[col] + stmt.excluded[col] for col in ROLLUP_COLUMNS},
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
+
+        # 해당 날짜 식단이 모두 삭제되면 row 정리 (float 누적오차도 함께 제거)
+        if values["meal_count"] < 0:
+            await db.execute(
+                delete(DailyNutrientRollup).where(
+                    DailyNutrientRollup.user_id == user_id,
+                    DailyNutrientRollup.day == day,
+                    DailyNutrientRollup.meal_count <= 0,
+                )
+            )
+
+    # --replace (backfill)--
+    @staticmethod
+    async def replace_user_rollups_db(
+        db: AsyncSession, user_id: int, rollups: dict[date, dict]
+    ) -> None:
+        """
+        유저의 집계 row 전체 교체 (backfill 전용)
+        :param rollups: {day: {column: value}}
+        """
+        await db.execute(
+            delete(DailyNutrientRollup).where(DailyNutrientRollup.user_id == user_id)
+        )
+        if rollups:
+            db.add_all(
+                [
+                    DailyNutrientRollup(user_id=user_id, day=day, **values)
+                    for day, values in rollups.items()
+                ]
+            )
+        await db.flush()
@@ -0,0 +1,34 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+
+from app.db.models.food import Food
+
+# CRUD 계층 - foods (음식명별 영양소 분석 결과)
+# commit은 service(FoodNutritionService)에서 관리
+
+
+class FoodCrud:
+    # --read--
+    @staticmethod
+    async def get_food_by_key_db(db: AsyncSession, name_key: str) -> Food | None:
+        result = await db.execute(select(Food).where(Food.name_key == name_key))
+        return result.scalar_one_or_none()
+
+    # --upsert--
+    @staticmethod
+    async def upsert_food_db(
+        db: AsyncSession, name_key: str, foodname: str, nutrition: dict
+    ) -> None:
+        """
+        name_key 기준 INSERT ... ON CONFLICT DO UPDATE (다중 worker 동시 write-through 안전)
+        """
+        table = Food.__table__
+        stmt = insert(table).values(
+            name_key=name_key, foodname=foodname, nutrition=nutrition
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.name_key],
+            set_={"nutrition": stmt.excluded.nutrition, "updated_at": func.now()},
+        )
+        await db.execute(stmt)
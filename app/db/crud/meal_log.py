@@ -2,8 +2,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.meal_log import MealLog
 from app.db.models.meal_item import MealItem
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select, cast, Date, delete, CursorResult
+from sqlalchemy import select, cast, Date, Float, delete, func, distinct, literal, CursorResult
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 from datetime import date
+from app.core.settings import settings
+from app.common.time_utils import day_range, local_date
 
 # CRUD 계층 -DB조회 by orm , relationship, query 책임
 
@@ -11,6 +14,38 @@ from datetime import date
 # 식단저장, 식단조회, 식단삭제
 
 
+# SQL 집계용 영양소 컬럼 -> meal_items.nutritions JSON 키
+NUTRIENT_JSON_KEYS = {
+    "calories": "calories",
+    "carbs": "carbs_g",
+    "protein": "protein_g",
+    "fat": "fat_g",
+    "sugar": "sugar_g",
+    "fiber": "fiber_g",
+    "sodium": "sodium_mg",
+    "cholesterol": "cholesterol_mg",
+    "saturated_fat": "saturated_fat_g",
+}
+
+
+def _nutrient_sum_columns() -> list:
+    """
+    SUM((nutritions::jsonb ->> key)::float * quantity) 컬럼 목록
+    - Python 구현과 동일 규칙: 값 없음 -> 0, quantity 0/NULL -> 1.0
+    """
+    nutritions = cast(MealItem.nutritions, JSONB)
+    quantity = func.coalesce(func.nullif(MealItem.quantity, 0), 1.0)
+    return [
+        func.coalesce(
+            func.sum(
+                func.coalesce(nutritions[key].astext.cast(Float), 0) * quantity
+            ),
+            0.0,
+        ).label(col)
+        for col, key in NUTRIENT_JSON_KEYS.items()
+    ]
+
+
 class MealLogCrud:
     """
     MealLog 및 MealItem에 대한 순수 DB CRUD 작업만 담당
@@ -67,10 +102,12 @@ class MealLogCrud:
             return []
 
         # 기본 쿼리 구성 + 날짜 필터링 필수
+        # [date 00:00, 다음날 00:00) 범위 비교 : (user_id, eaten_at) 인덱스 사용 (cast 사용시 인덱스 x)
+        start, end = day_range(date)
         result = await db.execute(
             select(MealLog)
             .where(MealLog.user_id == user_id)
-            .where(cast(MealLog.eaten_at, Date) == date)  # datetime -> Date(YYYY-MM-DD)
+            .where(MealLog.eaten_at >= start, MealLog.eaten_at < end)
             .options(selectinload(MealLog.meal_items))
             .order_by(MealLog.eaten_at.desc())
         )
@@ -82,42 +119,125 @@ class MealLogCrud:
         db: AsyncSession, user_id: int, start_date: date, end_date: date
     ) -> list[MealLog]:
         """
-        특정 기간 동안의 식단 조회
+        특정 기간 동안의 식단 조회 (start_date ~ end_date 포함)
         """
+        start, end = day_range(start_date, end_date)
         result = await db.execute(
             select(MealLog)
             .where(MealLog.user_id == user_id)
-            .where(cast(MealLog.eaten_at, Date) >= start_date)
-            .where(cast(MealLog.eaten_at, Date) <= end_date)
+            .where(MealLog.eaten_at >= start, MealLog.eaten_at < end)
             .options(selectinload(MealLog.meal_items))
             .order_by(MealLog.eaten_at.asc())
         )
         return result.scalars().all()
 
+    # --aggregate-- ORM 그래프(MealLog/MealItem) 로드 없이 DB에서 합산 후 tuple 반환
     @staticmethod
-    async def get_meal_log_by_id_db(db: AsyncSession, meal_id: int) -> MealLog | None:
+    async def aggregate_nutrients_by_day_db(
+        db: AsyncSession,
+        user_id: int,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> list:
         """
-        특정 식단 단건 조회 (MealItem 포함)
+        기간 내 일별 영양소 합계 (날짜 기준: APP_TIMEZONE)
+        :param start_date, end_date: None이면 전체 기간
+        :return: [(day, calories, carbs, protein, fat, sugar, fiber, sodium,
+                   cholesterol, saturated_fat, meal_count), ...] day 오름차순
+        """
+        # timezone(tz, timestamptz) -> 해당 타임존 local timestamp -> 날짜 (GROUP BY 전용, 필터는 범위 비교)
+        day = cast(
+            func.date_trunc("day", func.timezone(settings.app_timezone, MealLog.eaten_at)),
+            Date,
+        ).label("day")
+        stmt = (
+            select(
+                day,
+                *_nutrient_sum_columns(),
+                func.count(distinct(MealLog.id)).label("meal_count"),
+            )
+            .select_from(MealLog)
+            .outerjoin(MealItem, MealItem.meal_log_id == MealLog.id)
+            .where(MealLog.user_id == user_id)
+        )
+        if start_date is not None:
+            stmt = stmt.where(MealLog.eaten_at >= day_range(start_date)[0])
+        if end_date is not None:
+            stmt = stmt.where(MealLog.eaten_at < day_range(end_date)[1])
+        result = await db.execute(
+            stmt
+            .group_by(day)
+            .order_by(day)
+        )
+        return result.all()
+
+    @staticmethod
+    async def aggregate_nutrients_by_meal_log_db(
+        db: AsyncSession, user_id: int, start_date: date, end_date: date
+    ) -> list:
         """
+        기간 내 식단(MealLog)별 영양소 합계 + 음식명 목록
+        :return: [(id, meal_type, eaten_at, name, calories, carbs, ...), ...]
+                 eaten_at 내림차순 (get_meal_logs_db와 동일)
+        """
+        name = func.coalesce(
+            func.string_agg(
+                MealItem.foodname, aggregate_order_by(literal(", "), MealItem.id)
+            ),
+            "",
+        ).label("name")
+        start, end = day_range(start_date, end_date)
         result = await db.execute(
+            select(
+                MealLog.id,
+                MealLog.meal_type,
+                MealLog.eaten_at,
+                name,
+                *_nutrient_sum_columns(),
+            )
+            .select_from(MealLog)
+            .outerjoin(MealItem, MealItem.meal_log_id == MealLog.id)
+            .where(MealLog.user_id == user_id)
+            .where(MealLog.eaten_at >= start, MealLog.eaten_at < end)
+            .group_by(MealLog.id)
+            .order_by(MealLog.eaten_at.desc())
+        )
+        return result.all()
+
+    @staticmethod
+    async def get_meal_log_by_id_db(
+        db: AsyncSession, meal_id: int, for_update: bool = False
+    ) -> MealLog | None:
+        """
+        특정 식단 단건 조회 (MealItem 포함)
+        :param for_update: MealLog row lock (SELECT ... FOR UPDATE), 트랜잭션 종료까지 유지
+            -> 같은 식단 동시 수정/삭제는 순서대로 처리 (lock 획득 후 최신 값 조회)
+        """
+        stmt = (
             select(MealLog)
             .where(MealLog.id == meal_id)
             .options(selectinload(MealLog.meal_items))
         )
+        if for_update:
+            # 세션에 이미 로드된 객체도 lock 시점 값으로 갱신
+            stmt = stmt.with_for_update(of=MealLog).execution_options(populate_existing=True)
+        result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
     @staticmethod
     async def get_first_meal_log_date_db(db: AsyncSession, user_id: int) -> date | None:
         """
-        유저의 첫 식단 기록 날짜 조회
+        유저의 첫 식단 기록 날짜 조회 (APP_TIMEZONE 기준)
+        - (user_id, eaten_at) 인덱스 첫 entry만 읽음, 날짜 변환은 Python
         """
         result = await db.execute(
-            select(cast(MealLog.eaten_at, Date))
+            select(MealLog.eaten_at)
             .where(MealLog.user_id == user_id)
             .order_by(MealLog.eaten_at.asc())
             .limit(1)
         )
-        return result.scalar_one_or_none()
+        first_eaten_at = result.scalar_one_or_none()
+        return local_date(first_eaten_at) if first_eaten_at else None
         """
         result = await db.execute(
             select(MealLog)
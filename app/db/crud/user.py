@@ -1,11 +1,19 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, exists, func
 from app.db.models.user import User
 from app.db.schemas.user import UserCreate, UserUpdate
 from typing import Optional
 from fastapi import HTTPException
 
 
+def _email_taken(email: str):
+    return exists().where(func.lower(User.email) == func.lower(email))
+
+
+def _username_taken(username: str):
+    return exists().where(func.lower(User.username) == func.lower(username))
+
+
 # CRUD = query
 class UserCrud:
     # crud 에선 db query만 관리
@@ -30,18 +38,43 @@ class UserCrud:
 
     # none 으로 service에 반환하고 service에서 예외발생 시킴(+err msg)
 
+    # username/email 조회는 대소문자 무시 (lower() unique index 사용)
     # username: 조회
     @staticmethod
     async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
-        result = await db.execute(select(User).filter(User.username == username))
+        result = await db.execute(
+            select(User).filter(func.lower(User.username) == func.lower(username))
+        )
         return result.scalar_one_or_none()
 
     # email: 조회
     @staticmethod
     async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
-        result = await db.execute(select(User).filter(User.email == email))
+        result = await db.execute(
+            select(User).filter(func.lower(User.email) == func.lower(email))
+        )
         return result.scalar_one_or_none()
 
+    # 존재여부만 확인 (row 로드 x) -> lower() unique index 의 index-only scan
+    @staticmethod
+    async def email_exists(db: AsyncSession, email: str) -> bool:
+        result = await db.execute(select(_email_taken(email)))
+        return bool(result.scalar())
+
+    @staticmethod
+    async def username_exists(db: AsyncSession, username: str) -> bool:
+        result = await db.execute(select(_username_taken(username)))
+        return bool(result.scalar())
+
+    # 회원가입 중복체크: email/username 존재여부를 한 번의 round trip 으로
+    @staticmethod
+    async def get_signup_conflicts(
+        db: AsyncSession, email: str, username: str
+    ) -> tuple[bool, bool]:
+        result = await db.execute(select(_email_taken(email), _username_taken(username)))
+        email_taken, username_taken = result.one()
+        return bool(email_taken), bool(username_taken)
+
     # 모든유저 조회
     @staticmethod
     async def get_all_user(db: AsyncSession) -> list[User]:
@@ -2,6 +2,8 @@ from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.db.models.user_profile import UserProfile
+from app.db.models.user_health_condition import HealthCondition
+from app.db.models.user import User
 from app.db.schemas.user_profile import (
     UserProfileCreate,
     ProfileFormCreate,
@@ -32,6 +34,30 @@ class UserProfileCrud:
         )
         return result.scalar_one_or_none()
 
+    # read profile + health conditions (1 query)
+    @staticmethod
+    async def get_profile_with_conditions_db(
+        db: AsyncSession, user_id: int
+    ) -> tuple[UserProfile | None, list[str]]:
+        """
+        users 기준 LEFT JOIN user_profiles, user_health_conditions
+        - 프로필/condition 각각 없어도 조회 가능
+        :return: (profile | None, [condition, ...])
+        """
+        result = await db.execute(
+            select(UserProfile, HealthCondition.conditions)
+            .select_from(User)
+            .outerjoin(UserProfile, UserProfile.user_id == User.id)
+            .outerjoin(HealthCondition, HealthCondition.user_id == User.id)
+            .where(User.id == user_id)
+            .order_by(HealthCondition.id)
+        )
+        rows = result.all()
+
+        profile = rows[0][0] if rows else None
+        conditions = [condition for _, condition in rows if condition]
+        return profile, conditions
+
     # update
     @staticmethod
     async def update_profile_db(
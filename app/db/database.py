@@ -1,9 +1,35 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from app.core.settings import settings
+from app.db.pool_metrics import InstrumentedAsyncPool
+
+
+# 커넥션 풀 / asyncpg 연결 옵션 (Settings)
+def engine_options() -> dict:
+    # 연결마다 서버 세션 설정 (pg_stat_activity 식별, 장기 실행 쿼리 차단)
+    server_settings = {"application_name": settings.db_application_name}
+    if settings.db_statement_timeout_ms > 0:
+        server_settings["statement_timeout"] = str(settings.db_statement_timeout_ms)
+
+    return {
+        "echo": False,
+        "poolclass": InstrumentedAsyncPool,  # checkout 대기/overflow 집계
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_sec,
+        "pool_recycle": settings.db_pool_recycle_sec,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": {
+            # asyncpg 자체 cache + SQLAlchemy asyncpg dialect cache 같은 크기로
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "server_settings": server_settings,
+        },
+    }
+
 
 # 비동기엔진
-async_engine = create_async_engine(settings.database_url, echo=False)
+async_engine = create_async_engine(settings.database_url, **engine_options())
 
 # 비동기엔진 세션연결
 AsyncSessionLocal = sessionmaker(
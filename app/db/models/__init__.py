@@ -11,3 +11,7 @@ from .user_health_condition import HealthCondition
 from .meal_item import MealItem
 from .meal_log import MealLog
 from .prediction_log import PredictionLog
+from .food import Food
+
+# --- Stats ---
+from .daily_nutrient_rollup import DailyNutrientRollup
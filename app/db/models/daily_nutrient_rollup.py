@@ -0,0 +1,47 @@
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    Float,
+    Date,
+    DateTime,
+    ForeignKeyConstraint,
+    UniqueConstraint,
+)
+from app.db.database import Base
+from datetime import datetime, timezone
+
+
+# DailyNutrientRollup : 유저별 하루 영양소 합계 (stats 조회용 집계 테이블)
+# meal_logs/meal_items 원본의 파생 데이터 -> MealLogService에서 증분 갱신
+# 불일치 발생시 app.commands.nutrient_rollup backfill 로 재생성
+class DailyNutrientRollup(Base):
+    __tablename__ = "daily_nutrient_rollups"
+
+    id = Column(BigInteger, primary_key=True)
+    user_id = Column(BigInteger, nullable=False)
+    day = Column(Date, nullable=False)  # eaten_at 기준 날짜 (UTC)
+
+    calories = Column(Float, nullable=False, default=0.0)
+    carbs = Column(Float, nullable=False, default=0.0)
+    protein = Column(Float, nullable=False, default=0.0)
+    fat = Column(Float, nullable=False, default=0.0)
+    sugar = Column(Float, nullable=False, default=0.0)
+    fiber = Column(Float, nullable=False, default=0.0)
+    sodium = Column(Float, nullable=False, default=0.0)
+    cholesterol = Column(Float, nullable=False, default=0.0)
+    saturated_fat = Column(Float, nullable=False, default=0.0)
+    meal_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        # (user_id, day) 1row 보장 + 기간조회 인덱스 겸용
+        UniqueConstraint("user_id", "day", name="uq_daily_nutrient_rollups_user_day"),
+    )
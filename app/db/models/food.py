@@ -0,0 +1,24 @@
+from sqlalchemy import Column, BigInteger, String, JSON, DateTime
+from app.db.database import Base
+from datetime import datetime, timezone
+
+
+# Food : 음식명별 LLM 영양소 분석 결과 (food 마스터/캐시)
+# name_key = 정규화된 음식명 (공백/대소문자/유니코드 정규화) -> 동일 음식 중복 LLM 호출 방지
+class Food(Base):
+    __tablename__ = "foods"
+
+    id = Column(BigInteger, primary_key=True)
+    name_key = Column(String(200), nullable=False, unique=True, index=True)
+    foodname = Column(String(200), nullable=False)  # 최초 요청 원문
+    nutrition = Column(JSON, nullable=False)  # LLM 응답 JSON 통저장 {"foodname", "nutritions"}
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
@@ -7,6 +7,7 @@ from sqlalchemy import (
     ForeignKey,
     DateTime,
     ForeignKeyConstraint,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from app.db.database import Base
@@ -35,6 +36,8 @@ class MealItem(Base):
 
     __table_args__ = (
         ForeignKeyConstraint(["meal_log_id"], ["meal_logs.id"], ondelete="CASCADE"),
+        # selectinload(meal_items) / 집계 join / cascade delete
+        Index("ix_meal_items_meal_log_id", "meal_log_id"),
         # user_id 있으면 x 데이터 무결성 깨짐
     )
 
@@ -7,6 +7,7 @@ from sqlalchemy import (
     ForeignKey,
     DateTime,
     ForeignKeyConstraint,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from app.db.database import Base
@@ -38,6 +39,8 @@ class MealLog(Base):
 
     __table_args__ = (
         ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        # 유저별 날짜 범위 조회 (eaten_at >= start AND eaten_at < end) / 첫 기록일 조회
+        Index("ix_meal_logs_user_id_eaten_at", "user_id", "eaten_at"),
     )
 
 
@@ -7,6 +7,7 @@ from sqlalchemy import (
     DateTime,
     Boolean,
     Enum,
+    Index,
 )
 from sqlalchemy.sql import func
 from app.db.database import Base
@@ -51,6 +52,23 @@ class User(Base):
 
     # user_allergies = relationship("Allergy", back_populates="users")
 
+    # 대소문자 무시 중복 방지 + 중복확인/로그인 조회용 (lower(col) = lower(:v))
+    # INCLUDE 원본 컬럼 -> 존재여부 확인(EXISTS)이 heap 접근 없이 index-only scan
+    __table_args__ = (
+        Index(
+            "uq_users_email_lower",
+            func.lower(email),
+            unique=True,
+            postgresql_include=["email"],
+        ),
+        Index(
+            "uq_users_username_lower",
+            func.lower(username),
+            unique=True,
+            postgresql_include=["username"],
+        ),
+    )
+
     # profile, condition에 cascade (orphan data방지) 고려 필요
 
     # 개발편의성 updated_at / 디버깅 , front UX, 병렬요청 충돌 방지?
@@ -0,0 +1,91 @@
+import bisect
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+# DB 커넥션 풀 계측: checkout 대기시간 histogram / 신규·overflow 연결 / pool timeout
+# 풀은 engine.dispose() 마다 재생성 -> 집계는 클래스 단위 (프로세스 단위)
+
+# checkout 대기시간 histogram 경계 (ms), 마지막 구간은 초과
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    _counters = {
+        "checkouts": 0,
+        "timeouts": 0,
+        "new_connections": 0,
+        "overflow_events": 0,  # pool_size 초과 연결 생성
+    }
+    _wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+    _wait_total_ms = 0.0
+    _wait_max_ms = 0.0
+
+    @classmethod
+    def observe_checkout(cls, wait_ms: float) -> None:
+        cls._counters["checkouts"] += 1
+        cls._wait_buckets[bisect.bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+        cls._wait_total_ms += wait_ms
+        cls._wait_max_ms = max(cls._wait_max_ms, wait_ms)
+
+    @classmethod
+    def observe_timeout(cls) -> None:
+        cls._counters["timeouts"] += 1
+
+    @classmethod
+    def observe_new_connection(cls, overflow: bool) -> None:
+        cls._counters["new_connections"] += 1
+        if overflow:
+            cls._counters["overflow_events"] += 1
+
+    @classmethod
+    def stats(cls, pool: Pool | None = None) -> dict:
+        checkouts = cls._counters["checkouts"]
+        labels = [f"<={bound}ms" for bound in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}ms"]
+        stats = {
+            **cls._counters,
+            "wait_avg_ms": round(cls._wait_total_ms / checkouts, 3) if checkouts else 0.0,
+            "wait_max_ms": round(cls._wait_max_ms, 3),
+            "wait_histogram": dict(zip(labels, cls._wait_buckets)),  # 구간별 건수 (누적 x)
+        }
+        # 현재 풀 상태 (QueuePool 계열만)
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            stats.update(
+                pool_size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                max_overflow=pool._max_overflow,
+            )
+        return stats
+
+    @classmethod
+    def reset(cls) -> None:
+        for key in cls._counters:
+            cls._counters[key] = 0
+        cls._wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        cls._wait_total_ms = 0.0
+        cls._wait_max_ms = 0.0
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool + PoolMetrics 집계
+    checkout 대기시간 = connect() 소요 (풀 대기 + 신규 연결 생성 + pre-ping)
+    """
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            PoolMetrics.observe_timeout()
+            raise
+        PoolMetrics.observe_checkout((time.perf_counter() - start) * 1000)
+        return connection
+
+    def _create_connection(self):
+        # QueuePool: overflow 카운터 증가 후 호출 -> 0 초과면 pool_size 를 넘은 연결
+        connection = super()._create_connection()
+        PoolMetrics.observe_new_connection(overflow=self._overflow > 0)
+        return connection
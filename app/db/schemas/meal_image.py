@@ -27,6 +27,28 @@ class OverrideResponse(BaseModel):
     corrected: bool = False
 
 
+# Direct Upload (client -> S3 presigned POST)
+class DirectUploadRequest(BaseModel):
+    content_type: str = "image/jpeg"  # image/jpeg, image/png, image/webp
+
+
+class DirectUploadResponse(BaseModel):
+    image_id: str  # 업로드 완료 후 detect / meal log 생성시 사용
+    url: str  # S3 POST url
+    fields: dict[str, str]  # form fields (file 필드는 마지막에 추가)
+    max_bytes: int
+    expires_in: int
+
+
+# 비동기 감지 job (POST /meals/upload/jobs)
+class DetectionJobResponse(BaseModel):
+    job_id: str
+    image_id: str  # 완료 후에는 result.image_id 기준 (같은 사진 재업로드시 이전 ID)
+    status: str  # queued, running, succeeded, failed
+    result: Optional[MealImageResponse] = None
+    error: Optional[str] = None
+
+
 # Analized Response
 
 
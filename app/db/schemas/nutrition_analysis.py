@@ -36,9 +36,17 @@ class AnalysisResult(BaseModel):
     nutritions: dict
 
 
+# 다중 분석 중 실패한 음식 (부분 실패 허용)
+class AnalysisError(BaseModel):
+    foodname: str
+    code: str  # TIMEOUT / UPSTREAM_ERROR / CLIENT_ERROR / INTERNAL_ERROR
+    detail: str | None = None
+
+
 class MultiAnalysisResponse(BaseModel):
     results: list[AnalysisResult]  # orm JSON # TODO: 정규화? 그런거모름 나중에함
     # -> 안하는이유 리스트로 받아서 찢어서 나누고
+    errors: list[AnalysisError] = []  # 실패 항목 (성공 항목은 results에 그대로 반환)
 
 
 # Single Response
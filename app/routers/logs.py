@@ -2,10 +2,20 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, cast, String
 from sqlalchemy.orm import selectinload
-from app.db.database import get_db
+from app.db.database import get_db, async_engine
+from app.db.pool_metrics import PoolMetrics
 from app.db.models.prediction_log import PredictionLog
 from app.db.models.meal_log import MealLog
 from app.db.models.meal_item import MealItem
+from app.services.food import FoodNutritionService
+from app.clients.s3_client import S3Client
+from app.clients.detection_batcher import DetectionBatcher
+from app.clients.circuit_breaker import CircuitBreaker
+from app.common.rate_limit import RateLimiter
+from app.services.tmp_janitor import TmpJanitor
+from app.services.image_dedup import ImageDedupService
+from app.services.detection_jobs import DetectionJobQueue
+from app.services.prediction_log_writer import PredictionLogWriter
 
 router = APIRouter(prefix="/logs", tags=["Logs"])
 
@@ -64,3 +74,83 @@ async def analyze_prediction_accuracy(
         analysis_data.append(entry)
 
     return analysis_data
+
+
+@router.get("/cache/foods")
+async def read_food_cache_stats():
+    """
+    음식 영양소 캐시 hit/miss 현황 (프로세스 단위)
+    """
+    return FoodNutritionService.stats()
+
+
+@router.get("/cache/presigned-urls")
+async def read_presigned_url_cache_stats():
+    """
+    S3 presigned url 서명 생성/재사용 현황 (프로세스 단위)
+    """
+    return S3Client.presign_stats()
+
+
+@router.get("/cache/detections")
+async def read_detection_cache_stats():
+    """
+    같은 사진 재업로드 감지 결과 재사용 현황 (AI 호출 절감 수, 프로세스 단위)
+    """
+    return ImageDedupService.stats()
+
+
+@router.get("/tmp-janitor")
+async def read_tmp_janitor_stats():
+    """
+    tmp 이미지 정리 현황 (최근 실행 통계 + 누적, 프로세스 단위)
+    """
+    return TmpJanitor.stats()
+
+
+@router.get("/detection-jobs")
+async def read_detection_job_stats():
+    """
+    비동기 감지 job 대기열/처리 현황 (프로세스 단위)
+    """
+    return DetectionJobQueue.stats()
+
+
+@router.get("/detection-batches")
+async def read_detection_batch_stats():
+    """
+    감지 요청 micro-batching 현황 (배치 수, 평균 배치 크기, 프로세스 단위)
+    """
+    return DetectionBatcher.stats()
+
+
+@router.get("/ai-breakers")
+async def read_ai_breaker_stats():
+    """
+    AI 엔드포인트별 circuit breaker 상태 / 진행중 요청 수 / 거절 수 (프로세스 단위)
+    """
+    return CircuitBreaker.all_stats()
+
+
+@router.get("/prediction-writer")
+async def read_prediction_writer_stats():
+    """
+    PredictionLog 배치 저장 현황 (대기/저장/실패/drop 수, 프로세스 단위)
+    """
+    return PredictionLogWriter.stats()
+
+
+@router.get("/rate-limit")
+async def read_rate_limit_stats():
+    """
+    인증 엔드포인트 rate limit 허용/거절 현황 (프로세스 단위)
+    """
+    return RateLimiter.stats()
+
+
+@router.get("/db-pool")
+async def read_db_pool_stats():
+    """
+    DB 커넥션 풀 현황 (사용중/대기 연결, checkout 대기시간 histogram, overflow/timeout 수, 프로세스 단위)
+    """
+    return PoolMetrics.stats(async_engine.pool)
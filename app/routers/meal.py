@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Depends, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_user_id, get_current_user
-from app.db.models import User
+from app.core.auth import get_user_id, get_current_user, CurrentUser
 from app.db.database import get_db
 
 # 스키마
-from app.db.schemas.meal_image import MealImageResponse, OverrideResponse
+from app.db.schemas.meal_image import (
+    MealImageResponse,
+    OverrideResponse,
+    DirectUploadRequest,
+    DirectUploadResponse,
+    DetectionJobResponse,
+)
 from app.db.schemas.meal_log import (
     MealLogUpdate,
     MealLogRead,
@@ -23,12 +28,15 @@ from app.db.schemas.nutrition_analysis import (
 )
 
 import io
+import json
 from datetime import date
 
 # 서비스
 from app.services.meal_image import MealImageService
 from app.services.meal_item import MealItemService
 from app.services.meal_log import MealLogService
+from app.services.detection_jobs import DetectionJobQueue
+from app.core.settings import settings
 
 # meal domain ux흐름 일치 엔드포인트끼리 묶음
 # meal_log, meal_item, meal_image
@@ -42,7 +50,7 @@ router = APIRouter(prefix="/meals", tags=["Meal"])
 # img 업로드 및 cls
 @router.post("/upload", response_model=MealImageResponse)
 async def upload_image_endpoint(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     file: UploadFile = File(None),
     db: AsyncSession = Depends(get_db),
 ):
@@ -61,6 +69,82 @@ async def upload_image_endpoint(
     # }
 
 
+# 비동기 감지 job: 업로드 즉시 202 (job_id, image_id) -> polling 또는 SSE 로 결과 수신
+@router.post(
+    "/upload/jobs",
+    response_model=DetectionJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_detection_job_endpoint(
+    current_user: CurrentUser = Depends(get_current_user),
+    file: UploadFile = File(None),
+):
+    return await MealImageService.submit_detection_job(file, current_user.id)
+
+
+def _get_own_job(job_id: str, user_id: int):
+    job = DetectionJobQueue.get(job_id, user_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Detection job not found"
+        )
+    return job
+
+
+@router.get("/upload/jobs/{job_id}", response_model=DetectionJobResponse)
+async def read_detection_job_endpoint(
+    job_id: str,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    return _get_own_job(job_id, current_user.id).to_dict()
+
+
+@router.get("/upload/jobs/{job_id}/events")
+async def stream_detection_job_endpoint(
+    job_id: str,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    SSE: 완료시 event: done (data = job JSON) 1회 전송 후 종료
+    대기 중에는 keepalive 주석 전송 (프록시 idle timeout 방지)
+    """
+    job = _get_own_job(job_id, current_user.id)
+
+    async def event_stream():
+        while not await job.wait(settings.detection_job_sse_keepalive_sec):
+            yield ": keepalive\n\n"
+        data = json.dumps(job.to_dict(), ensure_ascii=False)
+        yield f"event: done\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# direct upload (S3_DIRECT_UPLOAD=true)
+# 1. presign 발급 -> 2. 클라이언트가 S3(tmp/{user_id}/)로 직접 POST -> 3. detect 요청
+# 식단 저장(/log)시 tmp_image_ids 에 같은 image_id 전달 -> meals/ 로 server-side copy
+@router.post("/upload/presign", response_model=DirectUploadResponse)
+async def create_direct_upload_endpoint(
+    request: DirectUploadRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    return await MealImageService.create_direct_upload(
+        request.content_type, current_user.id
+    )
+
+
+@router.post("/upload/{image_id}/detect", response_model=MealImageResponse)
+async def detect_direct_upload_endpoint(
+    image_id: str,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    return await MealImageService.direct_image_detection(db, image_id, current_user.id)
+
+
 # foodname = front state 값 db 저장x
 
 
@@ -72,7 +156,7 @@ async def upload_image_endpoint(
 # 사진 재촬영 업로드 - 중복업로드방지
 @router.post("/override/image", response_model=OverrideResponse)
 async def override_prediction_endpoint(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     file: UploadFile = File(None),
 ):
     # TODO: 사진 분석 임시 API hard coded (Inference or LLM 모듈과 연결되면 수정)
@@ -156,7 +240,7 @@ async def analyze_nutrition_endpoint(request: MultiAnalysisRequest):
 @router.post("/log", response_model=MealLogRead)
 async def create_meal_log_endpoint(
     meal: MealLogCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -172,7 +256,7 @@ async def create_meal_log_endpoint(
 @router.get("/logs", response_model=list[MealLogRead])
 async def read_meal_log_endpoint(
     date: date | None = None,  # query param
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -189,7 +273,7 @@ async def read_meal_log_endpoint(
 async def update_meal_log_endpoint(
     meal_id: int,
     meal_update: MealLogUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -208,7 +292,7 @@ async def update_meal_log_endpoint(
 @router.delete("/log/{meal_id}")
 async def delete_meal_log_endpoint(
     meal_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> bool:
     """
@@ -1,10 +1,9 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import date
+from app.common.time_utils import local_today
 
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, CurrentUser
 from app.db.database import get_db
-from app.db.models.user import User
 from app.db.crud.meal_log import MealLogCrud
 from app.db.schemas.nutrition_advice import (
     NutritionAdviceResponse,
@@ -17,31 +16,24 @@ from app.services.nutrition_calculator import NutritionCalculatorService
 router = APIRouter(prefix="/nutrition", tags=["Nutrition"])
 
 
-def calculate_today_intake(meal_logs: list) -> dict:
+def calculate_today_intake(day_rows: list) -> dict:
     """
-    오늘의 meal_logs에서 총 섭취량 계산
+    오늘의 일별 영양소 합계 row에서 총 섭취량 계산
 
     Args:
-        meal_logs: MealLog 객체 리스트 (meal_items 포함)
+        day_rows: MealLogCrud.aggregate_nutrients_by_day_db 결과 (quantity 반영된 합계)
 
     Returns:
         {"calorie": float, "carb": float, "protein": float, "fat": float, "sodium": float}
     """
     total = {"calorie": 0.0, "carb": 0.0, "protein": 0.0, "fat": 0.0, "sodium": 0.0}
 
-    for meal_log in meal_logs:
-        for item in meal_log.meal_items:
-            if item.nutritions:
-                # nutritions JSON 구조에서 값 추출
-                # AI 응답 형식: {"calories": N, "carbs_g": N, "protein_g": N, "fat_g": N, "sodium_mg": N}
-                nutritions = item.nutritions
-                quantity = item.quantity if item.quantity else 1.0
-
-                total["calorie"] += (nutritions.get("calories", 0) or 0) * quantity
-                total["carb"] += (nutritions.get("carbs_g", 0) or 0) * quantity
-                total["protein"] += (nutritions.get("protein_g", 0) or 0) * quantity
-                total["fat"] += (nutritions.get("fat_g", 0) or 0) * quantity
-                total["sodium"] += (nutritions.get("sodium_mg", 0) or 0) * quantity
+    for row in day_rows:
+        total["calorie"] += row.calories or 0
+        total["carb"] += row.carbs or 0
+        total["protein"] += row.protein or 0
+        total["fat"] += row.fat or 0
+        total["sodium"] += row.sodium or 0
 
     # 소수점 1자리로 반올림
     return {k: round(v, 1) for k, v in total.items()}
@@ -49,7 +41,7 @@ def calculate_today_intake(meal_logs: list) -> dict:
 
 @router.get("/target", response_model=TargetOnlyResponse)
 async def get_target_nutrition(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -64,7 +56,7 @@ async def get_target_nutrition(
 
 @router.get("/advice", response_model=NutritionAdviceResponse)
 async def get_nutrition_advice(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -82,15 +74,17 @@ async def get_nutrition_advice(
     - HYPOTENSION_LOW_INTAKE: 저혈압 - 칼로리 70% 미만
     - HYPERLIPIDEMIA_FAT_OVER: 고지혈증 - 지방 70g 초과
     """
-    today = date.today()
+    today = local_today()
 
-    # 오늘의 meal_logs 조회
-    meal_logs = await MealLogCrud.get_meal_logs_db(db, current_user.id, today)
+    # 오늘의 영양소 합계 조회 (DB 집계 1 query, meal_items 로드 x)
+    day_rows = await MealLogCrud.aggregate_nutrients_by_day_db(
+        db, current_user.id, today, today
+    )
 
     # 오늘 섭취량 계산
-    current_intake = calculate_today_intake(meal_logs)
+    current_intake = calculate_today_intake(day_rows)
 
-    # 목표 영양소 및 경고 생성
+    # 목표 영양소 및 경고 생성 (profile + conditions 1 query)
     result = await NutritionCalculatorService.get_nutrition_advice(
         db=db, user_id=current_user.id, current_intake=current_intake
     )
@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_user
-from app.db.models import User
+from app.core.auth import get_current_user, CurrentUser
 from app.db.database import get_db
 from app.db.schemas.stats import (
     StatsResponse,
@@ -19,7 +18,7 @@ stats_router = APIRouter(prefix="/stats", tags=["Stats"])
 @dashboard_router.get("/today", response_model=TodaySummary)
 async def get_today_summary_endpoint(
     date: date,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     # TODO: Dashboard용 요약 정보 (필요시 StatsService에 추가 구현)
@@ -31,7 +30,7 @@ async def get_today_summary_endpoint(
 @stats_router.get("/daily", response_model=StatsResponse)
 async def get_daily_stats_endpoint(
     date: date,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -45,7 +44,7 @@ async def get_daily_stats_endpoint(
 @stats_router.get("/weekly", response_model=StatsResponse)
 async def get_weekly_stats_endpoint(
     startDate: date,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -60,7 +59,7 @@ async def get_weekly_stats_endpoint(
 async def get_month_stats_endpoint(
     year: int,
     month: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
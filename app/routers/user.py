@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.auth import get_current_user, get_user_id
+from app.core.auth import get_current_user, get_user_id, CurrentUser
 from app.db.schemas.user import (
     UserRead,
     UserCreate,
@@ -19,6 +19,8 @@ from app.services.user import UserService
 from app.db.crud.user import UserCrud
 
 from app.core.auth import set_login_cookies, set_access_cookie
+from app.core.settings import settings
+from app.common.rate_limit import RateLimiter, client_ip, limit_by_ip
 
 from typing import Annotated
 
@@ -27,10 +29,14 @@ router = APIRouter(prefix="/users", tags=["User"])
 # 최대한 restful api설계방식
 
 
-@router.get("/checkemail", response_model=MessageResponse)
+# 중복확인/회원가입/로그인: IP(+계정) 기준 rate limit -> 초과시 DB 조회/해시 전에 429
+@router.get(
+    "/checkemail",
+    response_model=MessageResponse,
+    dependencies=[Depends(limit_by_ip("check", "rate_limit_check_ip"))],
+)
 async def checkemail(email: str, db: AsyncSession = Depends(get_db)) -> MessageResponse:
-    existing_email = await UserCrud.get_user_by_email(db, email)
-    if existing_email:
+    if await UserCrud.email_exists(db, email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 사용중인 이메일입니다",
@@ -38,10 +44,13 @@ async def checkemail(email: str, db: AsyncSession = Depends(get_db)) -> MessageR
     return {"message": "사용 가능한 이메일입니다"}
 
 
-@router.get("/checkid", response_model=MessageResponse)
+@router.get(
+    "/checkid",
+    response_model=MessageResponse,
+    dependencies=[Depends(limit_by_ip("check", "rate_limit_check_ip"))],
+)
 async def checkid(id: str, db: AsyncSession = Depends(get_db)) -> MessageResponse:
-    existing_id = await UserCrud.get_user_by_username(db, id)
-    if existing_id:
+    if await UserCrud.username_exists(db, id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 사용중인 아이디입니다",
@@ -51,7 +60,11 @@ async def checkid(id: str, db: AsyncSession = Depends(get_db)) -> MessageRespons
 
 # 회원가입 - JWT 로그인 - /me 인증확인 - 수정 - 삭제 - 중복체크
 # signup
-@router.post("/signup", response_model=UserRead)
+@router.post(
+    "/signup",
+    response_model=UserRead,
+    dependencies=[Depends(limit_by_ip("signup", "rate_limit_signup_ip"))],
+)
 async def signup(user: UserCreate, db: AsyncSession = Depends(get_db)) -> User:
     db_user = await UserService.register_user(
         db, user.email, user.username, user.password, user.nickname
@@ -62,8 +75,16 @@ async def signup(user: UserCreate, db: AsyncSession = Depends(get_db)) -> User:
 # login (유저정보만 클라이언트로 반환) #관리자폐이지 추가고려시 (admin uid:1, 모든권한 슈퍼계정)
 @router.post("/login", response_model=LoginResponse)
 async def login(
-    user: UserLogin, response: Response, db: AsyncSession = Depends(get_db)
+    user: UserLogin,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
 ):  # response fastapi가 자동으로 dependency 주입
+    # IP 단위(credential stuffing) + 계정 단위(특정 계정 brute-force)
+    await RateLimiter.enforce(
+        (f"login:ip:{client_ip(request)}", settings.rate_limit_login_ip),
+        (f"login:account:{user.account.strip().lower()}", settings.rate_limit_login_account),
+    )
     result = await UserService.login(db, user)
     db_user, access_token, refresh_token = result
     set_login_cookies(
@@ -105,11 +126,11 @@ async def update_user_by_id(
 @router.patch("/me/password", description="비밀번호변경")
 async def change_my_pw(
     pw_data: PasswordUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
 
-    await UserService.update_pw(db, current_user, pw_data)
+    await UserService.update_pw(db, current_user.id, pw_data)
     return {"msg": "비밀번호 변경 완료"}
 
 
@@ -1,11 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_user, get_user_id
+from app.core.auth import get_current_user, get_user_id, CurrentUser
 from app.core.auth import set_login_cookies, set_access_cookie
 
 from app.db.database import get_db
-from app.db.models.user import User
 from app.db.models.user_health_condition import HealthCondition
 from app.db.schemas.user_health_condition import (
     HealthConditionCreate,
@@ -24,7 +23,7 @@ router = APIRouter(prefix="/users/me/heatlh-conditions", tags=["HealthCondition"
 @router.post("/", response_model=HealthConditionRead, description="조건 1개씩 추가")
 async def create_condition_endpoint(
     conditions: HealthConditionCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     row = await HealthConditionService.create_one_condition(
@@ -36,7 +35,7 @@ async def create_condition_endpoint(
 # # read one_condition
 # @router.get("/", response_model=HealthConditionRead)
 # async def get_condition_endpoint(
-#     current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+#     current_user: CurrentUser = Depends(get_current_user), db: AsyncSession = Depends(get_db)
 # ):
 #     user_id = current_user.id
 #     db_condition = await HealthConditionService.get_all_conditions(db, user_id)
@@ -48,7 +47,7 @@ async def create_condition_endpoint(
 # @router.post("/", response_model=list[HealthConditionRead])
 # async def create_condition_list_endpoint(
 #     conditions: HealthConditionCreate,
-#     current_user: User = Depends(get_current_user),
+#     current_user: CurrentUser = Depends(get_current_user),
 #     db: AsyncSession = Depends(get_db),
 # ):
 #     user_id = current_user.id
@@ -62,7 +61,7 @@ async def create_condition_endpoint(
 # @router.patch("/", response_model=HealthConditionRead, summary="건강정보 수정")
 # async def update_condition_endpoint(
 #     conditions: HealthConditionUpdate,
-#     current_user: User = Depends(get_current_user),
+#     current_user: CurrentUser = Depends(get_current_user),
 #     db: AsyncSession = Depends(get_db),
 # ):
 #     user_id = current_user.id
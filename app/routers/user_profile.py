@@ -1,9 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, CurrentUser
 
 from app.db.database import get_db
-from app.db.models.user import User
 from app.db.models.user_profile import UserProfile
 from app.db.crud.user_profile import UserProfileCrud
 from app.db.schemas.user_profile import (
@@ -36,7 +35,7 @@ router = APIRouter(prefix="/users/me/profile", tags=["UserProfile"])
 )
 async def create_profile_endpoint(
     profile: UserProfileCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     user_id = current_user.id
@@ -47,7 +46,7 @@ async def create_profile_endpoint(
 # read (신체정보+목표 표시)
 @router.get("/", response_model=UserProfileRead, summary="Read:신체정보+목표 표시")
 async def get_profile_endpoint(
-    current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user), db: AsyncSession = Depends(get_db)
 ):
     user_id = current_user.id
     db_profile = await UserProfileService.get_profile(db, user_id)
@@ -58,7 +57,7 @@ async def get_profile_endpoint(
 @router.patch("/", response_model=UserProfileRead, summary="Update:신체정보+목표 수정")
 async def update_profile_endpoint(
     profile: UserProfileUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     user_id = current_user.id
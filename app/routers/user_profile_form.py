@@ -3,10 +3,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.auth import (
     get_current_user,
     get_user_id,
+    CurrentUser,
 )  # get_user_id는 왠만하면 x DB중복조회 등
 
 from app.db.database import get_db
-from app.db.models.user import User
 from app.db.models.user_profile import UserProfile
 from app.db.crud.user_profile import UserProfileCrud
 from app.db.schemas.user_profile import (
@@ -37,7 +37,7 @@ router = APIRouter(prefix="/users/me/profile", tags=["ProfileForm"])
 )
 async def create_profile_endpoint(
     profile_form: ProfileFormCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     user_id = current_user.id
@@ -50,7 +50,7 @@ async def create_profile_endpoint(
 # get
 @router.get("/form", response_model=ProfileFormRead)
 async def get_profile_endpoint(
-    current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user), db: AsyncSession = Depends(get_db)
 ):
     user_id = current_user.id
     db_profile_form = await ProfileFormService.read_profile_form(db, user_id)
@@ -61,7 +61,7 @@ async def get_profile_endpoint(
 @router.patch("/form", response_model=ProfileFormUpdate)
 async def update_profile_endpoint(
     profile_data: ProfileFormUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     user_id = current_user.id
@@ -0,0 +1,174 @@
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from fastapi import HTTPException
+
+from app.clients.circuit_breaker import AIServiceUnavailable
+from app.common.cache import TTLCache
+from app.core.settings import settings
+from app.db.database import AsyncSessionLocal
+
+# 비동기 이미지 감지 job (POST /meals/upload/jobs)
+# - 업로드 요청은 job 등록 후 즉시 응답, AI 감지는 백그라운드 worker 에서 실행
+# - 대기열 크기 제한 (DETECTION_JOB_MAX_QUEUE) 초과시 DetectionQueueFull -> 503
+# - 결과는 polling(GET /meals/upload/jobs/{job_id}) 또는 SSE(.../events) 로 조회
+# - job 상태는 프로세스 메모리 보관 (DETECTION_JOB_TTL_SEC 후 만료, worker 간 공유 x)
+# - main.py lifespan 에서 startup/shutdown
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+
+
+class DetectionQueueFull(Exception):
+    """감지 job 대기열 포화"""
+
+
+@dataclass
+class DetectionJob:
+    job_id: str
+    user_id: int
+    image_id: str
+    status: str = QUEUED
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    _done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        완료 대기 (timeout 초과시 False)
+        """
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "image_id": self.image_id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class DetectionJobQueue:
+    _queue: asyncio.Queue | None = None
+    _workers: list[asyncio.Task] = []
+    _jobs = TTLCache(settings.detection_job_maxsize, settings.detection_job_ttl_sec)
+    session_factory = AsyncSessionLocal
+    _counters = {"submitted": 0, "rejected": 0, "succeeded": 0, "failed": 0}
+
+    # --lifecycle-- main.py lifespan에서 호출
+    @classmethod
+    def startup(cls, workers: int | None = None, max_queue: int | None = None) -> None:
+        if cls._queue is not None:
+            return
+        workers = workers or settings.detection_job_workers
+        cls._queue = asyncio.Queue(maxsize=max_queue or settings.detection_job_max_queue)
+        cls._workers = [
+            asyncio.create_task(cls._worker(), name=f"detection-worker-{index}")
+            for index in range(workers)
+        ]
+
+    @classmethod
+    async def shutdown(cls, grace_sec: float | None = None) -> None:
+        """
+        대기중 job 처리 대기(최대 grace_sec) 후 worker 종료
+        """
+        if cls._queue is None:
+            return
+        grace_sec = settings.ai_shutdown_grace_sec if grace_sec is None else grace_sec
+        queue, workers = cls._queue, cls._workers
+        try:
+            await asyncio.wait_for(queue.join(), grace_sec)
+        except asyncio.TimeoutError:
+            pass
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        cls._queue, cls._workers = None, []
+
+    @classmethod
+    def submit(
+        cls, user_id: int, image_id: str, fn: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> DetectionJob:
+        # lifespan 밖(단독 테스트 등)에서 호출되면 lazy 시작
+        if cls._queue is None:
+            cls.startup()
+        job = DetectionJob(job_id=str(uuid.uuid4()), user_id=user_id, image_id=image_id)
+        try:
+            cls._queue.put_nowait((job, fn))
+        except asyncio.QueueFull:
+            cls._counters["rejected"] += 1
+            raise DetectionQueueFull("detection queue is full")
+        cls._jobs.set(job.job_id, job)
+        cls._counters["submitted"] += 1
+        return job
+
+    @classmethod
+    def get(cls, job_id: str, user_id: int) -> DetectionJob | None:
+        """
+        본인 job 만 조회 (없거나 만료/타인 job 이면 None)
+        """
+        job = cls._jobs.get(job_id)
+        if job is None or job.user_id != user_id:
+            return None
+        return job
+
+    @classmethod
+    async def _worker(cls) -> None:
+        queue = cls._queue
+        while True:
+            job, fn = await queue.get()
+            try:
+                await cls._run(job, fn)
+            finally:
+                queue.task_done()
+
+    @classmethod
+    async def _run(cls, job: DetectionJob, fn: Callable[[], Awaitable[dict[str, Any]]]) -> None:
+        job.status = RUNNING
+        try:
+            job.result = await fn()
+            job.status = SUCCEEDED
+        except HTTPException as e:
+            job.status, job.error = FAILED, str(e.detail)
+        except AIServiceUnavailable:
+            job.status, job.error = FAILED, "AI service is temporarily unavailable"
+        except asyncio.CancelledError:
+            # shutdown grace 초과로 worker 취소 -> 대기중인 polling/SSE 에 실패로 알림
+            job.status, job.error = FAILED, "Detection server is shutting down"
+            raise
+        except Exception as e:
+            print(f"[DetectionJob Error] job_id={job.job_id}: {e}")
+            job.status, job.error = FAILED, "Detection failed"
+        finally:
+            cls._counters[job.status] += 1
+            job.finished_at = time.time()
+            job._done.set()
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        return {
+            "running": cls._queue is not None,
+            "queued": cls._queue.qsize() if cls._queue is not None else 0,
+            "workers": len(cls._workers),
+            "jobs": len(cls._jobs),
+            **cls._counters,
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._jobs.clear()
+        for key in cls._counters:
+            cls._counters[key] = 0
@@ -1,9 +1,56 @@
 import os
 import shutil
+import tempfile
+import uuid
+from dataclasses import dataclass
 from fastapi import UploadFile, HTTPException
 from fastapi.concurrency import run_in_threadpool
 from typing import Optional
 
+from app.common.image_utils import SNIFF_HEADER_SIZE, sniff_image_format
+
+
+class UploadTooLarge(Exception):
+    """
+    업로드 크기 제한 초과 (라우터/서비스에서 413 으로 변환)
+    """
+
+
+class UnsupportedImageFormat(Exception):
+    """
+    magic bytes 기준 지원하지 않는 포맷 (415 로 변환)
+    """
+
+
+@dataclass
+class SpooledUpload:
+    """
+    청크 단위로 읽은 업로드 파일
+    - spool_threshold 이하: data(bytes) 메모리 보관
+    - 초과: path(디스크 임시 파일) -> 리사이즈 실행기가 파일에서 직접 디코딩
+    """
+
+    format: str  # magic bytes 판별 포맷 (JPEG / PNG / WEBP)
+    size: int
+    data: bytes | None = None
+    path: str | None = None
+
+    @property
+    def source(self) -> bytes | str:
+        return self.data if self.data is not None else self.path
+
+    async def cleanup(self) -> None:
+        if self.path is not None:
+            await run_in_threadpool(_remove_quietly, self.path)
+            self.path = None
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
 
 class FileManager:
     """
@@ -16,74 +63,138 @@ class FileManager:
         "/tmp/caloreat_images"  # TODO: 환경변수로 변경 필요 (도커파일추가시 경로유연성)
     )
 
-    @classmethod
-    def _ensure_dir(cls):
-        os.makedirs(cls.TEMP_DIR, exist_ok=True)
+    # tmp 이미지 확장자 후보 (저장 포맷 고정) -> ID 로 경로 직접 계산, 디렉토리 scan x
+    TMP_EXTENSIONS = ("jpg", "png", "webp")
 
     @staticmethod
-    async def delete_tmp_image(file_path: str) -> None:
+    def is_valid_image_id(image_id: str) -> bool:
+        # image_id 는 파일 경로 / S3 key 에 들어가므로 UUID 형식만 허용 (path traversal 방지)
+        try:
+            return str(uuid.UUID(image_id)) == image_id
+        except (ValueError, TypeError, AttributeError):
+            return False
+
+    @classmethod
+    def tmp_path_for(cls, filename: str) -> str:
         """
-        로컬 파일 시스템에서 파일을 삭제 (Non-blocking)
+        tmp 파일 경로: TEMP_DIR/{파일명 앞 2자}/{filename}
+        - 하위 디렉토리 분산(shard) -> 디렉토리당 파일 수 1/256
         """
+        return os.path.join(cls.TEMP_DIR, filename[:2], filename)
+
+    @staticmethod
+    def _remove(file_path: str) -> None:
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
         except OSError as e:
             # 삭제 실패 시 로그 남기기
             print(f"Error deleting file {file_path}: {e}")
-            pass
 
     @staticmethod
-    async def save_tmp_image(image_data: bytes, filename: str) -> str:
+    async def delete_tmp_image(file_path: str) -> None:
         """
-        바이트 데이터를 임시 경로에 저장 (Non-blocking)
+        로컬 파일 시스템에서 파일을 삭제 (Non-blocking, threadpool)
         """
-        FileManager._ensure_dir()
-        file_path = os.path.join(FileManager.TEMP_DIR, filename)
+        await run_in_threadpool(FileManager._remove, file_path)
 
-        # 현재는 단순 동기 쓰기 (TODO:트래픽 증가 시 Threadpool 적용)
-        with open(file_path, "wb") as f:
+    @staticmethod
+    def _write(file_path: str, image_data: bytes) -> None:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # 임시 이름으로 쓰고 rename -> 조회시 쓰는 중인 파일이 보이지 않음
+        partial_path = f"{file_path}.part"
+        with open(partial_path, "wb") as f:
             f.write(image_data)
+        os.replace(partial_path, file_path)
+
+    @staticmethod
+    async def save_tmp_image(image_data: bytes, filename: str) -> str:
+        """
+        바이트 데이터를 임시 경로에 저장 (Non-blocking, threadpool)
+        """
+        file_path = FileManager.tmp_path_for(filename)
+        await run_in_threadpool(FileManager._write, file_path, image_data)
         return file_path
 
     @staticmethod
     def get_tmp_file_path(image_id: str) -> str:
         """
-        이미지 ID(UUID)를 기반으로 실제 파일 경로 검색
+        이미지 ID(UUID)를 기반으로 실제 파일 경로 조회 (O(1))
+        - shard 경로 + 고정 확장자 후보만 확인 (디렉토리 listdir x)
+        - shard 도입 전 TEMP_DIR 바로 아래 저장된 파일도 확인
         """
-        FileManager._ensure_dir()
-        try:
-            for filename in os.listdir(FileManager.TEMP_DIR):
-                if filename.startswith(image_id) and filename[len(image_id)] == ".":
-                    return os.path.join(FileManager.TEMP_DIR, filename)
-        except FileNotFoundError:
-            raise FileNotFoundError(
-                f"Image directory not found: {FileManager.TEMP_DIR}"
-            )
+        if not FileManager.is_valid_image_id(image_id):
+            raise FileNotFoundError(f"Invalid image ID: {image_id}")
+
+        for ext in FileManager.TMP_EXTENSIONS:
+            filename = f"{image_id}.{ext}"
+            for file_path in (
+                FileManager.tmp_path_for(filename),
+                os.path.join(FileManager.TEMP_DIR, filename),
+            ):
+                if os.path.isfile(file_path):
+                    return file_path
 
         raise FileNotFoundError(f"Image file not found for ID: {image_id}")
 
+    @staticmethod
+    async def spool_upload(
+        file: UploadFile, max_bytes: int, spool_threshold: int, chunk_size: int
+    ) -> SpooledUpload:
+        """
+        UploadFile 을 청크 단위로 읽기 (전체 read() x)
+        - max_bytes 초과 즉시 중단 -> UploadTooLarge
+        - 첫 청크 magic bytes 로 포맷 판별 -> UnsupportedImageFormat
+        - spool_threshold 초과시 디스크 임시 파일로 spool
+        """
+        # multipart 파싱 단계에서 크기가 확정된 경우 읽기 전에 거절
+        if file.size is not None and file.size > max_bytes:
+            raise UploadTooLarge(f"Upload exceeds {max_bytes} bytes")
+
+        buffer = bytearray()
+        spool_file = None
+        size = 0
+        image_format = None
+        try:
+            while chunk := await file.read(chunk_size):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"Upload exceeds {max_bytes} bytes")
+
+                if image_format is None:
+                    header = bytes(buffer[:SNIFF_HEADER_SIZE]) + chunk[:SNIFF_HEADER_SIZE]
+                    if len(header) >= SNIFF_HEADER_SIZE:
+                        image_format = sniff_image_format(header)
+                        if image_format is None:
+                            raise UnsupportedImageFormat("Unsupported image format")
+
+                if spool_file is None and size > spool_threshold:
+                    spool_file = tempfile.NamedTemporaryFile(
+                        prefix="upload_", delete=False
+                    )
+                    await run_in_threadpool(spool_file.write, bytes(buffer))
+                    buffer = bytearray()
 
-# --- Legacy Validation Logic (from feat/meal-s3) ---
-# MVP 기능 구동 우선 모든 validation 비활성화
-# 추후 필요시 활성화하여 사용
+                if spool_file is not None:
+                    await run_in_threadpool(spool_file.write, chunk)
+                else:
+                    buffer += chunk
 
-# ALLOWED_EXTENSIONS = {"jpg", "jpeg", "png", "webp"}
-# MAX_FILE_SIZE_MB = 10
+            if image_format is None:
+                # 헤더 길이 미만의 짧은 파일
+                image_format = sniff_image_format(bytes(buffer))
+                if image_format is None:
+                    raise UnsupportedImageFormat("Unsupported image format")
+        except BaseException:
+            if spool_file is not None:
+                spool_file.close()
+                await run_in_threadpool(_remove_quietly, spool_file.name)
+            raise
 
-# def _validate_extension(filename: str):
-#     ext = filename.rsplit(".", 1)[-1].lower()
-#     if ext not in ALLOWED_EXTENSIONS:
-#         raise HTTPException(status_code=400, detail=f"Unsupported file extension: .{ext}")
+        if spool_file is not None:
+            spool_file.close()
+            return SpooledUpload(format=image_format, size=size, path=spool_file.name)
+        return SpooledUpload(format=image_format, size=size, data=bytes(buffer))
 
-# def _validate_mime(file: UploadFile):
-#     if not file.content_type.startswith("image/"):
-#         raise HTTPException(status_code=400, detail=f"Invalid MIME type: {file.content_type}")
 
-# def _validate_size(file: UploadFile):
-#     file.file.seek(0, os.SEEK_END)
-#     size = file.file.tell()
-#     file.file.seek(0)
-#     max_bytes = MAX_FILE_SIZE_MB * 1024 * 1024
-#     if size > max_bytes:
-#         raise HTTPException(status_code=400, detail=f"File size exceeds limit of {MAX_FILE_SIZE_MB} MB")
@@ -0,0 +1,128 @@
+import logging
+import unicodedata
+from typing import Any
+
+from app.clients.ai_client import AIClient
+from app.common.cache import TTLCache, SingleFlight
+from app.core.settings import settings
+from app.db.crud.food import FoodCrud
+from app.db.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 음식명 -> 영양소 분석 결과 조회 (2단 캐시)
+# 1. in-process LRU(TTL)  2. foods 테이블  3. LLM 서버 (결과 write-through)
+# - 같은 음식 동시 miss 는 SingleFlight 로 LLM 1회만 호출
+# - DB 조회/저장은 요청 세션과 분리된 짧은 세션 사용 (공유 작업이 특정 요청 세션에 묶이지 않도록)
+
+
+def normalize_food_name(foodname: str) -> str:
+    """
+    캐시 key용 음식명 정규화: 유니코드 NFKC, 앞뒤/연속 공백 정리, casefold
+    ex) " 김치  찌개 " -> "김치 찌개"
+    """
+    name = unicodedata.normalize("NFKC", foodname)
+    return " ".join(name.split()).casefold()
+
+
+class FoodNutritionService:
+    _cache = TTLCache(settings.food_cache_maxsize, settings.food_cache_ttl_sec)
+    _single_flight = SingleFlight()
+    session_factory = AsyncSessionLocal
+
+    # 모니터링용 카운터 (프로세스 단위)
+    _counters = {
+        "memory_hits": 0,
+        "db_hits": 0,
+        "llm_calls": 0,
+        "llm_errors": 0,
+        "shared_waits": 0,  # single-flight로 다른 요청 결과를 공유받은 횟수
+        "db_errors": 0,
+    }
+
+    @classmethod
+    async def get_nutrition(cls, foodname: str, fresh: bool = False) -> dict[str, Any]:
+        """
+        음식명 영양소 분석 결과 조회 (SingleAnalysisResponse 형식)
+        :param fresh: 진행중인 조회에 합류하지 않고 새로 조회 (timeout 후 재시도용)
+        """
+        name_key = normalize_food_name(foodname)
+
+        cached = cls._cache.get(name_key)
+        if cached is not None:
+            cls._counters["memory_hits"] += 1
+            return cached
+
+        if fresh:
+            cls._single_flight.forget(name_key)
+        result, shared = await cls._single_flight.do(
+            name_key, lambda: cls._load(name_key, foodname)
+        )
+        if shared:
+            cls._counters["shared_waits"] += 1
+        return result
+
+    @classmethod
+    async def _load(cls, name_key: str, foodname: str) -> dict[str, Any]:
+        # 2. DB 조회 (실패시 LLM으로 진행)
+        try:
+            async with cls.session_factory() as db:
+                food = await FoodCrud.get_food_by_key_db(db, name_key)
+        except Exception as e:
+            cls._counters["db_errors"] += 1
+            logger.warning(f"[FoodCache] DB read failed: {name_key}, error: {e}")
+            food = None
+
+        if food is not None:
+            cls._counters["db_hits"] += 1
+            cls._cache.set(name_key, food.nutrition)
+            return food.nutrition
+
+        # 3. LLM 호출 (에러는 캐시하지 않음)
+        cls._counters["llm_calls"] += 1
+        try:
+            nutrition = await AIClient.request_single_analysis(foodname)
+        except Exception:
+            cls._counters["llm_errors"] += 1
+            raise
+
+        # write-through (DB 저장 실패해도 응답은 반환)
+        try:
+            async with cls.session_factory() as db:
+                await FoodCrud.upsert_food_db(db, name_key, foodname, nutrition)
+                await db.commit()
+        except Exception as e:
+            cls._counters["db_errors"] += 1
+            logger.warning(f"[FoodCache] DB write failed: {name_key}, error: {e}")
+
+        cls._cache.set(name_key, nutrition)
+        return nutrition
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        """
+        캐시 hit/miss 현황 (logs 라우터에서 노출)
+        """
+        lookups = (
+            cls._counters["memory_hits"]
+            + cls._counters["db_hits"]
+            + cls._counters["llm_calls"]
+            + cls._counters["shared_waits"]
+        )
+        hits = lookups - cls._counters["llm_calls"]
+        return {
+            **cls._counters,
+            "lookups": lookups,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_size": len(cls._cache),
+            "inflight": len(cls._single_flight),
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        캐시/카운터 초기화 (테스트용)
+        """
+        cls._cache.clear()
+        for key in cls._counters:
+            cls._counters[key] = 0
@@ -0,0 +1,98 @@
+import hashlib
+from typing import Any, Awaitable, Callable
+
+from app.common.cache import TTLCache, SingleFlight
+from app.common.image_executor import ImageExecutor
+from app.common.image_utils import perceptual_hash
+from app.core.settings import settings
+
+# 같은 사진 재업로드(재시도, 재촬영 흐름) 감지 결과 재사용
+# - fingerprint: 리사이즈 결과 bytes sha256 (+ 옵션 perceptual hash)
+# - (user_id, fingerprint) -> (image_id, 파일 확장자, 감지 응답), UPLOAD_DEDUP_WINDOW_SEC 동안 재사용
+# - 같은 사진 동시 업로드는 SingleFlight 로 AI 서버 1회만 호출
+# - 재사용시 AI 호출 / PredictionLog 저장 생략
+
+
+class ImageDedupService:
+    _cache = TTLCache(settings.upload_dedup_maxsize, settings.upload_dedup_window_sec)
+    _single_flight = SingleFlight()
+
+    # 모니터링용 카운터 (프로세스 단위)
+    _counters = {
+        "uploads": 0,
+        "hash_hits": 0,  # sha256 일치
+        "phash_hits": 0,  # perceptual hash 일치 (재인코딩된 같은 사진)
+        "shared_waits": 0,  # 동시 업로드 결과 공유
+        "inference_calls": 0,
+    }
+
+    @staticmethod
+    async def fingerprint(resized_data: bytes) -> list[str]:
+        """
+        fingerprint 목록 (정확도 높은 순)
+        """
+        fingerprints = ["sha256:" + hashlib.sha256(resized_data).hexdigest()]
+        if settings.upload_dedup_phash:
+            phash = await ImageExecutor.run(perceptual_hash, resized_data)
+            fingerprints.append("dhash:" + phash)
+        return fingerprints
+
+    @classmethod
+    def lookup(
+        cls, user_id: int, fingerprints: list[str]
+    ) -> tuple[str, str, dict[str, Any]] | None:
+        """
+        :return: (image_id, file_ext, response) 또는 None
+        """
+        cls._counters["uploads"] += 1
+        for fingerprint in fingerprints:
+            cached = cls._cache.get((user_id, fingerprint))
+            if cached is not None:
+                counter = "hash_hits" if fingerprint.startswith("sha256:") else "phash_hits"
+                cls._counters[counter] += 1
+                return cached
+        return None
+
+    @classmethod
+    async def detect(
+        cls,
+        user_id: int,
+        fingerprints: list[str],
+        detect_fn: Callable[[], Awaitable[tuple[str, str, dict[str, Any]]]],
+    ) -> tuple[tuple[str, str, dict[str, Any]], bool]:
+        """
+        감지 실행 후 결과 저장 (같은 fingerprint 동시 요청은 1회만 실행)
+        :param detect_fn: () -> (image_id, file_ext, response)
+        :return: (결과, shared) shared=True 면 다른 요청의 결과
+        """
+
+        async def run() -> tuple[str, str, dict[str, Any]]:
+            cls._counters["inference_calls"] += 1
+            result = await detect_fn()
+            for fingerprint in fingerprints:
+                cls._cache.set((user_id, fingerprint), result)
+            return result
+
+        result, shared = await cls._single_flight.do((user_id, fingerprints[0]), run)
+        if shared:
+            cls._counters["shared_waits"] += 1
+        return result, shared
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        saved = (
+            cls._counters["hash_hits"]
+            + cls._counters["phash_hits"]
+            + cls._counters["shared_waits"]
+        )
+        return {
+            **cls._counters,
+            "inference_saved": saved,
+            "size": len(cls._cache),
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._cache.clear()
+        for key in cls._counters:
+            cls._counters[key] = 0
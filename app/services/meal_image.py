@@ -11,97 +11,417 @@ from app.db.models.prediction_log import PredictionLog
 # from app.db.models.meal_unused import MealImage
 
 # from app.db.crud.meal_image import MealImageCrud
-from typing import List
+from typing import Callable, List
 from enum import Enum
 from datetime import date
+import asyncio
 import uuid
+from functools import partial
 
-from app.services.file_manager import FileManager
+from app.services.file_manager import (
+    FileManager,
+    UploadTooLarge,
+    UnsupportedImageFormat,
+)
 from app.clients.ai_client import AIClient
+from app.services.image_dedup import ImageDedupService
+from app.services.detection_jobs import DetectionJobQueue, DetectionQueueFull
+from app.services.prediction_log_writer import PredictionLogWriter
+
+
+from app.common.image_utils import resize_image, sniff_image_format, SNIFF_HEADER_SIZE
+from app.common.image_executor import ImageExecutor, ImageExecutorBusy
 
+from app.clients.s3_client import S3Client, S3ObjectTooLarge
+from app.core.settings import settings
 
-from app.common.image_utils import resize_image
 
-from app.clients.s3_client import S3Client
+# magic bytes 판별 포맷 -> (tmp 파일 확장자, content_type)
+IMAGE_FORMAT_TYPES = {
+    "JPEG": ("jpg", "image/jpeg"),
+    "PNG": ("png", "image/png"),
+    "WEBP": ("webp", "image/webp"),
+}
+
+# direct upload 허용 Content-Type
+DIRECT_UPLOAD_CONTENT_TYPES = {"image/jpeg", "image/png", "image/webp"}
 
 
 # Meal Service
 class MealImageService:
     @staticmethod
-    async def upload_tmp_images_to_s3(tmp_image_ids: list[str]) -> list[str]:
+    def tmp_object_key(user_id: int, image_id: str) -> str:
         """
-        임시 이미지 ID 목록을 받아 S3로 업로드하고 URL 리스트를 반환
-        local tmp 파일은 업로드 후 삭제
+        direct upload 임시 객체 key (식단 저장시 meals/ 로 server-side copy)
+        - user_id prefix: presign 발급받은 사용자만 detect / 식단 저장 가능 (image_id 만 알아도 접근 x)
+        """
+        return f"tmp/{user_id}/{image_id}"
+
+    @staticmethod
+    async def upload_tmp_images_to_s3(
+        tmp_image_ids: list[str], user_id: int | None = None
+    ) -> list[str]:
+        """
+        임시 이미지 ID 목록을 받아 S3로 업로드하고 URL 리스트를 반환 (입력 순서 유지)
+        - 동시 업로드 (S3_UPLOAD_CONCURRENCY 제한)
+        - local tmp 파일 없음 + direct upload 사용시 user_id 의 S3 tmp/ 객체를 meals/ 로 server-side copy
+        - tmp 파일/객체는 전체 업로드 성공 후 삭제 (실패시 tmp 유지 -> 재요청 가능, 같은 key 덮어쓰기)
         """
-        image_urls = []
         if not tmp_image_ids:
-            return image_urls
+            return []
 
-        # S3 Client Skeleton (활성화 시 주석 해제)
+        semaphore = asyncio.Semaphore(settings.s3_upload_concurrency)
 
-        for image_id in tmp_image_ids:
+        async def upload_one(image_id: str) -> tuple[Callable, str] | None:
+            object_name = f"meals/{image_id}.jpg"
             try:
                 # 1. 로컬 임시 파일 경로 찾기
                 tmp_path = FileManager.get_tmp_file_path(image_id)
+            except FileNotFoundError:
+                tmp_path = None
 
-                # 2. S3 업로드 (Mocking / Skeleton)
-                s3_url = S3Client.upload_file(tmp_path, f"meals/{image_id}.jpg")
-                image_urls.append(s3_url)
+            # 2. S3 업로드 (threadpool, non-blocking)
+            if tmp_path is not None:
+                async with semaphore:
+                    s3_url = await S3Client.upload_file_async(tmp_path, object_name)
+                return partial(FileManager.delete_tmp_image, tmp_path), s3_url
 
-                # 3. Cleanup: S3 업로드 완료 후 로컬 임시 파일 삭제
-                await FileManager.delete_tmp_image(tmp_path)
+            # 2-1. direct upload: S3 tmp/ -> meals/ (server-side copy)
+            if (
+                settings.s3_direct_upload
+                and user_id is not None
+                and FileManager.is_valid_image_id(image_id)
+            ):
+                tmp_key = MealImageService.tmp_object_key(user_id, image_id)
+                async with semaphore:
+                    s3_url = await S3Client.copy_object_async(tmp_key, object_name)
+                if s3_url:
+                    return partial(S3Client.delete_file_async, tmp_key), s3_url
 
-            except FileNotFoundError:
-                # 파일이 없는 경우 경고 로그 출력 후 진행
-                print(f"Warning: Image file not found for ID {image_id}")
-                continue
+            # 파일이 없는 경우 경고 로그 출력 후 진행
+            print(f"Warning: Image file not found for ID {image_id}")
+            return None
+
+        results = await asyncio.gather(
+            *(upload_one(image_id) for image_id in tmp_image_ids),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
-        return image_urls
+        uploaded = [result for result in results if result is not None]
+
+        # 3. Cleanup: S3 업로드 완료 후 임시 파일/객체 삭제
+        await asyncio.gather(*(cleanup() for cleanup, _ in uploaded))
+
+        return [s3_url for _, s3_url in uploaded]
+
+    @staticmethod
+    async def _resize(content: bytes | str, pil_format: str) -> bytes:
+        """
+        이미지 리사이징 (image_utils) - event loop 밖 실행기에서 처리
+        :param content: 이미지 bytes 또는 spool 파일 경로
+        실행기 대기열 포화시 503 / 디코딩 실패(손상, 잘린 파일)시 400
+        """
+        try:
+            return await ImageExecutor.run(
+                resize_image,
+                content,
+                format=pil_format,
+                fast=settings.image_resize_fast,
+                resample=settings.image_resample,
+                quality=settings.image_jpeg_quality,
+                reducing_gap=settings.image_reducing_gap,
+            )
+        except ImageExecutorBusy:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Image processing is busy. Please retry shortly.",
+                headers={"Retry-After": "1"},
+            )
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid or corrupted image",
+            )
+
+    @staticmethod
+    async def _save_prediction_log(
+        db: AsyncSession, image_id: str, current_user_id: int, response: dict
+    ) -> None:
+        # MLOps 구현용 Prediction Log 저장 (실패해도 메인 로직에는 영향 없도록 예외처리)
+        # writer 실행중이면 큐에 넣고 바로 반환 (별도 세션에서 배치 저장)
+        model_version = "v4"  # TODO: AI response에 버전 포함되면 교체
+        if await PredictionLogWriter.enqueue(
+            image_id, current_user_id, response, model_version
+        ):
+            return
+
+        try:
+            new_log = PredictionLog(
+                image_id=image_id,
+                user_id=current_user_id,
+                raw_response=response,
+                model_version=model_version,
+            )
+            db.add(new_log)
+            await db.commit()
+        except Exception as e:
+            print(f"[PredictionLog Error] Failed to save prediction log: {e}")
+            # 로그 저장은 부가 기능이므로 메인 트랜잭션을 방해하지 않게 롤백?
+            # or 별도 세션 사용? -> 일단 현재 세션 사용하되 에러시 rollback
+            # 하지만 여기서 rollback 하면 메인 로직(있는지 모르겠지만)에도 영향갈 수 있음.
+            # 현재는 SELECT나 INSERT가 위쪽에 없으므로 안전.
+            await db.rollback()
+
+    @staticmethod
+    async def _prepare_upload(file: UploadFile) -> tuple[bytes, str, str]:
+        """
+        업로드 파일 수신 + 리사이즈
+        :return: (resized_data, file_ext, content_type)
+        """
+        if file is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No file uploaded"
+            )
+
+        # 1. 파일 청크 단위 읽기 (크기 제한, magic bytes 포맷 판별, 큰 파일은 디스크 spool)
+        try:
+            upload = await FileManager.spool_upload(
+                file,
+                max_bytes=settings.upload_max_mb * 1024 * 1024,
+                spool_threshold=settings.upload_spool_threshold_kb * 1024,
+                chunk_size=settings.upload_chunk_kb * 1024,
+            )
+        except UploadTooLarge:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=f"File size exceeds limit of {settings.upload_max_mb} MB",
+            )
+        except UnsupportedImageFormat:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Unsupported image format (jpeg, png, webp)",
+            )
+
+        # 확장자/Content-Type 은 파일명이 아닌 실제 포맷 기준
+        file_ext, content_type = IMAGE_FORMAT_TYPES[upload.format]
+        pil_format = "PNG" if upload.format in ["PNG", "WEBP"] else "JPEG"
+
+        # 2. 이미지 리사이징 (image_utils) - event loop 밖 실행기에서 처리
+        try:
+            resized_data = await MealImageService._resize(upload.source, pil_format)
+        finally:
+            await upload.cleanup()
+        return resized_data, file_ext, content_type
 
     @staticmethod
     async def image_detection(db: AsyncSession, file: UploadFile, current_user_id: int):
         """
         이미지 업로드 -> 저장 -> AI 감지 요청
         """
+        resized_data, file_ext, content_type = await MealImageService._prepare_upload(
+            file
+        )
+        return await MealImageService._detect(
+            db, resized_data, file_ext, content_type, current_user_id
+        )
+
+    @staticmethod
+    async def _detect(
+        db: AsyncSession,
+        resized_data: bytes,
+        file_ext: str,
+        content_type: str,
+        current_user_id: int,
+        image_id: str | None = None,
+    ) -> dict:
+        """
+        리사이즈된 이미지 감지 (tmp 저장 -> AI 감지 요청 -> Prediction Log 저장)
+        :param image_id: 미리 발급한 ID (비동기 job 모드), None 이면 새로 생성
+        """
 
-        # 1. 파일 읽기 및 메타데이터 추출
-        content = await file.read()
-        file_ext = file.filename.split(".")[-1].lower() if file.filename else "jpg"
-        content_type = file.content_type or "image/jpeg"
-        pil_format = "PNG" if file_ext in ["png", "webp"] else "JPEG"
+        async def detect_new() -> tuple[str, str, dict]:
+            # 임시 파일 저장 (FileManager) -> AI 감지 요청 (AIClient)
+            new_image_id = image_id or str(uuid.uuid4())
+            await FileManager.save_tmp_image(
+                resized_data, f"{new_image_id}.{file_ext}"
+            )
+            response = await AIClient.request_detection(
+                resized_data, new_image_id, content_type
+            )
+            return new_image_id, file_ext, response
+
+        async def save_issued_image(served_image_id: str) -> None:
+            # 재사용/공유 결과는 다른 image_id -> 미리 발급한 ID(job 응답)로도 tmp 저장
+            # (클라이언트가 job 응답 image_id 로 식단 저장해도 이미지 누락 x)
+            if image_id and image_id != served_image_id:
+                await FileManager.save_tmp_image(resized_data, f"{image_id}.{file_ext}")
+
+        if not settings.upload_dedup_enabled:
+            new_image_id, _, response = await detect_new()
+            await MealImageService._save_prediction_log(
+                db, new_image_id, current_user_id, response
+            )
+            return response
+
+        # 3. 같은 사진 재업로드 -> 이전 감지 결과 재사용 (AI 호출 / PredictionLog 생략)
+        fingerprints = await ImageDedupService.fingerprint(resized_data)
+        cached = ImageDedupService.lookup(current_user_id, fingerprints)
+        if cached is not None:
+            cached_image_id, cached_ext, response = cached
+            # 식단 저장(또는 janitor)으로 tmp 파일이 삭제된 경우 같은 image_id 로 재저장
+            try:
+                FileManager.get_tmp_file_path(cached_image_id)
+            except FileNotFoundError:
+                await FileManager.save_tmp_image(
+                    resized_data, f"{cached_image_id}.{cached_ext}"
+                )
+            await save_issued_image(cached_image_id)
+            return response
+
+        # 4. 임시 파일 저장 + AI 감지 요청 (같은 사진 동시 업로드는 1회만)
+        (new_image_id, _, response), shared = await ImageDedupService.detect(
+            current_user_id, fingerprints, detect_new
+        )
 
-        # 2. 이미지 리사이징 (image_utils)
-        resized_data = resize_image(content, format=pil_format)
+        # 5. Prediction Log 저장 (공유받은 결과는 이미 저장됨)
+        if not shared:
+            await MealImageService._save_prediction_log(
+                db, new_image_id, current_user_id, response
+            )
+        else:
+            await save_issued_image(new_image_id)
+        return response
 
-        # 3. 임시 파일 저장 (FileManager)
+    # --- 비동기 감지 job (업로드 즉시 응답, 감지는 백그라운드 worker) ---
+    @staticmethod
+    async def submit_detection_job(file: UploadFile, current_user_id: int) -> dict:
+        """
+        업로드 수신/리사이즈 후 감지 job 등록 -> job_id, image_id 즉시 반환
+        같은 사진 재업로드로 결과(result.image_id)를 재사용해도 반환한 image_id 로 tmp 저장됨
+        """
+        resized_data, file_ext, content_type = await MealImageService._prepare_upload(
+            file
+        )
         image_id = str(uuid.uuid4())
-        filename = f"{image_id}.{file_ext}"
-        await FileManager.save_tmp_image(resized_data, filename)
+
+        async def run() -> dict:
+            # 요청 세션은 응답 후 닫힘 -> job 전용 세션
+            async with DetectionJobQueue.session_factory() as db:
+                return await MealImageService._detect(
+                    db, resized_data, file_ext, content_type, current_user_id, image_id
+                )
 
         try:
-            # 4. AI 감지 요청 (AIClient)
-            response = await AIClient.request_detection(
-                resized_data, image_id, content_type
+            job = DetectionJobQueue.submit(current_user_id, image_id, run)
+        except DetectionQueueFull:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Detection queue is full. Please retry shortly.",
+                headers={"Retry-After": "1"},
             )
+        return job.to_dict()
 
-            # 5. MLOps 구현용 Prediction Log 저장 (실패해도 메인 로직에는 영향 없도록 예외처리)
+    # --- direct upload (client -> S3 tmp/, API 서버는 이미지 bytes 중계 x) ---
+    @staticmethod
+    def _ensure_direct_upload_enabled() -> None:
+        if not settings.s3_direct_upload:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Direct upload is disabled",
+            )
+
+    @staticmethod
+    async def create_direct_upload(content_type: str, current_user_id: int) -> dict:
+        """
+        S3 tmp/{user_id}/ prefix 로 직접 업로드할 presigned POST 발급
+        - Content-Type / 최대 크기는 POST policy 로 S3가 검증 (실제 포맷은 detect 에서 magic bytes 확인)
+        """
+        MealImageService._ensure_direct_upload_enabled()
+        if content_type not in DIRECT_UPLOAD_CONTENT_TYPES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported content type: {content_type}",
+            )
+
+        image_id = str(uuid.uuid4())
+        max_bytes = settings.s3_direct_upload_max_mb * 1024 * 1024
+        presigned = await S3Client.generate_presigned_post_async(
+            MealImageService.tmp_object_key(current_user_id, image_id),
+            content_type,
+            max_bytes,
+            settings.s3_direct_upload_expire_sec,
+        )
+        return {
+            "image_id": image_id,
+            "url": presigned["url"],
+            "fields": presigned["fields"],
+            "max_bytes": max_bytes,
+            "expires_in": settings.s3_direct_upload_expire_sec,
+        }
+
+    @staticmethod
+    async def direct_image_detection(
+        db: AsyncSession, image_id: str, current_user_id: int
+    ):
+        """
+        S3 tmp/{user_id}/ 에 업로드 완료된 이미지 AI 감지 요청
+        - url   : magic bytes(Range GET) 확인 후 presigned GET url 을 analyze-url 로 전달 (API 서버 bytes 처리 x)
+        - fetch : tmp 객체 다운로드(최대 S3_DIRECT_UPLOAD_MAX_MB) -> magic bytes 확인 -> 리사이즈 -> analyze
+        """
+        MealImageService._ensure_direct_upload_enabled()
+        if not FileManager.is_valid_image_id(image_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid image_id"
+            )
+
+        # 다른 사용자의 image_id 는 key 가 달라 not found
+        tmp_key = MealImageService.tmp_object_key(current_user_id, image_id)
+        not_found = HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Uploaded image not found"
+        )
+        unsupported = HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Unsupported image format (jpeg, png, webp)",
+        )
+
+        if settings.s3_direct_upload_detection == "url":
+            header = await S3Client.read_header_async(tmp_key, SNIFF_HEADER_SIZE)
+            if header is None:
+                raise not_found
+            if sniff_image_format(header) is None:
+                raise unsupported
+            image_url = S3Client.generate_presigned_url(
+                tmp_key, settings.s3_direct_upload_expire_sec
+            )
+            response = await AIClient.request_detection_by_url(image_url, image_id)
+        else:
             try:
-                new_log = PredictionLog(
-                    image_id=image_id,
-                    user_id=current_user_id,
-                    raw_response=response,
-                    model_version="v4",  # TODO: AI response에 버전 포함되면 교체
+                downloaded = await S3Client.download_bytes_async(
+                    tmp_key, max_bytes=settings.s3_direct_upload_max_mb * 1024 * 1024
                 )
-                db.add(new_log)
-                await db.commit()
-            except Exception as e:
-                print(f"[PredictionLog Error] Failed to save prediction log: {e}")
-                # 로그 저장은 부가 기능이므로 메인 트랜잭션을 방해하지 않게 롤백?
-                # or 별도 세션 사용? -> 일단 현재 세션 사용하되 에러시 rollback
-                # 하지만 여기서 rollback 하면 메인 로직(있는지 모르겠지만)에도 영향갈 수 있음.
-                # 현재는 SELECT나 INSERT가 위쪽에 없으므로 안전.
-                await db.rollback()
+            except S3ObjectTooLarge:
+                raise HTTPException(
+                    status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                    detail=f"File size exceeds limit of {settings.s3_direct_upload_max_mb} MB",
+                )
+            if downloaded is None:
+                raise not_found
+            content, _ = downloaded
+            # Content-Type 은 클라이언트가 정한 값 -> 실제 포맷은 magic bytes 기준
+            image_format = sniff_image_format(content[:SNIFF_HEADER_SIZE])
+            if image_format is None:
+                raise unsupported
+            _, content_type = IMAGE_FORMAT_TYPES[image_format]
+            pil_format = "PNG" if image_format in ["PNG", "WEBP"] else "JPEG"
+            resized_data = await MealImageService._resize(content, pil_format)
+            response = await AIClient.request_detection(
+                resized_data, image_id, content_type
+            )
 
-            return response
-        except Exception:
-            raise
+        await MealImageService._save_prediction_log(
+            db, image_id, current_user_id, response
+        )
+        return response
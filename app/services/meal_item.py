@@ -1,30 +1,100 @@
+from fastapi import HTTPException, status
+import asyncio
+import random
+import httpx
+
 from app.clients.ai_client import AIClient
-import uuid
+from app.clients.circuit_breaker import AIServiceUnavailable
+from app.core.settings import settings
+from app.services.food import FoodNutritionService, normalize_food_name
 
 
 class MealItemService:
-    # AIClient.request_analysis 호출하여 음식 리스트에 대한 영양소 분석 및 반환
-    # 음식에대한 영양소개념 < 내가먹은 식단에대한 영양소 스냅샷 개념 #### TODO: food에대한 영양소테이블은 이후 추가
+    # 음식 리스트에 대한 영양소 분석 및 반환 (FoodNutritionService 캐시 -> miss시 LLM)
+    # 음식에대한 영양소개념 < 내가먹은 식단에대한 영양소 스냅샷 개념
 
     @staticmethod
     async def food_analysis(foodnames: list):
         """
-        음식 리스트 -> AI 영양소 분석 요청
-        foodnames: list[AnalysisItem]
+        음식 리스트 -> AI 영양소 분석 요청 (부분 실패 허용)
+        foodnames: list[str]
+        - 요청 내 중복 음식명(정규화 기준)은 1회만 분석
+        - 동시 분석 수 제한 (ANALYSIS_CONCURRENCY), 항목별 timeout + 재시도
+        :return: {"results": [성공 항목, 요청 순서], "errors": [실패 항목]}
         """
-        # 1. 입력 데이터 가공
-        # 프론트엔드에서 전달받은 image_id를 그대로 사용하여 매핑 유지
-        # 1. 입력 데이터 가공
-        # 프론트엔드에서 단순히 문자열 리스트로 오므로 UUID 생성하여 매핑
-        foods_data = [
-            {"id": str(uuid.uuid4()), "food_name": name} for name in foodnames
-        ]
+        unique_names = {}
+        for name in foodnames:
+            unique_names.setdefault(normalize_food_name(name), name)
+
+        semaphore = asyncio.Semaphore(settings.analysis_concurrency)
+
+        async def analyze(name: str):
+            async with semaphore:
+                try:
+                    return await MealItemService._analyze_with_retry(name)
+                except Exception as e:
+                    return e
 
-        # 2. AI 서버 요청 (Analysis)
-        analysis_result = await AIClient.request_analysis(foods_data)
+        outcomes = await asyncio.gather(*(analyze(name) for name in unique_names.values()))
+        by_key = dict(zip(unique_names, outcomes))
 
-        # 3. 결과 반환
-        return analysis_result
+        results, errors = [], []
+        failed_keys = set()
+        for name in foodnames:
+            key = normalize_food_name(name)
+            outcome = by_key[key]
+            if not isinstance(outcome, Exception):
+                results.append(outcome)
+            elif key not in failed_keys:  # 중복 음식명 에러는 1건만
+                failed_keys.add(key)
+                errors.append(MealItemService._to_error(name, outcome))
+
+        # 전부 실패 -> 기존과 동일하게 에러 응답 (AI 서버 차단 상태면 503 + Retry-After)
+        if foodnames and not results:
+            unavailable = [o for o in outcomes if isinstance(o, AIServiceUnavailable)]
+            if len(unavailable) == len(outcomes):
+                raise unavailable[0]
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail={"message": "Nutrition analysis failed", "errors": errors},
+            )
+        return {"results": results, "errors": errors}
+
+    @staticmethod
+    async def _analyze_with_retry(foodname: str) -> dict:
+        """
+        단일 음식 분석 (시도별 timeout, 5xx/timeout 시 jitter backoff 재시도)
+        """
+        attempt = 0
+        timed_out = False
+        while True:
+            try:
+                # timeout 후 재시도: 멈춘 single-flight 조회에 다시 합류하지 않고 새 요청
+                return await asyncio.wait_for(
+                    FoodNutritionService.get_nutrition(foodname, fresh=timed_out),
+                    timeout=settings.analysis_item_timeout_sec,
+                )
+            except Exception as e:
+                if attempt >= settings.analysis_max_retries or not AIClient.is_retryable(e):
+                    raise
+                timed_out = isinstance(e, asyncio.TimeoutError)
+                # full jitter: 0 ~ base * 2^attempt
+                await asyncio.sleep(random.uniform(0, settings.analysis_retry_base_sec * 2**attempt))
+                attempt += 1
+
+    @staticmethod
+    def _to_error(foodname: str, exc: Exception) -> dict:
+        if isinstance(exc, (asyncio.TimeoutError, httpx.TimeoutException)):
+            code = "TIMEOUT"
+        elif isinstance(exc, AIServiceUnavailable):
+            code = "SERVICE_UNAVAILABLE"
+        elif AIClient.is_retryable(exc):
+            code = "UPSTREAM_ERROR"
+        elif isinstance(exc, httpx.HTTPStatusError):
+            code = "CLIENT_ERROR"
+        else:
+            code = "INTERNAL_ERROR"
+        return {"foodname": foodname, "code": code, "detail": str(exc) or type(exc).__name__}
 
     # 음식한개
     @staticmethod
@@ -32,15 +102,11 @@ class MealItemService:
         """
         음식명(Str) -> AI 영양소 분석 요청
         """
-        # 2. AI 서버 요청 (Analysis)
-        analysis_result = await AIClient.request_single_analysis(foodname)
-
-        # 3. 결과 반환
-        return analysis_result
+        # 캐시(메모리 -> foods 테이블) 조회, miss시 LLM 요청 후 저장
+        return await FoodNutritionService.get_nutrition(foodname)
 
-    # TODO: food도메인 추가 후 food tables db저장 로직 추가 필요 (MVP범위) ->
+    # food 도메인: foods 테이블 (정규화 음식명 -> LLM 영양소 JSON), app.services.food 참고
     # 중요 ★☆★☆★☆★☆★☆★☆★☆★☆★☆★☆★☆★☆★☆★☆★☆★☆★☆★☆
-    # food도메인 현재 존재 x
     # Food : 음식별 -영양소, 이름,한글이름, 스냅샷을 정규화한 테이블사용
     # 음식의 표준 영양 정보와 메타데이터를 제공하는 마스터 기준 정보(Master Data)
     # 역할: 중복된 외부 API 호출을 줄이고 데이터 일관성을 유지하기 위한 캐싱 및 기준값 제공
@@ -21,6 +21,7 @@ from app.db.schemas.meal_log import MealLogRead
 from app.db.schemas.meal_log import MealLogCreate, MealLogUpdate
 from app.db.crud.meal_log import MealLogCrud
 from app.services.meal_image import MealImageService
+from app.services.nutrient_rollup import NutrientRollupService
 from app.clients.s3_client import S3Client
 
 # MealLog 저장 매우 복잡
@@ -46,7 +47,7 @@ class MealLogService:
         # 2. 이미지 처리 (tmp -> S3)
         # External Service 호출은 트랜잭션 외부에서 처리하는 것이 좋음 (시간 소요)
         image_urls = await MealImageService.upload_tmp_images_to_s3(
-            meal_create.tmp_image_ids
+            meal_create.tmp_image_ids, current_user_id
         )
 
         # 3. 데이터 준비 (Python Logic)
@@ -67,6 +68,14 @@ class MealLogService:
             # orm객체는 시한부인생임 세션닫히면 사망함
             new_log_id = new_log.id
 
+            # 일별 집계(rollup) 증분 갱신 - 같은 트랜잭션
+            await NutrientRollupService.add_meal(
+                db,
+                current_user_id,
+                meal_create.eaten_at,
+                NutrientRollupService.summarize_items(items_data),
+            )
+
             # 트랜잭션 확정
             await db.commit()
 
@@ -96,6 +105,17 @@ class MealLogService:
         2. 기존 MealItem 전체 삭제
         3. 새 MealItem 전체 생성
         """
+        # 0. 기존 식단 스냅샷 (rollup 차감용) - update 전에 eaten_at/items 확보
+        # row lock: 동시 수정/삭제가 같은 스냅샷을 중복 차감하지 않도록 (commit/rollback 까지 유지)
+        old_log = await MealLogCrud.get_meal_log_by_id_db(db, meal_id, for_update=True)
+        if not old_log or old_log.user_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Meal log not found or permission denied",
+            )
+        old_eaten_at = old_log.eaten_at
+        old_totals = NutrientRollupService.summarize_meal_log(old_log)
+
         # 1. MealLog 업데이트 (메타데이터만)
         # items는 별도 처리하므로 제거
         update_data = update_req.model_dump(
@@ -130,6 +150,17 @@ class MealLogService:
             if new_items_data:
                 await MealLogCrud.create_meal_items_db(db, new_items_data)
 
+            # 일별 집계(rollup) 갱신: 기존 식단 차감 -> 새 식단 가산 (날짜 변경 포함)
+            await NutrientRollupService.remove_meal(
+                db, user_id, old_eaten_at, old_totals
+            )
+            await NutrientRollupService.add_meal(
+                db,
+                user_id,
+                updated_log.eaten_at,
+                NutrientRollupService.summarize_items(new_items_data),
+            )
+
             # 3. 트랜잭션 확정
             await db.commit()
 
@@ -160,15 +191,13 @@ class MealLogService:
 
         # [S3 Permission Fix]
         # DB에 저장된 Public URL은 접근 권한이 없으므로 Presigned URL로 변환하여 반환
-        for log in meal_logs:
-            if log.image_urls:
-                signed_urls = []
-                for url in log.image_urls:
-                    # S3Client에 변환 요청 (S3Client.convert_to_presigned_url)
-                    signed_url = S3Client.convert_to_presigned_url(url)
-                    signed_urls.append(signed_url)
-
-                log.image_urls = signed_urls
+        # 조회 결과 전체 URL 을 한 번에 변환 (같은 key 서명 캐시 재사용)
+        urls = [url for log in meal_logs for url in (log.image_urls or [])]
+        if urls:
+            signed_urls = iter(S3Client.convert_to_presigned_urls(urls))
+            for log in meal_logs:
+                if log.image_urls:
+                    log.image_urls = [next(signed_urls) for _ in log.image_urls]
 
         return meal_logs
 
@@ -180,6 +209,16 @@ class MealLogService:
         - 본인 소유 확인 및 삭제 (CRUD 위임)
         - DB Transaction Commit
         """
+        # 0. 삭제 전 스냅샷 (rollup 차감용) - row lock (update_meal_log 와 동일)
+        old_log = await MealLogCrud.get_meal_log_by_id_db(db, meal_id, for_update=True)
+        if not old_log or old_log.user_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Meal log not found or permission denied",
+            )
+        old_eaten_at = old_log.eaten_at
+        old_totals = NutrientRollupService.summarize_meal_log(old_log)
+
         # 1. 삭제 시도 (CRUD 호출)
         is_deleted = await MealLogCrud.delete_meal_log_db(db, meal_id, user_id)
 
@@ -192,6 +231,9 @@ class MealLogService:
 
         # 3. 변경 확정 (시스템 예외 처리)
         try:
+            await NutrientRollupService.remove_meal(
+                db, user_id, old_eaten_at, old_totals
+            )
             await db.commit()
             return True  # 성공적으로 삭제됨
 
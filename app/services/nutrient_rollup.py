@@ -0,0 +1,129 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime
+
+from app.common.time_utils import local_date
+from app.db.crud.meal_log import MealLogCrud, NUTRIENT_JSON_KEYS
+from app.db.crud.daily_nutrient_rollup import (
+    DailyNutrientRollupCrud,
+    ROLLUP_COLUMNS,
+)
+
+# 일별 영양소 집계(daily_nutrient_rollups) 유지 서비스
+# - MealLogService create/update/delete 트랜잭션 안에서 증분 갱신 (commit은 호출측)
+# - backfill / 정합성 체크 : app.commands.nutrient_rollup
+
+# 정합성 체크 허용오차 (증분 갱신 float 누적오차)
+CONSISTENCY_TOLERANCE = 0.05
+
+
+class NutrientRollupService:
+    @staticmethod
+    def rollup_day(eaten_at: datetime) -> date:
+        """
+        집계 기준 날짜: eaten_at의 APP_TIMEZONE 날짜 (MealLogCrud 날짜 범위/GROUP BY와 동일 기준)
+        """
+        return local_date(eaten_at)
+
+    @staticmethod
+    def summarize_items(items: list[dict]) -> dict:
+        """
+        식단 1건의 음식 항목들 -> 영양소 합계 (quantity 반영)
+        :param items: [{"nutritions": dict | None, "quantity": float}, ...]
+        """
+        totals = {col: 0.0 for col in NUTRIENT_JSON_KEYS}
+        for item in items:
+            nutritions = item.get("nutritions") or {}
+            quantity = item.get("quantity") or 1.0
+            for col, key in NUTRIENT_JSON_KEYS.items():
+                totals[col] += (nutritions.get(key, 0) or 0) * quantity
+        return totals
+
+    @staticmethod
+    def summarize_meal_log(meal_log) -> dict:
+        """
+        MealLog ORM (meal_items 로드됨) -> 영양소 합계
+        """
+        return NutrientRollupService.summarize_items(
+            [
+                {"nutritions": item.nutritions, "quantity": item.quantity}
+                for item in meal_log.meal_items
+            ]
+        )
+
+    # --증분 갱신--
+    @staticmethod
+    async def add_meal(
+        db: AsyncSession, user_id: int, eaten_at: datetime, totals: dict
+    ) -> None:
+        delta = dict(totals, meal_count=1)
+        day = NutrientRollupService.rollup_day(eaten_at)
+        await DailyNutrientRollupCrud.apply_delta_db(db, user_id, day, delta)
+
+    @staticmethod
+    async def remove_meal(
+        db: AsyncSession, user_id: int, eaten_at: datetime, totals: dict
+    ) -> None:
+        delta = {col: -value for col, value in totals.items()}
+        delta["meal_count"] = -1
+        day = NutrientRollupService.rollup_day(eaten_at)
+        await DailyNutrientRollupCrud.apply_delta_db(db, user_id, day, delta)
+
+    # --재계산 (원본 meal_items 기준)--
+    @staticmethod
+    async def recompute_user_rollups(db: AsyncSession, user_id: int) -> dict[date, dict]:
+        """
+        원본 식단 데이터로부터 {day: {column: value}} 재계산 (DB GROUP BY 집계)
+        """
+        rows = await MealLogCrud.aggregate_nutrients_by_day_db(db, user_id)
+        return {
+            row.day: {col: getattr(row, col) for col in ROLLUP_COLUMNS} for row in rows
+        }
+
+    @staticmethod
+    async def backfill_user(db: AsyncSession, user_id: int) -> int:
+        """
+        유저의 집계 row를 원본 기준으로 재생성 후 commit
+        :return: 생성된 row 수
+        """
+        rollups = await NutrientRollupService.recompute_user_rollups(db, user_id)
+        try:
+            await DailyNutrientRollupCrud.replace_user_rollups_db(db, user_id, rollups)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return len(rollups)
+
+    @staticmethod
+    async def find_inconsistencies(db: AsyncSession, user_id: int) -> list[dict]:
+        """
+        저장된 집계 row vs 원본 재계산 결과 비교
+        :return: [{"day", "column", "stored", "expected"}, ...] (빈 리스트 = 정상)
+        """
+        expected = await NutrientRollupService.recompute_user_rollups(db, user_id)
+        stored_rows = await DailyNutrientRollupCrud.get_rollups_by_range_db(
+            db, user_id, date.min, date.max
+        )
+        stored = {
+            row.day: {col: getattr(row, col) for col in ROLLUP_COLUMNS}
+            for row in stored_rows
+        }
+
+        diffs = []
+        for day in sorted(set(expected) | set(stored)):
+            exp_row = expected.get(day, {})
+            stored_row = stored.get(day, {})
+            for col in ROLLUP_COLUMNS:
+                exp_value = exp_row.get(col, 0)
+                stored_value = stored_row.get(col, 0)
+                if abs(exp_value - stored_value) > CONSISTENCY_TOLERANCE:
+                    diffs.append(
+                        {
+                            "day": day,
+                            "column": col,
+                            "stored": stored_value,
+                            "expected": exp_value,
+                        }
+                    )
+        return diffs
+
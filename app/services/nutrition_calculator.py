@@ -1,8 +1,9 @@
+from dataclasses import dataclass, field
 from datetime import date
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.crud.user_profile import UserProfileCrud
-from app.db.crud.user_health_condition import HealthConditionCrud
+from app.db.models.user_profile import UserProfile
 
 
 # 상수 정의
@@ -217,6 +218,57 @@ def check_condition_warnings(
     return warnings
 
 
+# 요청 단위 컨텍스트
+
+
+@dataclass
+class NutritionContext:
+    """
+    요청 단위로 1회 로드하는 사용자 영양 정보 (profile + conditions + 계산된 목표)
+    get_user_target / get_warnings / get_nutrition_advice 에 전달하여 중복 조회 방지
+    """
+
+    profile: UserProfile | None
+    conditions: list[str] = field(default_factory=list)
+    target: dict = field(default_factory=dict)
+
+    @property
+    def goal_type(self) -> str:
+        return (self.profile.goal_type if self.profile else None) or "maintain"
+
+
+def calculate_user_target(profile: UserProfile | None) -> dict:
+    """
+    프로필 기반 목표 영양소 계산 (DB 조회 x)
+
+    Returns:
+        {"calorie": float, "carb": float, "protein": float, "fat": float}
+    """
+    if not profile:
+        # 프로필 없으면 기본값 반환
+        return get_target_macros(2000)
+
+    # 나이 계산
+    age = calculate_age(profile.birthdate) if profile.birthdate else 30
+
+    # BMR 계산
+    bmr = calculate_bmr(
+        gender=profile.gender or "male",
+        weight=profile.weight or 70,
+        height=profile.height or 170,
+        age=age,
+    )
+
+    # TDEE 계산 (v0: 활동량 moderate 고정)
+    tdee = calculate_tdee(bmr, "moderate")
+
+    # 목표 칼로리 계산
+    target_calorie = get_target_calorie(tdee, profile.goal_type or "maintain")
+
+    # 영양소별 목표량 계산
+    return get_target_macros(target_calorie)
+
+
 # 메인 서비스 클래스
 
 
@@ -224,39 +276,35 @@ class NutritionCalculatorService:
     """영양소 계산 및 조언 서비스"""
 
     @staticmethod
-    async def get_user_target(db: AsyncSession, user_id: int) -> dict:
+    async def load_context(db: AsyncSession, user_id: int) -> NutritionContext:
         """
-        사용자의 목표 영양소 계산
-
-        Returns:
-            {"calorie": float, "carb": float, "protein": float, "fat": float}
+        profile + health conditions 단일 JOIN 조회 후 목표 영양소 계산
         """
-        # 사용자 프로필 조회
-        profile = await UserProfileCrud.get_profile_db(db, user_id)
-
-        if not profile:
-            # 프로필 없으면 기본값 반환
-            return get_target_macros(2000)
-
-        # 나이 계산
-        age = calculate_age(profile.birthdate) if profile.birthdate else 30
-
-        # BMR 계산
-        bmr = calculate_bmr(
-            gender=profile.gender or "male",
-            weight=profile.weight or 70,
-            height=profile.height or 170,
-            age=age,
+        profile, conditions = await UserProfileCrud.get_profile_with_conditions_db(
+            db, user_id
+        )
+        return NutritionContext(
+            profile=profile,
+            conditions=conditions,
+            target=calculate_user_target(profile),
         )
 
-        # TDEE 계산 (v0: 활동량 moderate 고정)
-        tdee = calculate_tdee(bmr, "moderate")
+    @staticmethod
+    async def get_user_target(
+        db: AsyncSession, user_id: int, context: NutritionContext | None = None
+    ) -> dict:
+        """
+        사용자의 목표 영양소 계산
 
-        # 목표 칼로리 계산
-        target_calorie = get_target_calorie(tdee, profile.goal_type or "maintain")
+        Args:
+            context: 이미 로드된 컨텍스트 (없으면 조회)
 
-        # 영양소별 목표량 계산
-        return get_target_macros(target_calorie)
+        Returns:
+            {"calorie": float, "carb": float, "protein": float, "fat": float}
+        """
+        if context is None:
+            context = await NutritionCalculatorService.load_context(db, user_id)
+        return context.target
 
     @staticmethod
     async def get_warnings(
@@ -267,6 +315,7 @@ class NutritionCalculatorService:
         protein: float,
         fat: float,
         sodium: float = 0,
+        context: NutritionContext | None = None,
     ) -> list[str]:
         """
         사용자 섭취량 기반 경고 생성
@@ -279,31 +328,26 @@ class NutritionCalculatorService:
             protein: 오늘 단백질 (g)
             fat: 오늘 지방 (g)
             sodium: 오늘 나트륨 (mg)
+            context: 이미 로드된 컨텍스트 (없으면 조회)
 
         Returns:
             경고 코드 리스트
         """
-        warnings = []
-
-        # 사용자 프로필 조회
-        profile = await UserProfileCrud.get_profile_db(db, user_id)
-        goal_type = profile.goal_type if profile else "maintain"
+        if context is None:
+            context = await NutritionCalculatorService.load_context(db, user_id)
 
-        # 목표 칼로리 계산
-        target = await NutritionCalculatorService.get_user_target(db, user_id)
-        target_calorie = target["calorie"]
+        warnings = []
+        target_calorie = context.target["calorie"]
 
         # Goal 기반 경고 체크
-        goal_warnings = check_goal_warnings(goal_type, total_calorie, target_calorie)
+        goal_warnings = check_goal_warnings(
+            context.goal_type, total_calorie, target_calorie
+        )
         warnings.extend(goal_warnings)
 
-        # Condition 조회 (문자열 리스트 반환)
-        condition_list = await HealthConditionCrud.get_all_condition_db(db, user_id)
-        condition_list = condition_list if condition_list else []
-
         # Condition 기반 경고 체크
         condition_warnings = check_condition_warnings(
-            conditions=condition_list,
+            conditions=context.conditions,
             total_calorie=total_calorie,
             target_calorie=target_calorie,
             carb=carb,
@@ -316,7 +360,10 @@ class NutritionCalculatorService:
 
     @staticmethod
     async def get_nutrition_advice(
-        db: AsyncSession, user_id: int, current_intake: dict
+        db: AsyncSession,
+        user_id: int,
+        current_intake: dict,
+        context: NutritionContext | None = None,
     ) -> dict:
         """
         종합 영양 조언 반환 (메인 함수)
@@ -326,6 +373,7 @@ class NutritionCalculatorService:
             user_id: 사용자 ID
             current_intake: 현재 섭취량
                 {"calorie": float, "carb": float, "protein": float, "fat": float, "sodium": float}
+            context: 이미 로드된 컨텍스트 (없으면 1회 조회 후 재사용)
 
         Returns:
             {
@@ -334,8 +382,13 @@ class NutritionCalculatorService:
                 "warnings": [str, ...]
             }
         """
+        if context is None:
+            context = await NutritionCalculatorService.load_context(db, user_id)
+
         # 목표 영양소 계산
-        target = await NutritionCalculatorService.get_user_target(db, user_id)
+        target = await NutritionCalculatorService.get_user_target(
+            db, user_id, context=context
+        )
 
         # 경고 생성
         warnings = await NutritionCalculatorService.get_warnings(
@@ -346,6 +399,7 @@ class NutritionCalculatorService:
             protein=current_intake.get("protein", 0),
             fat=current_intake.get("fat", 0),
             sodium=current_intake.get("sodium", 0),
+            context=context,
         )
 
         return {"target": target, "current": current_intake, "warnings": warnings}
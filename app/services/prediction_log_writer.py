@@ -0,0 +1,153 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.settings import settings
+from app.db.database import AsyncSessionLocal
+from app.db.models.prediction_log import PredictionLog
+
+logger = logging.getLogger(__name__)
+
+# PredictionLog 배치 저장 (업로드 응답 경로에서 DB 왕복/commit 제거)
+# - 요청은 큐에 넣고 바로 반환, writer task 가 N건 / T ms 단위로 모아 별도 세션에서 bulk INSERT
+# - 큐 포화시 최대 PREDICTION_LOG_ENQUEUE_TIMEOUT_SEC 대기(backpressure) 후 drop (부가 기능 -> 업로드 우선)
+# - 같은 image_id 중복은 ON CONFLICT DO NOTHING (배치 전체 실패 방지)
+# - main.py lifespan 에서 startup/shutdown (shutdown 시 남은 로그 모두 저장)
+# - writer 미실행(CLI, 단독 테스트)이면 enqueue 가 False -> 호출측에서 기존처럼 직접 저장
+
+
+class PredictionLogWriter:
+    _queue: asyncio.Queue | None = None
+    _task: asyncio.Task | None = None
+    _batch_size: int = 1
+    _flush_sec: float = 0.0
+    session_factory = AsyncSessionLocal
+    _counters = {
+        "enqueued": 0,
+        "written": 0,
+        "batches": 0,
+        "failed_batches": 0,
+        "failed_rows": 0,
+        "dropped": 0,
+    }
+
+    # --lifecycle-- main.py lifespan에서 호출
+    @classmethod
+    def startup(
+        cls,
+        batch_size: int | None = None,
+        flush_ms: float | None = None,
+        max_queue: int | None = None,
+    ) -> None:
+        if cls._queue is not None:
+            return
+        cls._batch_size = batch_size or settings.prediction_log_batch_size
+        cls._flush_sec = (
+            settings.prediction_log_flush_ms if flush_ms is None else flush_ms
+        ) / 1000
+        cls._queue = asyncio.Queue(maxsize=max_queue or settings.prediction_log_max_queue)
+        cls._task = asyncio.create_task(cls._loop(cls._queue), name="prediction-log-writer")
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """
+        큐에 남은 로그 저장 후 종료
+        """
+        if cls._queue is None:
+            return
+        queue, cls._queue = cls._queue, None  # 이후 enqueue 는 직접 저장으로 fallback
+        await queue.put(None)  # 종료 신호 (앞서 들어온 로그는 모두 저장)
+        await cls._task
+        cls._task = None
+
+    @classmethod
+    async def enqueue(
+        cls,
+        image_id: str,
+        user_id: int,
+        raw_response: dict,
+        model_version: str | None,
+    ) -> bool:
+        """
+        :return: 큐 등록(또는 포화로 drop) 여부, writer 미실행이면 False
+        """
+        queue = cls._queue
+        if queue is None:
+            return False
+        row = {
+            "image_id": image_id,
+            "user_id": user_id,
+            "raw_response": raw_response,
+            "model_version": model_version,
+            "created_at": datetime.now(timezone.utc),
+        }
+        try:
+            await asyncio.wait_for(queue.put(row), settings.prediction_log_enqueue_timeout_sec)
+        except asyncio.TimeoutError:
+            cls._counters["dropped"] += 1
+            logger.warning(f"[PredictionLog] queue full, dropped: {image_id}")
+            return True
+        cls._counters["enqueued"] += 1
+        return True
+
+    @classmethod
+    async def _loop(cls, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await queue.get()
+            if first is None:
+                break
+            rows = [first]
+            deadline = loop.time() + cls._flush_sec
+            while len(rows) < cls._batch_size:
+                remaining = deadline - loop.time()
+                try:
+                    row = (
+                        queue.get_nowait()
+                        if remaining <= 0 or not queue.empty()
+                        else await asyncio.wait_for(queue.get(), remaining)
+                    )
+                except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                rows.append(row)
+            await cls._write(rows)
+
+    @classmethod
+    async def _write(cls, rows: list[dict[str, Any]]) -> None:
+        # INSERT ... VALUES (...), (...), ... 1회 + commit 1회
+        statement = (
+            insert(PredictionLog)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["image_id"])
+        )
+        try:
+            async with cls.session_factory() as db:
+                await db.execute(statement)
+                await db.commit()
+        except Exception as e:
+            cls._counters["failed_batches"] += 1
+            cls._counters["failed_rows"] += len(rows)
+            logger.warning(f"[PredictionLog] batch write failed: {len(rows)} rows, error: {e}")
+            return
+        cls._counters["batches"] += 1
+        cls._counters["written"] += len(rows)
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        return {
+            "running": cls._queue is not None,
+            "pending": cls._queue.qsize() if cls._queue is not None else 0,
+            **cls._counters,
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        for key in cls._counters:
+            cls._counters[key] = 0
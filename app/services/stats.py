@@ -1,7 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date, timedelta, datetime
 from typing import List, Dict
-from app.db.crud.meal_log import MealLogCrud
+from app.db.crud.meal_log import MealLogCrud, NUTRIENT_JSON_KEYS
+from app.db.crud.daily_nutrient_rollup import DailyNutrientRollupCrud
 from app.services.user_profile import UserProfileService
 from app.db.schemas.stats import (
     StatsResponse,
@@ -52,15 +53,18 @@ class StatsService:
     def aggregate_nutrients(meal_logs, divisor: int = 1) -> Nutrients:
         """
         식단 로그들로부터 영양소 합계 계산 및 평균화
+        - Python(ORM) 기준 구현: stats 엔드포인트는 SQL 집계 사용, parity test 기준값으로 유지
         """
-        total_carbs = 0.0
-        total_protein = 0.0
-        total_fat = 0.0
-        total_sugar = 0.0
-        total_fiber = 0.0
-        total_sodium = 0.0
-        total_cholesterol = 0.0
-        total_saturated_fat = 0.0
+        totals = {
+            "carbs": 0.0,
+            "protein": 0.0,
+            "fat": 0.0,
+            "sugar": 0.0,
+            "fiber": 0.0,
+            "sodium": 0.0,
+            "cholesterol": 0.0,
+            "saturated_fat": 0.0,
+        }
 
         # 모든 식단 로그와 그 안의 음식 항목들을 순회하며 영양소 합산
         for log in meal_logs:
@@ -68,14 +72,37 @@ class StatsService:
                 nutritions = item.nutritions or {}
                 quantity = item.quantity or 1.0
                 # intake(quantity) 값을 반영하여 합산
-                total_carbs += nutritions.get("carbs_g", 0) * quantity
-                total_protein += nutritions.get("protein_g", 0) * quantity
-                total_fat +=nutritions.get("fat_g", 0) * quantity
-                total_sugar += nutritions.get("sugar_g", 0) * quantity
-                total_fiber +=  nutritions.get("fiber_g", 0) * quantity
-                total_sodium += nutritions.get("sodium_mg", 0) * quantity
-                total_cholesterol += nutritions.get("cholesterol_mg", 0) * quantity
-                total_saturated_fat +=nutritions.get("saturated_fat_g", 0) * quantity
+                totals["carbs"] += nutritions.get("carbs_g", 0) * quantity
+                totals["protein"] += nutritions.get("protein_g", 0) * quantity
+                totals["fat"] += nutritions.get("fat_g", 0) * quantity
+                totals["sugar"] += nutritions.get("sugar_g", 0) * quantity
+                totals["fiber"] += nutritions.get("fiber_g", 0) * quantity
+                totals["sodium"] += nutritions.get("sodium_mg", 0) * quantity
+                totals["cholesterol"] += nutritions.get("cholesterol_mg", 0) * quantity
+                totals["saturated_fat"] += nutritions.get("saturated_fat_g", 0) * quantity
+
+        return StatsService.build_nutrients(totals, divisor)
+
+    @staticmethod
+    def sum_nutrient_rows(rollups) -> dict:
+        """
+        집계 row들의 영양소 합계
+        - DailyNutrientRollup ORM / MealLogCrud.aggregate_* tuple 모두 지원 (컬럼명 동일)
+        """
+        totals = {col: 0.0 for col in NUTRIENT_JSON_KEYS}
+        for row in rollups:
+            for col in NUTRIENT_JSON_KEYS:
+                totals[col] += getattr(row, col) or 0.0
+        return totals
+
+    @staticmethod
+    def build_nutrients(totals: dict, divisor: int = 1) -> Nutrients:
+        """
+        영양소 합계(dict) -> 탄단지 비율 계산 및 divisor(일수) 평균화
+        """
+        total_carbs = totals["carbs"]
+        total_protein = totals["protein"]
+        total_fat = totals["fat"]
 
         # 탄단지 비율 계산
         total_macro = total_carbs + total_protein + total_fat
@@ -91,11 +118,11 @@ class StatsService:
             carbs=NutrientDetail(amount=round(total_carbs / divisor, 1), percentage=round(carbs_pct, 1)),
             protein=NutrientDetail(amount=round(total_protein / divisor, 1), percentage=round(protein_pct, 1)),
             fat=NutrientDetail(amount=round(total_fat / divisor, 1), percentage=round(fat_pct, 1)),
-            sugar=round(total_sugar / divisor, 1),
-            fiber=round(total_fiber / divisor, 1),
-            sodium=round(total_sodium / divisor, 1),
-            cholesterol=round(total_cholesterol / divisor, 1),
-            saturated_fat=round(total_saturated_fat / divisor, 1)
+            sugar=round(totals["sugar"] / divisor, 1),
+            fiber=round(totals["fiber"] / divisor, 1),
+            sodium=round(totals["sodium"] / divisor, 1),
+            cholesterol=round(totals["cholesterol"] / divisor, 1),
+            saturated_fat=round(totals["saturated_fat"] / divisor, 1)
         )
 
     @staticmethod
@@ -103,29 +130,25 @@ class StatsService:
         """
         일간 통계 조회
         """
-        # 해당 날짜의 모든 식단 로그 조회
-        meal_logs = await MealLogCrud.get_meal_logs_db(db, user_id, target_date)
+        # 해당 날짜의 식단별 영양소 합계 조회 (DB 집계, ORM 로드 x)
+        log_rows = await MealLogCrud.aggregate_nutrients_by_meal_log_db(db, user_id, target_date, target_date)
         goal_calories = await StatsService.calculate_goal_calories(db, user_id)
         nutrient_goals = StatsService.get_nutrient_goals(goal_calories)
         
         # 영양소 합계 계산
-        nutrients = StatsService.aggregate_nutrients(meal_logs, divisor=1)
-        total_calories = sum(
-            sum(item.nutritions.get("calories", 0) * (item.quantity or 1.0) for item in log.meal_items if item.nutritions)
-            for log in meal_logs
-        )
+        totals = StatsService.sum_nutrient_rows(log_rows)
+        nutrients = StatsService.build_nutrients(totals, divisor=1)
+        total_calories = totals["calories"]
 
         # 프론트엔드 표시용 개별 식단 로그 리스트 생성
         daily_logs = []
-        for log in meal_logs:
-            log_calories = sum(item.nutritions.get("calories", 0) * (item.quantity or 1.0) for item in log.meal_items if item.nutritions)
-            name = ", ".join([item.foodname for item in log.meal_items])
+        for row in log_rows:
             daily_logs.append(DailyLogItem(
-                id=log.id,
-                mealType=log.meal_type,
-                timestamp=log.eaten_at.strftime("%H:%M"),
-                name=name,
-                calories=round(log_calories, 1)
+                id=row.id,
+                mealType=row.meal_type,
+                timestamp=row.eaten_at.strftime("%H:%M"),
+                name=row.name,
+                calories=round(row.calories, 1)
             ))
 
         return StatsResponse(
@@ -145,8 +168,8 @@ class StatsService:
         """
         # 7일간의 시작 날짜 계산
         start_date = end_date - timedelta(days=6)
-        # 기간 내 모든 식단 로그 조회
-        meal_logs = await MealLogCrud.get_meal_logs_by_range_db(db, user_id, start_date, end_date)
+        # 기간 내 일별 집계 row 조회 (최대 7row)
+        rollups = await DailyNutrientRollupCrud.get_rollups_by_range_db(db, user_id, start_date, end_date)
         goal_calories = await StatsService.calculate_goal_calories(db, user_id)
         nutrient_goals = StatsService.get_nutrient_goals(goal_calories)
         
@@ -160,18 +183,13 @@ class StatsService:
             divisor = 7
 
         # 평균 영양소 계산
-        nutrients = StatsService.aggregate_nutrients(meal_logs, divisor=divisor)
-        total_calories = sum(
-            sum(item.nutritions.get("calories", 0) * (item.quantity or 1.0) for item in log.meal_items if item.nutritions)
-            for log in meal_logs
-        )
+        totals = StatsService.sum_nutrient_rows(rollups)
+        nutrients = StatsService.build_nutrients(totals, divisor=divisor)
+        total_calories = totals["calories"]
 
         # 차트 데이터 생성 (7일치 일별 칼로리)
         chart_data = []
-        logs_by_date = {}
-        for log in meal_logs:
-            d = log.eaten_at.date()
-            logs_by_date[d] = logs_by_date.get(d, 0) + sum(item.nutritions.get("calories", 0) * (item.quantity or 1.0) for item in log.meal_items if item.nutritions)
+        logs_by_date = {row.day: row.calories for row in rollups}
 
         for i in range(7):
             current = start_date + timedelta(days=i)
@@ -202,8 +220,8 @@ class StatsService:
         start_date = date(year, month, 1)
         end_date = date(year, month, last_day)
         
-        # 월간 모든 식단 로그 조회
-        meal_logs = await MealLogCrud.get_meal_logs_by_range_db(db, user_id, start_date, end_date)
+        # 월간 일별 집계 row 조회 (최대 31row)
+        rollups = await DailyNutrientRollupCrud.get_rollups_by_range_db(db, user_id, start_date, end_date)
         goal_calories = await StatsService.calculate_goal_calories(db, user_id)
         nutrient_goals = StatsService.get_nutrient_goals(goal_calories)
         
@@ -217,18 +235,16 @@ class StatsService:
             divisor = last_day
 
         # 월 평균 영양소 계산
-        nutrients = StatsService.aggregate_nutrients(meal_logs, divisor=divisor)
-        total_calories = sum(
-            sum(item.nutritions.get("calories", 0) * (item.quantity or 1.0) for item in log.meal_items if item.nutritions)
-            for log in meal_logs
-        )
+        totals = StatsService.sum_nutrient_rows(rollups)
+        nutrients = StatsService.build_nutrients(totals, divisor=divisor)
+        total_calories = totals["calories"]
 
         # 차트 데이터 생성 (주차별 평균 칼로리)
         chart_data = []
         weeks = [0.0, 0.0, 0.0, 0.0]
-        for log in meal_logs:
-            day = log.eaten_at.day
-            calories = sum(item.nutritions.get("calories", 0) * (item.quantity or 1.0) for item in log.meal_items if item.nutritions)
+        for row in rollups:
+            day = row.day.day
+            calories = row.calories
             if day <= 7: weeks[0] += calories
             elif day <= 14: weeks[1] += calories
             elif day <= 21: weeks[2] += calories
@@ -0,0 +1,175 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.settings import settings
+from app.services.file_manager import FileManager
+
+# 고아 tmp 이미지 정리 (업로드 후 식단 저장 안 된 파일)
+# - TTL 초과 파일 삭제
+# - 남은 파일 총 용량이 quota 초과시 오래된 파일부터 삭제 (LRU)
+# - main.py lifespan 에서 주기 실행 / cron 용 one-shot: python -m app.commands.tmp_janitor
+
+
+class TmpJanitor:
+    _task: asyncio.Task | None = None
+    _last_run: dict[str, Any] | None = None
+    _totals = {"runs": 0, "deleted_files": 0, "reclaimed_bytes": 0, "errors": 0}
+
+    @staticmethod
+    def _scan(temp_dir: str) -> list[tuple[str, float, int]]:
+        """
+        TEMP_DIR (shard 하위 디렉토리 포함) 파일 목록 -> (path, mtime, size)
+        """
+        entries = []
+        stack = [temp_dir]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                stat = entry.stat(follow_symlinks=False)
+                                entries.append((entry.path, stat.st_mtime, stat.st_size))
+                        except FileNotFoundError:
+                            continue  # scan 도중 삭제됨 (식단 저장 완료)
+            except FileNotFoundError:
+                continue
+        return entries
+
+    @staticmethod
+    def sweep(
+        ttl_sec: float | None = None,
+        quota_bytes: int | None = None,
+        dry_run: bool = False,
+        now: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        tmp 파일 1회 정리 (blocking, threadpool/CLI 에서 실행)
+        - tmp 파일은 저장 후 수정/재사용되지 않으므로 mtime 을 마지막 사용 시각으로 봄
+        :return: 실행 통계
+        """
+        ttl_sec = settings.tmp_image_ttl_sec if ttl_sec is None else ttl_sec
+        quota_bytes = (
+            settings.tmp_quota_mb * 1024 * 1024 if quota_bytes is None else quota_bytes
+        )
+        started = time.perf_counter()
+        now = time.time() if now is None else now
+
+        entries = sorted(TmpJanitor._scan(FileManager.TEMP_DIR), key=lambda e: e[1])
+        stats = {
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "dry_run": dry_run,
+            "scanned_files": len(entries),
+            "expired_files": 0,
+            "evicted_files": 0,
+            "reclaimed_bytes": 0,
+            "errors": 0,
+        }
+
+        def remove(path: str, size: int, reason: str) -> bool:
+            if not dry_run:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    return False  # 이미 처리됨 (S3 업로드 후 삭제)
+                except OSError as e:
+                    print(f"[TmpJanitor] Failed to delete {path}: {e}")
+                    stats["errors"] += 1
+                    return False
+            stats[reason] += 1
+            stats["reclaimed_bytes"] += size
+            return True
+
+        # 1. TTL 초과 삭제
+        remaining = []
+        for path, mtime, size in entries:
+            if now - mtime > ttl_sec:
+                if not remove(path, size, "expired_files"):
+                    remaining.append((path, mtime, size))
+            else:
+                remaining.append((path, mtime, size))
+
+        # 2. quota 초과분 오래된 파일부터 삭제
+        total_bytes = sum(size for _, _, size in remaining)
+        kept = []
+        for index, (path, mtime, size) in enumerate(remaining):
+            if total_bytes <= quota_bytes:
+                kept.extend(remaining[index:])
+                break
+            if remove(path, size, "evicted_files"):
+                total_bytes -= size
+            else:
+                kept.append((path, mtime, size))
+
+        stats["remaining_files"] = len(kept)
+        stats["remaining_bytes"] = sum(size for _, _, size in kept)
+        stats["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return stats
+
+    @classmethod
+    async def run_once(cls) -> dict[str, Any]:
+        stats = await run_in_threadpool(cls.sweep)
+        cls._last_run = stats
+        cls._totals["runs"] += 1
+        cls._totals["deleted_files"] += stats["expired_files"] + stats["evicted_files"]
+        cls._totals["reclaimed_bytes"] += stats["reclaimed_bytes"]
+        cls._totals["errors"] += stats["errors"]
+        if stats["expired_files"] or stats["evicted_files"]:
+            print(
+                f"[TmpJanitor] expired={stats['expired_files']} evicted={stats['evicted_files']} "
+                f"reclaimed={stats['reclaimed_bytes']}B remaining={stats['remaining_files']}"
+            )
+        return stats
+
+    @classmethod
+    async def _loop(cls, interval_sec: float) -> None:
+        while True:
+            try:
+                await cls.run_once()
+            except Exception as e:
+                # 정리 실패가 앱에 영향 x, 다음 주기에 재시도
+                cls._totals["errors"] += 1
+                print(f"[TmpJanitor] sweep failed: {e}")
+            await asyncio.sleep(interval_sec)
+
+    # --lifecycle-- main.py lifespan에서 호출
+    @classmethod
+    def startup(cls, interval_sec: float | None = None) -> None:
+        if cls._task is not None or not settings.tmp_janitor_enabled:
+            return
+        interval_sec = (
+            settings.tmp_janitor_interval_sec if interval_sec is None else interval_sec
+        )
+        cls._task = asyncio.create_task(cls._loop(interval_sec), name="tmp-janitor")
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        task, cls._task = cls._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        return {
+            "running": cls._task is not None,
+            "last_run": cls._last_run,
+            **cls._totals,
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._last_run = None
+        for key in cls._totals:
+            cls._totals[key] = 0
@@ -1,8 +1,9 @@
 from fastapi import HTTPException, status
 from app.db.schemas.user import UserCreate, UserUpdate, UserLogin
 from app.core.jwt_context import (
-    get_pwd_hash,
-    verify_pwd,
+    get_pwd_hash_async,
+    verify_pwd_async,
+    pwd_needs_rehash,
     create_access_token,
     create_refresh_token,
     verify_token,
@@ -12,12 +13,14 @@ from app.core.jwt_context import (
 # from app.core.security import hash_password # security.py 파일 만든뒤 활성화
 from app.db.models.user import User
 from app.db.crud.user import UserCrud
+from app.core.auth import invalidate_current_user
 from app.db.schemas.user import (
     PasswordUpdate,
 )  # TODO: 왜 routers로 연결됐는데 정상작동됐는지 체크필요
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
@@ -28,6 +31,26 @@ from datetime import datetime
 
 # Service = Business Logic / db transaction 관리(commit/rollback/refresh)
 
+EMAIL_TAKEN = "이미 사용중인 이메일입니다"
+USERNAME_TAKEN = "이미 사용중인 이름입니다"
+
+# unique 제약조건 이름 -> 400 메시지 (users_email_key / uq_users_email_lower ...)
+_UNIQUE_VIOLATION_DETAILS = (
+    ("email", EMAIL_TAKEN),
+    ("username", USERNAME_TAKEN),
+    ("phone", "이미 사용중인 전화번호입니다"),
+)
+
+
+def _unique_violation(e: IntegrityError) -> HTTPException | None:
+    # asyncpg UniqueViolationError.constraint_name (없으면 에러 메시지에서 판별)
+    cause = getattr(e.orig, "__cause__", None)
+    constraint = getattr(cause, "constraint_name", None) or str(e.orig)
+    for column, detail in _UNIQUE_VIOLATION_DETAILS:
+        if column in constraint:
+            return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+    return None
+
 
 class UserService:
     # 회원가입 (비밀번호 해시 후 저장)
@@ -37,26 +60,24 @@ class UserService:
     async def register_user(
         db: AsyncSession, email: str, username: str, password: str, nickname: str
     ):
-        # 중복 이메일 체크
-        existing_email = await UserCrud.get_user_by_email(db, email)
-        if existing_email:
+        # 중복 이메일/username 체크 (1회 조회) -> 중복이면 bcrypt 해시 전에 차단
+        # 동시 가입 race 는 unique index 가 막음 -> 아래 IntegrityError 처리
+        email_taken, username_taken = await UserCrud.get_signup_conflicts(
+            db, email, username
+        )
+        if email_taken:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 사용중인 이메일입니다",
+                status_code=status.HTTP_400_BAD_REQUEST, detail=EMAIL_TAKEN
             )
-
-        # 중복 username 체크
-        existing_username = await UserCrud.get_user_by_username(db, username)
-        if existing_username:
+        if username_taken:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 사용중인 이름입니다",
+                status_code=status.HTTP_400_BAD_REQUEST, detail=USERNAME_TAKEN
             )
 
         # TODO : 닉네임 중복처리는 나중에..
 
         # password hasing
-        hashed_pw = get_pwd_hash(password)  # nickname입력안하면 username
+        hashed_pw = await get_pwd_hash_async(password)  # nickname입력안하면 username
         user_create = UserCreate(
             email=email,
             username=username,
@@ -71,6 +92,10 @@ class UserService:
             await db.refresh(db_user)  #
             return db_user
 
+        except IntegrityError as e:
+            await db.rollback()
+            raise _unique_violation(e) or e
+
         except Exception:
             await db.rollback()
             raise
@@ -103,14 +128,8 @@ class UserService:
         # patch(요청에서 전달된 필드만 업데이트)
         update_user = user.model_dump(exclude_unset=True)
 
-        # http 500 err 예외처리
-        # 중복 이메일 체크(본인제외) (db예외 터지기전 비지니스로직위반 차단)
-        # update_user는 dict 이므로 keyname으로 조건분기, obj chain x (user.email)
-        # obj형태 chaining 불가 -> dict로 변경여부 체크해야함
-        if "email" in update_user:
-            existing = await UserCrud.get_user_by_email(db, update_user["email"])
-            if existing and existing.id != current_user_id:
-                raise HTTPException(400, "이미 사용중인 이메일입니다")
+        # 중복 이메일/전화번호: 별도 조회 x, unique 제약 위반(IntegrityError) -> 400
+        # (조회 후 update 사이 race 없음, 본인 값 그대로 보내도 충돌 x)
 
         # username = login_id : immutable 예외처리없이 응답필드 삭제예정 우선 기능동작확인만
 
@@ -128,29 +147,39 @@ class UserService:
 
             # db쓰기 확정 / refresh
             await db.commit()
+            invalidate_current_user(current_user_id)  # get_current_user 캐시 갱신
             await db.refresh(updated_user)
             return updated_user
 
+        except IntegrityError as e:
+            await db.rollback()
+            raise _unique_violation(e) or e
+
         except Exception:
             await db.rollback()
             raise
 
     # update pw : 보안문제 생각 + 편의성
     @staticmethod
-    async def update_pw(db: AsyncSession, current_user, pw_data: PasswordUpdate):
+    async def update_pw(db: AsyncSession, current_user_id: int, pw_data: PasswordUpdate):
+        # get_current_user 는 캐시된 정보(password 미포함) -> 비밀번호 검증용 DB 조회
+        db_user = await UserCrud.get_user_by_id(db, current_user_id)
+        if not db_user:
+            raise HTTPException(404, "Not found")
 
         # 비밀번호 변경 권한검증(본인인지 old_pw기준으로)
-        if not verify_pwd(pw_data.old_password, current_user.password):
+        if not await verify_pwd_async(pw_data.old_password, db_user.password):
             raise HTTPException(400, "old pw incorrect")
 
         # 새 비밀번호 hash
-        new_pw_hashed = get_pwd_hash(pw_data.new_password)
+        new_pw_hashed = await get_pwd_hash_async(pw_data.new_password)
 
-        current_user.password = new_pw_hashed
+        db_user.password = new_pw_hashed
 
         # db반영
         await db.commit()
-        await db.refresh(current_user)
+        invalidate_current_user(current_user_id)
+        await db.refresh(db_user)
 
         return None
 
@@ -163,6 +192,7 @@ class UserService:
                 raise HTTPException(status_code=404, detail="없는 회원 입니다")
             
             await db.commit()
+            invalidate_current_user(user_id)  # 탈퇴 유저 캐시 인증 차단
             return True
 
         except Exception:
@@ -187,12 +217,17 @@ class UserService:
                 status_code=400, detail="이메일 또는 아이디를 확인해주세요"
             )
         # 비밀번호 불일치 시
-        if not verify_pwd(user.password, db_user.password):
+        if not await verify_pwd_async(user.password, db_user.password):
             raise HTTPException(status_code=401, detail="비밀번호를 확인해주세요")
 
+        # cost(BCRYPT_ROUNDS) 변경 전 해시 -> 평문을 아는 지금 재해시 (실패해도 로그인은 진행)
+        user_id = db_user.id  # commit/rollback 후 expire 되어도 token 발급 가능하도록
+        if pwd_needs_rehash(db_user.password):
+            await UserService._rehash_pw(db, db_user, user.password)
+
         # token
-        access_token = create_access_token(db_user.id)
-        refresh_token = create_refresh_token(db_user.id)
+        access_token = create_access_token(user_id)
+        refresh_token = create_refresh_token(user_id)
 
         return db_user, access_token, refresh_token
 
@@ -204,6 +239,19 @@ class UserService:
         # await db.commit() 로그인과정에서 뭔가를DB에 변경 했을때만필요(refresh_token rotation)
         # await db.refresh(db_user)
 
+    @staticmethod
+    async def _rehash_pw(db: AsyncSession, db_user: User, password: str) -> None:
+        # commit/rollback 시 db_user expire (expire_on_commit) -> 응답 직렬화 전 refresh 필수
+        # (AsyncSession 에서 expire 된 속성 lazy load 는 MissingGreenlet)
+        user_id = db_user.id
+        try:
+            db_user.password = await get_pwd_hash_async(password)
+            await db.commit()
+        except Exception as e:
+            print(f"[Rehash Error] user_id={user_id}: {e}")
+            await db.rollback()
+        await db.refresh(db_user)
+
     # refresh_token
     # (별도 endpoints용 ) -별도유지 or rotation 적용하면 삭제
     @staticmethod
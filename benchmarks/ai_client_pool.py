@@ -0,0 +1,120 @@
+"""
+AIClient 커넥션 풀 벤치마크 (로컬 stub AI 서버)
+
+사용법:
+    python -m benchmarks.ai_client_pool [--requests 200] [--concurrency 10] [--delay-ms 5]
+
+- before : 요청마다 httpx.AsyncClient 새로 생성 (기존 방식)
+- after  : AIClient 공유 client (keep-alive 커넥션 재사용)
+- 측정   : 요청 latency p50/p99, stub 서버가 받은 TCP 커넥션 수
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import threading
+import time
+
+import httpx
+import uvicorn
+from dotenv import load_dotenv
+from fastapi import FastAPI, Request
+
+load_dotenv(dotenv_path=".env")
+load_dotenv(dotenv_path=".env.example")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def build_stub_app(delay_sec: float, connections: set) -> FastAPI:
+    stub = FastAPI()
+
+    @stub.post("/nutrition")
+    async def nutrition(request: Request):
+        connections.add(request.client.port)  # client port = TCP 커넥션 식별
+        await asyncio.sleep(delay_sec)
+        return {"food_name": "stub", "nutritions": {"calories": 100}}
+
+    return stub
+
+
+def start_stub_server(port: int, delay_sec: float, connections: set) -> uvicorn.Server:
+    config = uvicorn.Config(
+        build_stub_app(delay_sec, connections), host="127.0.0.1", port=port, log_level="error"
+    )
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+async def run(call, total: int, concurrency: int) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(total)))
+    return latencies
+
+
+def report(label: str, latencies: list[float], elapsed: float, connections: int) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<7} requests={len(ordered)} total={elapsed:.2f}s "
+        f"p50={statistics.median(ordered):.2f}ms p99={p99:.2f}ms connections={connections}"
+    )
+
+
+async def main(total: int, concurrency: int, delay_ms: float) -> None:
+    port = _free_port()
+    os.environ["AI_SERVICE_URL"] = f"http://127.0.0.1:{port}"
+
+    # AI_SERVICE_URL 설정 후 import (settings 로드 시점)
+    from app.clients.ai_client import AIClient
+    from app.core.settings import settings
+
+    connections: set = set()
+    server = start_stub_server(port, delay_ms / 1000, connections)
+    url = settings.llm_url("nutrition")
+
+    # before: 요청마다 새 client
+    async def fresh_client_call():
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.post(url, json={"food_name": "stub"})
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    latencies = await run(fresh_client_call, total, concurrency)
+    report("before", latencies, time.perf_counter() - start, len(connections))
+
+    # after: 공유 client
+    connections.clear()
+    await AIClient.startup()
+    start = time.perf_counter()
+    latencies = await run(lambda: AIClient.request_single_analysis("stub"), total, concurrency)
+    report("after", latencies, time.perf_counter() - start, len(connections))
+    await AIClient.shutdown()
+
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.ai_client_pool")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--delay-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.delay_ms))
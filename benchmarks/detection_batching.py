@@ -0,0 +1,154 @@
+"""
+감지 요청 micro-batching 처리량 벤치마크 (로컬 stub AI 서버)
+
+사용법:
+    python -m benchmarks.detection_batching [--requests 256] [--concurrency 1,4,16,64]
+        [--batch-size 8] [--wait-ms 10] [--overhead-ms 20] [--per-image-ms 2]
+
+- stub 서버: GPU 1개 가정 -> 요청을 직렬 처리, 요청당 고정 비용(overhead) + 이미지당 비용
+- single : 요청마다 /analyze 1장 (기존 방식)
+- batched: DetectionBatcher 로 최대 batch-size 장 / wait-ms 까지 모아 /analyze-batch
+- 측정   : 처리량(img/s), latency p50/p99, 평균 배치 크기
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import threading
+import time
+from unittest.mock import patch
+
+import uvicorn
+from dotenv import load_dotenv
+from fastapi import FastAPI, File, Form, UploadFile
+
+load_dotenv(dotenv_path=".env")
+load_dotenv(dotenv_path=".env.example")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def build_stub_app(overhead_sec: float, per_image_sec: float) -> FastAPI:
+    stub = FastAPI()
+    gpu = asyncio.Lock()  # 모델 1개 -> 추론 직렬 실행
+
+    async def infer(count: int) -> None:
+        async with gpu:
+            await asyncio.sleep(overhead_sec + per_image_sec * count)
+
+    @stub.post("/api/inference/v4/analyze")
+    async def analyze(image: UploadFile = File(...), image_id: str = Form(...)):
+        await infer(1)
+        return {"image_id": image_id, "food_name": "stub", "candidates": []}
+
+    @stub.post("/api/inference/v4/analyze-batch")
+    async def analyze_batch(
+        images: list[UploadFile] = File(...), image_ids: list[str] = Form(...)
+    ):
+        await infer(len(image_ids))
+        return {
+            "results": [
+                {"image_id": image_id, "food_name": "stub", "candidates": []}
+                for image_id in image_ids
+            ]
+        }
+
+    return stub
+
+
+def start_stub_server(port: int, overhead_sec: float, per_image_sec: float) -> uvicorn.Server:
+    config = uvicorn.Config(
+        build_stub_app(overhead_sec, per_image_sec),
+        host="127.0.0.1",
+        port=port,
+        log_level="error",
+    )
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+async def run(call, total: int, concurrency: int) -> tuple[list[float], float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(index: int):
+        async with semaphore:
+            start = time.perf_counter()
+            await call(index)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return latencies, time.perf_counter() - start
+
+
+def report(label: str, concurrency: int, latencies: list[float], elapsed: float, extra: str = "") -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<8} concurrency={concurrency:<3} throughput={len(ordered) / elapsed:>7.1f} img/s "
+        f"p50={statistics.median(ordered):>7.1f}ms p99={p99:>7.1f}ms {extra}"
+    )
+
+
+async def main(args) -> None:
+    port = _free_port()
+    os.environ["AI_SERVICE_URL"] = f"http://127.0.0.1:{port}"
+
+    # AI_SERVICE_URL 설정 후 import (settings 로드 시점)
+    from app.clients.ai_client import AIClient
+    from app.clients.detection_batcher import DetectionBatcher
+
+    server = start_stub_server(port, args.overhead_ms / 1000, args.per_image_ms / 1000)
+    image = os.urandom(50 * 1024)  # 리사이즈된 640x640 JPEG 크기 정도
+    await AIClient.startup()
+
+    async def detect(index: int):
+        await AIClient.request_detection(image, f"bench-{index}")
+
+    for concurrency in args.concurrency:
+        with patch("app.clients.ai_client.settings.ai_detection_batch_enabled", False):
+            latencies, elapsed = await run(detect, args.requests, concurrency)
+        report("single", concurrency, latencies, elapsed)
+
+        DetectionBatcher.reset()
+        DetectionBatcher.startup(max_batch_size=args.batch_size, max_wait_ms=args.wait_ms)
+        with patch("app.clients.ai_client.settings.ai_detection_batch_enabled", True):
+            latencies, elapsed = await run(detect, args.requests, concurrency)
+        await DetectionBatcher.shutdown()
+        stats = DetectionBatcher.stats()
+        report(
+            "batched",
+            concurrency,
+            latencies,
+            elapsed,
+            f"batches={stats['batches']} avg_batch={stats['avg_batch_size']}",
+        )
+
+    await AIClient.shutdown()
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.detection_batching")
+    parser.add_argument("--requests", type=int, default=256)
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(v) for v in value.split(",")],
+        default=[1, 4, 16, 64],
+    )
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--wait-ms", type=float, default=10.0)
+    parser.add_argument("--overhead-ms", type=float, default=20.0)
+    parser.add_argument("--per-image-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    asyncio.run(main(args))
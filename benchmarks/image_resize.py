@@ -0,0 +1,109 @@
+"""
+resize_image 마이크로 벤치마크 (기존 경로 vs fast path)
+
+사용법:
+    python -m benchmarks.image_resize [--corpus DIR] [--repeat 10]
+
+- corpus 미지정시 샘플 이미지 생성 (휴대폰 사진 크기 JPEG, EXIF 세로 사진, PNG, 이미 640x640)
+- 이미지/모드별로 별도 프로세스에서 실행 -> peak RSS 증가량을 서로 간섭 없이 측정
+"""
+
+import argparse
+import gc
+import io
+import multiprocessing
+import os
+import resource
+import statistics
+import time
+
+from PIL import Image
+
+from app.common.image_utils import resize_image
+
+
+def build_sample_corpus() -> dict[str, tuple[bytes, str]]:
+    def encode(image: Image.Image, format: str, **kwargs) -> bytes:
+        buffer = io.BytesIO()
+        image.save(buffer, format, **kwargs)
+        return buffer.getvalue()
+
+    photo = Image.effect_noise((4032, 3024), 64).convert("RGB")
+    portrait_exif = Image.Exif()
+    portrait_exif[0x0112] = 6
+    return {
+        "jpeg_4032x3024": (encode(photo, "JPEG", quality=90), "JPEG"),
+        "jpeg_exif_portrait": (encode(photo, "JPEG", quality=90, exif=portrait_exif), "JPEG"),
+        "jpeg_1920x1080": (encode(photo.resize((1920, 1080)), "JPEG", quality=90), "JPEG"),
+        "png_1600x1200": (encode(photo.resize((1600, 1200)), "PNG"), "PNG"),
+        "jpeg_640x640": (encode(photo.resize((640, 640)), "JPEG", quality=85), "JPEG"),
+    }
+
+
+def load_corpus(directory: str) -> dict[str, tuple[bytes, str]]:
+    corpus = {}
+    for filename in sorted(os.listdir(directory)):
+        ext = filename.rsplit(".", 1)[-1].lower()
+        if ext not in ("jpg", "jpeg", "png", "webp"):
+            continue
+        with open(os.path.join(directory, filename), "rb") as f:
+            corpus[filename] = (f.read(), "PNG" if ext in ("png", "webp") else "JPEG")
+    return corpus
+
+
+def _read_status_kb(field: str) -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field):
+                return int(line.split()[1])
+    return 0
+
+
+def _measure(data: bytes, format: str, fast: bool, repeat: int, queue) -> None:
+    # 자식 프로세스: 입력 bytes 로드 후 peak RSS 초기화 -> 반복 실행 후 peak RSS 증가량
+    gc.collect()
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")  # VmHWM(peak RSS) 를 현재 RSS 로 reset (linux)
+        baseline = _read_status_kb("VmRSS:")
+        read_peak = lambda: _read_status_kb("VmHWM:")  # noqa: E731
+    except OSError:
+        baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        read_peak = lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # noqa: E731
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        resize_image(data, format=format, fast=fast)
+        timings.append((time.perf_counter() - start) * 1000)
+    queue.put((statistics.median(timings), (read_peak() - baseline) / 1024))  # KB -> MB
+
+
+def measure(data: bytes, format: str, fast: bool, repeat: int) -> tuple[float, float]:
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_measure, args=(data, format, fast, repeat, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main(corpus_dir: str | None, repeat: int) -> None:
+    corpus = load_corpus(corpus_dir) if corpus_dir else build_sample_corpus()
+    print(f"{'image':<24} {'legacy ms':>10} {'fast ms':>9} {'speedup':>8} {'legacy MB':>10} {'fast MB':>8}")
+    for name, (data, format) in corpus.items():
+        legacy_ms, legacy_mb = measure(data, format, False, repeat)
+        fast_ms, fast_mb = measure(data, format, True, repeat)
+        print(
+            f"{name:<24} {legacy_ms:>10.1f} {fast_ms:>9.1f} {legacy_ms / fast_ms:>7.1f}x "
+            f"{legacy_mb:>10.1f} {fast_mb:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.image_resize")
+    parser.add_argument("--corpus", default=None, help="샘플 이미지 디렉토리 (jpg/png/webp)")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    main(args.corpus, args.repeat)
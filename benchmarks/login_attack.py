@@ -0,0 +1,125 @@
+"""
+credential stuffing 부하 테스트 (rate limit 유무별 CPU 사용량)
+
+사용법:
+    python -m benchmarks.login_attack [--attempts 200] [--concurrency 32] [--ips 2] [--rounds 10]
+
+- 공격: --ips 개 IP 에서 무작위 계정/비밀번호로 로그인 시도 (ALB 1단 뒤 X-Forwarded-For)
+- 모든 계정이 존재한다고 가정 (users 조회 mock) -> 허용된 시도는 bcrypt 검증 1회
+- off : rate limit 비활성 (기존 방식)
+- on  : 기본 정책 (RATE_LIMIT_LOGIN_IP / RATE_LIMIT_LOGIN_ACCOUNT)
+- 측정: bcrypt 검증 수, 프로세스 CPU 시간, 429 비율, 공격 중 GET /health latency
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=".env")
+load_dotenv(dotenv_path=".env.example")
+
+from main import app  # noqa: E402
+from app.common.password_executor import PasswordExecutor  # noqa: E402
+from app.common.rate_limit import RateLimiter  # noqa: E402
+from app.core import jwt_context  # noqa: E402
+from app.db.database import get_db  # noqa: E402
+from app.db.models.user import User  # noqa: E402
+
+
+async def run_mode(enabled: bool, attempts: int, concurrency: int, ips: int) -> None:
+    RateLimiter.reset()
+    PasswordExecutor.startup()
+    verifications = Counter()
+    original_verify = jwt_context.verify_pwd
+
+    def counting_verify(plain, hashed):
+        verifications["bcrypt"] += 1
+        return original_verify(plain, hashed)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses = Counter()
+    health_latencies = []
+    transport = httpx.ASGITransport(app=app)
+
+    with (
+        patch("app.core.settings.settings.rate_limit_enabled", enabled),
+        patch("app.core.jwt_context.verify_pwd", counting_verify),
+    ):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+            async def attempt(index: int):
+                async with semaphore:
+                    response = await client.post(
+                        "/api/v1/users/login",
+                        json={"account": f"victim{index % 50}", "password": f"guess{index}"},
+                        headers={"X-Forwarded-For": f"10.0.0.{index % ips}"},
+                    )
+                    statuses[response.status_code] += 1
+
+            done = asyncio.Event()
+
+            async def probe():
+                while not done.is_set():
+                    start = time.perf_counter()
+                    await client.get("/health")
+                    health_latencies.append((time.perf_counter() - start) * 1000)
+                    await asyncio.sleep(0.02)
+
+            probe_task = asyncio.create_task(probe())
+            cpu_start, wall_start = time.process_time(), time.perf_counter()
+            await asyncio.gather(*(attempt(i) for i in range(attempts)))
+            cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+            done.set()
+            await probe_task
+
+    await asyncio.to_thread(PasswordExecutor.shutdown)
+    ordered = sorted(health_latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"rate_limit={'on' if enabled else 'off':<3} attempts={attempts} wall={wall:.2f}s cpu={cpu:.2f}s "
+        f"bcrypt={verifications['bcrypt']} 401={statuses[401]} 429={statuses[429]} "
+        f"health p50={statistics.median(ordered):.1f}ms p99={p99:.1f}ms"
+    )
+
+
+async def main(attempts: int, concurrency: int, ips: int, rounds: int) -> None:
+    user = User(
+        id=1,
+        email="victim@example.com",
+        username="victim",
+        password=jwt_context.get_pwd_hash("correct-horse", rounds=rounds),
+        created_at=datetime.now(timezone.utc),
+        is_active=True,
+        email_verified=False,
+    )
+    session = AsyncMock()
+    session.add = MagicMock()
+
+    async def _get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = _get_db
+    with (
+        patch("app.services.user.UserCrud.get_user_by_username", new_callable=AsyncMock, return_value=user),
+        patch("app.core.settings.settings.bcrypt_rounds", rounds),
+        patch("app.core.settings.settings.rate_limit_trusted_proxies", 1),
+    ):
+        for enabled in (False, True):
+            await run_mode(enabled, attempts, concurrency, ips)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.login_attack")
+    parser.add_argument("--attempts", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--ips", type=int, default=2)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.attempts, args.concurrency, args.ips, args.rounds))
@@ -0,0 +1,123 @@
+"""
+로그인 폭주 중 다른 엔드포인트 latency 벤치마크 (bcrypt 실행 위치별)
+
+사용법:
+    python -m benchmarks.login_storm [--logins 40] [--concurrency 8] [--rounds 12] [--workers 4]
+
+- inline : event loop 에서 bcrypt 직접 실행 (기존 방식)
+- thread : PasswordExecutor thread pool
+- DB 는 mock (users 조회만 stub), 해시는 --rounds cost 로 미리 생성
+- health : 로그인 진행 중 GET /health latency (event loop 블로킹 정도)
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=".env")
+load_dotenv(dotenv_path=".env.example")
+
+from main import app  # noqa: E402
+from app.common.password_executor import PasswordExecutor  # noqa: E402
+from app.core.jwt_context import get_pwd_hash  # noqa: E402
+from app.db.database import get_db  # noqa: E402
+from app.db.models.user import User  # noqa: E402
+
+
+def percentiles(values: list[float]) -> tuple[float, float]:
+    ordered = sorted(values)
+    return statistics.median(ordered), ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+async def run_mode(mode: str, total: int, concurrency: int, workers: int) -> None:
+    PasswordExecutor.startup(mode=mode, workers=workers)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, health_latencies = [], []
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def login():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post(
+                    "/api/v1/users/login", json={"account": "bench", "password": "password123"}
+                )
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        done = asyncio.Event()
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                health_latencies.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.02)
+
+        # 기준값: 로그인 없을 때 health latency
+        idle = []
+        for _ in range(20):
+            start = time.perf_counter()
+            await client.get("/health")
+            idle.append((time.perf_counter() - start) * 1000)
+
+        probe_task = asyncio.create_task(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(total)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe_task
+
+    PasswordExecutor.shutdown()
+
+    login_p50, login_p99 = percentiles(latencies)
+    idle_p50, _ = percentiles(idle)
+    health_p50, health_p99 = percentiles(health_latencies)
+    print(
+        f"{mode:<7} logins={total} concurrency={concurrency} total={elapsed:.2f}s "
+        f"login p50={login_p50:.0f}ms p99={login_p99:.0f}ms | "
+        f"health idle p50={idle_p50:.1f}ms storm p50={health_p50:.1f}ms p99={health_p99:.1f}ms"
+    )
+
+
+async def main(total: int, concurrency: int, rounds: int, workers: int) -> None:
+    user = User(
+        id=1,
+        email="bench@example.com",
+        username="bench",
+        nickname="bench",
+        password=get_pwd_hash("password123", rounds=rounds),
+        created_at=datetime.now(timezone.utc),
+        is_active=True,
+        email_verified=False,
+    )
+    session = AsyncMock()
+    session.add = MagicMock()
+
+    async def _get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = _get_db
+    with (
+        patch("app.services.user.UserCrud.get_user_by_username", new_callable=AsyncMock, return_value=user),
+        patch("app.core.jwt_context.settings.bcrypt_rounds", rounds),
+    ):
+        for mode in ("inline", "thread"):
+            await run_mode(mode, total, concurrency, workers)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.login_storm")
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.concurrency, args.rounds, args.workers))
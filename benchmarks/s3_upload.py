@@ -0,0 +1,94 @@
+"""
+식단 저장(upload_tmp_images_to_s3) S3 업로드 wall time 벤치마크 (순차 vs 동시 업로드)
+
+사용법:
+    python -m benchmarks.s3_upload [--latency-ms 80] [--image-kb 300] [--repeat 3]
+
+- S3는 moto(local stand-in) + 요청당 네트워크 지연(latency-ms) 주입
+- sequential : S3_UPLOAD_CONCURRENCY=1 (기존 순차 업로드와 동일)
+- concurrent : S3_UPLOAD_CONCURRENCY 설정값
+- 식단 1건당 이미지 1/3/5장
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from unittest.mock import patch
+
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=".env")
+load_dotenv(dotenv_path=".env.example")
+
+import boto3  # noqa: E402
+from moto import mock_aws  # noqa: E402
+
+from app.clients.s3_client import S3Client  # noqa: E402
+from app.core.settings import settings  # noqa: E402
+from app.services.file_manager import FileManager  # noqa: E402
+from app.services.meal_image import MealImageService  # noqa: E402
+
+
+def make_client(latency_sec: float):
+    client = boto3.client("s3", region_name=S3Client._region)
+    client.create_bucket(
+        Bucket=S3Client._bucket,
+        CreateBucketConfiguration={"LocationConstraint": S3Client._region},
+    )
+
+    # 요청마다 RTT 지연 (moto는 in-process라 지연 0)
+    def delay(**kwargs):
+        time.sleep(latency_sec)
+
+    client.meta.events.register("before-sign.s3.*", delay)
+    return client
+
+
+async def run_meal(image_count: int, image_bytes: bytes, concurrency: int) -> float:
+    image_ids = [str(uuid.uuid4()) for _ in range(image_count)]
+    for image_id in image_ids:
+        await FileManager.save_tmp_image(image_bytes, f"{image_id}.jpg")
+
+    with patch.object(settings, "s3_upload_concurrency", concurrency):
+        start = time.perf_counter()
+        await MealImageService.upload_tmp_images_to_s3(image_ids)
+        return (time.perf_counter() - start) * 1000
+
+
+async def main(latency_ms: int, image_kb: int, repeat: int) -> None:
+    image_bytes = os.urandom(image_kb * 1024)
+    concurrency = settings.s3_upload_concurrency
+
+    with (
+        mock_aws(),
+        tempfile.TemporaryDirectory() as tmp_dir,
+        patch.object(FileManager, "TEMP_DIR", tmp_dir),
+    ):
+        with patch.object(S3Client, "_client", make_client(latency_ms / 1000)):
+            print(
+                f"latency={latency_ms}ms image={image_kb}KB concurrency={concurrency}"
+            )
+            print(f"{'images':>6} {'sequential ms':>14} {'concurrent ms':>14} {'speedup':>8}")
+            for image_count in (1, 3, 5):
+                sequential = [
+                    await run_meal(image_count, image_bytes, 1) for _ in range(repeat)
+                ]
+                concurrent = [
+                    await run_meal(image_count, image_bytes, concurrency)
+                    for _ in range(repeat)
+                ]
+                seq_ms, con_ms = statistics.median(sequential), statistics.median(concurrent)
+                print(f"{image_count:>6} {seq_ms:>14.1f} {con_ms:>14.1f} {seq_ms / con_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.s3_upload")
+    parser.add_argument("--latency-ms", type=int, default=80)
+    parser.add_argument("--image-kb", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.latency_ms, args.image_kb, args.repeat))
@@ -0,0 +1,82 @@
+"""
+tmp 이미지 조회(FileManager.get_tmp_file_path) 벤치마크 (listdir scan vs shard 경로 직접 조회)
+
+사용법:
+    python -m benchmarks.tmp_lookup [--files 100000] [--lookups 200]
+
+- legacy : TEMP_DIR 단일 디렉토리 + listdir prefix scan (기존 구현)
+- sharded: TEMP_DIR/{id[:2]}/{id}.{ext} + 확장자 후보 stat (현재 구현)
+- 파일 수(1k/10k/files)를 늘려가며 조회 latency 비교 (임시 디렉토리 사용, 종료시 삭제)
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from unittest.mock import patch
+
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=".env")
+load_dotenv(dotenv_path=".env.example")
+
+from app.services.file_manager import FileManager  # noqa: E402
+
+
+def legacy_lookup(temp_dir: str, image_id: str) -> str:
+    # 기존 구현: 전체 listdir + prefix scan
+    for filename in os.listdir(temp_dir):
+        if filename.startswith(image_id) and filename[len(image_id)] == ".":
+            return os.path.join(temp_dir, filename)
+    raise FileNotFoundError(image_id)
+
+
+def populate(legacy_dir: str, sharded_dir: str, ids: list[str]) -> None:
+    for image_id in ids:
+        filename = f"{image_id}.jpg"
+        open(os.path.join(legacy_dir, filename), "wb").close()
+        shard_dir = os.path.join(sharded_dir, filename[:2])
+        os.makedirs(shard_dir, exist_ok=True)
+        open(os.path.join(shard_dir, filename), "wb").close()
+
+
+def timed(fn, ids: list[str]) -> float:
+    samples = []
+    for image_id in ids:
+        start = time.perf_counter()
+        fn(image_id)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main(total_files: int, lookups: int) -> None:
+    steps = sorted({min(1_000, total_files), min(10_000, total_files), total_files})
+    with tempfile.TemporaryDirectory() as root:
+        legacy_dir = os.path.join(root, "legacy")
+        sharded_dir = os.path.join(root, "sharded")
+        os.makedirs(legacy_dir)
+        os.makedirs(sharded_dir)
+
+        ids: list[str] = []
+        print(f"{'files':>8} {'legacy us':>12} {'sharded us':>11}")
+        for step in steps:
+            new_ids = [str(uuid.uuid4()) for _ in range(step - len(ids))]
+            populate(legacy_dir, sharded_dir, new_ids)
+            ids.extend(new_ids)
+
+            # 최근 업로드(목록 끝쪽) 조회 = listdir 최악에 가까운 경우
+            targets = ids[-lookups:]
+            legacy_us = timed(lambda image_id: legacy_lookup(legacy_dir, image_id), targets[:20])
+            with patch.object(FileManager, "TEMP_DIR", sharded_dir):
+                sharded_us = timed(FileManager.get_tmp_file_path, targets)
+            print(f"{step:>8} {legacy_us:>12.1f} {sharded_us:>11.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.tmp_lookup")
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+    main(args.files, args.lookups)
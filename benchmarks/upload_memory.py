@@ -0,0 +1,85 @@
+"""
+업로드 파일 수신 단계 메모리 벤치마크 (전체 read() vs 청크 읽기 + 디스크 spool)
+
+사용법:
+    python -m benchmarks.upload_memory [--sizes 2,8,40]
+
+- Starlette 와 같이 SpooledTemporaryFile 에 담긴 UploadFile 기준
+- legacy : await file.read() (크기 제한 x, 전체 메모리 적재)
+- stream : FileManager.spool_upload (UPLOAD_MAX_MB 초과 즉시 413, threshold 초과시 디스크 spool)
+- tracemalloc peak (수신 단계 Python 할당량, 리사이즈 제외)
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+
+from dotenv import load_dotenv
+from fastapi import UploadFile
+
+load_dotenv(dotenv_path=".env")
+load_dotenv(dotenv_path=".env.example")
+
+from app.core.settings import settings  # noqa: E402
+from app.services.file_manager import FileManager, UploadTooLarge  # noqa: E402
+
+
+def make_upload(size_mb: int) -> UploadFile:
+    spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    spooled.write(b"\xff\xd8\xff\xe0" + os.urandom(size_mb * 1024 * 1024 - 4))
+    spooled.seek(0)
+    return UploadFile(file=spooled, filename="photo.jpg")
+
+
+async def legacy(file: UploadFile) -> str:
+    content = await file.read()
+    return f"read {len(content) // 1024} KB"
+
+
+async def stream(file: UploadFile) -> str:
+    try:
+        upload = await FileManager.spool_upload(
+            file,
+            max_bytes=settings.upload_max_mb * 1024 * 1024,
+            spool_threshold=settings.upload_spool_threshold_kb * 1024,
+            chunk_size=settings.upload_chunk_kb * 1024,
+        )
+    except UploadTooLarge:
+        return "413"
+    outcome = "memory" if upload.path is None else "disk"
+    await upload.cleanup()
+    return outcome
+
+
+async def measure(fn, size_mb: int) -> tuple[str, float, float]:
+    file = make_upload(size_mb)
+    tracemalloc.start()
+    start = time.perf_counter()
+    outcome = await fn(file)
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await file.close()
+    return outcome, elapsed, peak / 1024 / 1024
+
+
+async def main(sizes: list[int]) -> None:
+    print(
+        f"max={settings.upload_max_mb}MB spool_threshold={settings.upload_spool_threshold_kb}KB "
+        f"chunk={settings.upload_chunk_kb}KB"
+    )
+    print(f"{'upload':>7} {'mode':<7} {'result':<12} {'ms':>7} {'peak MB':>8}")
+    for size_mb in sizes:
+        for name, fn in (("legacy", legacy), ("stream", stream)):
+            outcome, elapsed, peak_mb = await measure(fn, size_mb)
+            print(f"{size_mb:>5}MB {name:<7} {outcome:<12} {elapsed:>7.1f} {peak_mb:>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.upload_memory")
+    parser.add_argument("--sizes", default="2,8,40", help="업로드 크기 목록 (MB)")
+    args = parser.parse_args()
+    asyncio.run(main([int(size) for size in args.sizes.split(",")]))
@@ -0,0 +1,128 @@
+"""
+/meals/upload 동시 요청 latency 벤치마크 (리사이즈 실행기 모드별)
+
+사용법:
+    python -m benchmarks.upload_resize_pool [--requests 40] [--concurrency 8] [--workers 2]
+
+- inline  : event loop 에서 직접 리사이즈 (기존 방식)
+- thread  : ThreadPoolExecutor
+- process : ProcessPoolExecutor
+- AI 서버는 stub (20ms 응답), DB/tmp 저장은 mock
+- health : 업로드 진행 중 GET /health latency (event loop 블로킹 정도)
+"""
+
+import argparse
+import asyncio
+import io
+import statistics
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+from dotenv import load_dotenv
+from PIL import Image
+
+load_dotenv(dotenv_path=".env")
+load_dotenv(dotenv_path=".env.example")
+
+from main import app  # noqa: E402
+from app.core.auth import get_current_user  # noqa: E402
+from app.db.database import get_db  # noqa: E402
+from app.common.image_executor import ImageExecutor  # noqa: E402
+
+
+def make_photo(size=(4032, 3024)) -> bytes:
+    # 스마트폰 사진 크기, 노이즈로 실제 사진과 비슷한 압축률
+    image = Image.effect_noise(size, 64).convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+async def stub_detection(image_data, image_id, content_type="image/jpeg"):
+    await asyncio.sleep(0.02)
+    return {"image_id": image_id, "food_name": "stub", "candidates": []}
+
+
+async def run_mode(mode: str, photo: bytes, total: int, concurrency: int, workers: int) -> None:
+    ImageExecutor.startup(mode=mode, workers=workers)
+    # 워커 warm-up (process spawn 비용 제외)
+    await ImageExecutor.run(sum, [1, 2])
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post(
+                    "/api/v1/meals/upload", files={"file": ("photo.jpg", photo, "image/jpeg")}
+                )
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        health_latencies = []
+        done = asyncio.Event()
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                health_latencies.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.05)
+
+        probe_task = asyncio.create_task(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe_task
+
+    await asyncio.to_thread(ImageExecutor.shutdown)
+
+    upload_p50, upload_p99 = percentiles(latencies)
+    health_p50, health_p99 = percentiles(health_latencies)
+    print(
+        f"{mode:<8} requests={total} concurrency={concurrency} total={elapsed:.2f}s "
+        f"upload p50={upload_p50:.1f}ms p99={upload_p99:.1f}ms | "
+        f"health p50={health_p50:.1f}ms p99={health_p99:.1f}ms"
+    )
+
+
+def percentiles(values: list[float]) -> tuple[float, float]:
+    ordered = sorted(values)
+    return statistics.median(ordered), ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+async def main(total: int, concurrency: int, workers: int) -> None:
+    session = AsyncMock()
+    session.add = MagicMock()
+
+    async def _get_db():
+        yield session
+
+    async def _get_current_user():
+        return MagicMock(id=1)
+
+    app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_current_user] = _get_current_user
+
+    photo = make_photo()
+    with (
+        patch("app.services.meal_image.AIClient.request_detection", side_effect=stub_detection),
+        patch("app.services.meal_image.FileManager.save_tmp_image", new_callable=AsyncMock),
+    ):
+        for mode in ("inline", "thread", "process"):
+            await run_mode(mode, photo, total, concurrency, workers)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.upload_resize_pool")
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.workers))
@@ -1,10 +1,23 @@
+import asyncio
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from app.db.database import Base, async_engine
 from app.db import models
 from app.core.settings import settings
 from app.routers import router as all_routes
+from app.clients.ai_client import AIClient
+from app.clients.detection_batcher import DetectionBatcher
+from app.clients.circuit_breaker import AIServiceUnavailable
+from app.common.image_executor import ImageExecutor
+from app.common.password_executor import PasswordExecutor
+from app.common.rate_limit import RateLimiter
+from app.common.upload_limit import UploadSizeLimitMiddleware
+from app.services.tmp_janitor import TmpJanitor
+from app.services.detection_jobs import DetectionJobQueue
+from app.services.prediction_log_writer import PredictionLogWriter
 
 # lifespan
 from contextlib import asynccontextmanager
@@ -30,7 +43,26 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"Error running Alembic migrations: {e}")
 
+    await AIClient.startup()  # AI 서버 공유 HTTP client (커넥션 풀)
+    ImageExecutor.startup()  # 이미지 리사이즈 process/thread pool
+    PasswordExecutor.startup()  # bcrypt 해시/검증 thread pool
+    RateLimiter.startup()  # 인증 엔드포인트 rate limit backend
+    TmpJanitor.startup()  # 고아 tmp 이미지 주기 정리
+    DetectionJobQueue.startup()  # 비동기 감지 job worker
+    if settings.prediction_log_writer_enabled:
+        PredictionLogWriter.startup()  # PredictionLog 배치 저장
+    if settings.ai_detection_batch_enabled:
+        DetectionBatcher.startup()  # 감지 요청 micro-batching
+
     yield
+    await TmpJanitor.shutdown()
+    await DetectionJobQueue.shutdown()  # 대기중 감지 job 처리 후 종료 (AIClient 보다 먼저)
+    await DetectionBatcher.shutdown()  # 모아둔 감지 요청 전송 후 종료
+    await PredictionLogWriter.shutdown()  # 남은 예측 로그 저장 (DB 종료 전)
+    await AIClient.shutdown()  # 진행중 AI 요청 완료 대기 후 종료
+    await asyncio.to_thread(ImageExecutor.shutdown)  # 대기중 리사이즈 완료 후 worker 종료
+    await asyncio.to_thread(PasswordExecutor.shutdown)
+    await RateLimiter.shutdown()
     await async_engine.dispose()  # DB 연결 종료
 
 
@@ -49,6 +81,26 @@ def health_check():
     return {"status": "ok"}
 
 
+# AI 서버 circuit open / 동시 요청 초과 -> 30초 timeout 대기 대신 즉시 503
+@app.exception_handler(AIServiceUnavailable)
+async def ai_service_unavailable_handler(request: Request, exc: AIServiceUnavailable):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "AI service is temporarily unavailable. Please retry shortly."},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+# DB 커넥션 풀 checkout 대기 초과 (DB_POOL_TIMEOUT_SEC) -> 500 대신 503
+@app.exception_handler(PoolTimeoutError)
+async def db_pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database is busy. Please retry shortly."},
+        headers={"Retry-After": "1"},
+    )
+
+
 # 미들웨어 등록 (front:intercept, 토큰보안 안정성)
 # 허용할 출처 목록
 import os
@@ -57,6 +109,13 @@ origins = os.getenv(
     "ALLOWED_ORIGINS", "http://localhost:5173,https://caloreat-ten.vercel.app,null"
 ).split(",")
 
+# 이미지 업로드 크기 조기 차단 (413 응답에도 CORS 헤더 포함되도록 CORS 보다 안쪽에 등록)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_bytes=settings.upload_max_mb * 1024 * 1024,
+    paths=("/api/v1/meals/upload", "/api/v1/meals/upload/jobs"),
+)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -1,4 +1,5 @@
 import pytest
+import pytest_asyncio
 import os
 from dotenv import load_dotenv
 
@@ -15,6 +16,36 @@ from app.db.models.user import User
 from datetime import datetime, timezone
 
 
+# 같은 사진 재업로드 결과 재사용 캐시 (프로세스 단위) - 테스트간 공유 방지
+@pytest.fixture(autouse=True)
+def reset_image_dedup():
+    from app.services.image_dedup import ImageDedupService
+
+    ImageDedupService.reset()
+    yield
+    ImageDedupService.reset()
+
+
+# AI 엔드포인트별 circuit breaker 상태 (프로세스 단위) - 테스트간 공유 방지
+@pytest.fixture(autouse=True)
+def reset_ai_breakers():
+    from app.clients.circuit_breaker import CircuitBreaker
+
+    CircuitBreaker.reset_all()
+    yield
+    CircuitBreaker.reset_all()
+
+
+# 인증 엔드포인트 rate limit bucket (프로세스 단위) - 테스트간 공유 방지
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    from app.common.rate_limit import RateLimiter
+
+    RateLimiter.reset()
+    yield
+    RateLimiter.reset()
+
+
 # Mock DB Session
 @pytest.fixture
 def mock_db_session():
@@ -124,3 +155,52 @@ def mock_profile_form_service():
         "app.routers.user_profile_form.ProfileFormService", autospec=True
     ) as mock:
         yield mock
+
+
+# Local S3 stand-in (moto) - S3Client._client 교체, test bucket 생성
+# moto 미설치 환경에서는 skip
+@pytest.fixture
+def moto_s3():
+    moto = pytest.importorskip("moto")
+    import boto3
+    from app.clients.s3_client import S3Client
+
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name=S3Client._region)
+        client.create_bucket(
+            Bucket=S3Client._bucket,
+            CreateBucketConfiguration={"LocationConstraint": S3Client._region},
+        )
+        with patch.object(S3Client, "_client", client):
+            yield client
+
+
+# Real PostgreSQL Session (SQL 집계/실행계획 검증용)
+# DB 접속 불가 환경(로컬 DB 미실행 등)에서는 skip
+# 테이블 생성 포함 전체 작업은 트랜잭션 rollback 으로 정리됨
+@pytest_asyncio.fixture
+async def pg_session():
+    from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+    from sqlalchemy.pool import NullPool
+    from app.core.settings import settings
+    from app.db.database import Base
+
+    engine = create_async_engine(
+        settings.database_url, poolclass=NullPool, connect_args={"timeout": 2}
+    )
+    try:
+        conn = await engine.connect()
+    except Exception as e:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL unavailable: {e}")
+
+    trans = await conn.begin()
+    await conn.run_sync(Base.metadata.create_all)
+    session = AsyncSession(bind=conn, expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        await session.close()
+        await trans.rollback()
+        await conn.close()
+        await engine.dispose()
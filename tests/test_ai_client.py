@@ -1,11 +1,36 @@
+import asyncio
 import pytest
+import pytest_asyncio
 from unittest.mock import patch, AsyncMock
 import httpx
-from app.clients.ai_client import AIClient
+from app.clients.ai_client import AIClient, DETECTION_TIMEOUT, LLM_TIMEOUT
 from app.core.settings import settings
 
 # --- AIClient Tests ---
-# 외부 API 통신 로직 검증 (Mocking 사용)
+# 외부 API 통신 로직 검증 (httpx.MockTransport 주입, 공유 client 사용)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_ai_client():
+    await AIClient.shutdown(grace_sec=0)
+    yield
+    await AIClient.shutdown(grace_sec=0)
+
+
+async def use_handler(handler):
+    """공유 client를 MockTransport 기반으로 재생성, 수신 request 목록 반환"""
+    requests = []
+
+    async def _handler(request: httpx.Request):
+        requests.append(request)
+        result = handler(request)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    await AIClient.shutdown(grace_sec=0)
+    await AIClient.startup(transport=httpx.MockTransport(_handler))
+    return requests
 
 
 @pytest.mark.asyncio
@@ -14,111 +39,106 @@ async def test_request_detection_success():
     image_data = b"fake-image-bytes"
     image_id = "test-uuid"
     mock_response_data = {"result": "success", "candidates": []}
+    requests = await use_handler(lambda r: httpx.Response(200, json=mock_response_data))
 
-    # httpx.AsyncClient.post를 메서드 레벨에서 patch (context manager 내부)
-    # AIClient 코드: async with httpx.AsyncClient(...) as client: ... await client.post(...)
-
-    # httpx.AsyncClient를 Mocking하여 context manager가 반환하는 client 객체를 제어
-    with patch("httpx.AsyncClient") as MockClient:
-        mock_instance = MockClient.return_value
-
-        # Prepare Mock Response with Request
-        mock_response = httpx.Response(200, json=mock_response_data)
-        mock_response._request = httpx.Request("POST", "http://test")
+    # When
+    result = await AIClient.request_detection(image_data, image_id)
 
-        mock_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
-        )
+    # Then
+    assert result == mock_response_data
+    request = requests[0]
 
-        # When
-        result = await AIClient.request_detection(image_data, image_id)
+    # URL 확인 (v4)
+    assert str(request.url) == settings.inference_url("v4", "analyze")
 
-        # Then
-        assert result == mock_response_data
+    # multipart body 확인 (image_id, image bytes)
+    body = request.read()
+    assert b'name="image_id"' in body and image_id.encode() in body
+    assert image_data in body
 
-        # Calling verify
-        call_args = mock_instance.__aenter__.return_value.post.call_args
-        args, kwargs = call_args
+    # detection 전용 timeout (connect/read 분리)
+    assert request.extensions["timeout"] == DETECTION_TIMEOUT.as_dict()
 
-        # URL 확인 (v4)
-        assert settings.inference_url("v4", "analyze") in args[0] or args[
-            0
-        ] == settings.inference_url("v4", "analyze")
 
-        # Data 확인
-        assert kwargs["data"] == {"image_id": image_id}
+@pytest.mark.asyncio
+async def test_request_detection_failure():
+    # Given: 500 에러 응답 설정
+    await use_handler(lambda r: httpx.Response(500))
 
-        # Files 확인
-        filename, content, content_type = kwargs["files"]["image"]
-        assert content == image_data
+    # When & Then
+    with pytest.raises(httpx.HTTPStatusError):
+        await AIClient.request_detection(b"fake-image-bytes", "test-uuid")
 
 
 @pytest.mark.asyncio
-async def test_request_detection_failure():
+async def test_request_single_analysis_success():
     # Given
-    image_data = b"fake-image-bytes"
-    image_id = "test-uuid"
+    food_name = "Kimchi"
+    mock_response_data = {"nutritions": {"calories": 100}}
+    requests = await use_handler(lambda r: httpx.Response(200, json=mock_response_data))
 
-    with patch("httpx.AsyncClient") as MockClient:
-        mock_instance = MockClient.return_value
-        # 500 에러 응답 설정
-        mock_response = httpx.Response(500)
-        mock_response._request = httpx.Request("POST", "http://test")
+    # When
+    result = await AIClient.request_single_analysis(food_name)
 
-        mock_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
-        )
+    # Then
+    assert result == mock_response_data
 
-        # When & Then
-        with pytest.raises(httpx.HTTPStatusError):
-            await AIClient.request_detection(image_data, image_id)
+    # Payload 확인
+    assert requests[0].read() == b'{"food_name":"Kimchi"}'
+    assert requests[0].extensions["timeout"] == LLM_TIMEOUT.as_dict()
 
 
 @pytest.mark.asyncio
-async def test_request_single_analysis_success():
-    # Given
-    food_name = "Kimchi"
-    mock_response_data = {"nutritions": {"calories": 100}}
+async def test_request_single_analysis_failure():
+    # Given: 404 에러 응답 설정
+    await use_handler(lambda r: httpx.Response(404))
 
-    with patch("httpx.AsyncClient") as MockClient:
-        mock_instance = MockClient.return_value
+    # When & Then
+    with pytest.raises(httpx.HTTPStatusError):
+        await AIClient.request_single_analysis("Unknown")
 
-        mock_response = httpx.Response(200, json=mock_response_data)
-        mock_response._request = httpx.Request("POST", "http://test")
 
-        mock_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
-        )
+@pytest.mark.asyncio
+async def test_requests_share_single_client():
+    await use_handler(lambda r: httpx.Response(200, json={}))
+    client = AIClient._client
+
+    await asyncio.gather(
+        AIClient.request_single_analysis("a"), AIClient.request_single_analysis("b")
+    )
+    await AIClient.request_single_analysis("c")
 
-        # When
-        result = await AIClient.request_single_analysis(food_name)
+    assert AIClient._client is client
 
-        # Then
-        assert result == mock_response_data
 
-        # Payload verify
-        call_args = mock_instance.__aenter__.return_value.post.call_args
-        args, kwargs = call_args
+@pytest.mark.asyncio
+async def test_lazy_client_when_not_started():
+    with patch.object(httpx.AsyncClient, "post", new_callable=AsyncMock) as mock_post:
+        mock_post.return_value = httpx.Response(
+            200, json={}, request=httpx.Request("POST", "http://test")
+        )
+        await AIClient.request_single_analysis("a")
 
-        # Payload 확인
-        assert kwargs["json"] == {"food_name": food_name}
+    assert AIClient._client is not None
 
 
 @pytest.mark.asyncio
-async def test_request_single_analysis_failure():
-    # Given
-    food_name = "Unknown"
+async def test_shutdown_waits_for_inflight_requests():
+    release = asyncio.Event()
 
-    with patch("httpx.AsyncClient") as MockClient:
-        mock_instance = MockClient.return_value
-        # 404 에러 응답 설정
-        mock_response = httpx.Response(404)
-        mock_response._request = httpx.Request("POST", "http://test")
+    async def slow(request):
+        await release.wait()
+        return httpx.Response(200, json={"ok": True})
 
-        mock_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
-        )
+    await use_handler(slow)
+    task = asyncio.create_task(AIClient.request_single_analysis("a"))
+    await asyncio.sleep(0.01)
+
+    shutdown = asyncio.create_task(AIClient.shutdown(grace_sec=5))
+    await asyncio.sleep(0.1)
+    assert not shutdown.done()  # 진행중 요청 대기
 
-        # When & Then
-        with pytest.raises(httpx.HTTPStatusError):
-            await AIClient.request_single_analysis(food_name)
+    release.set()
+    assert await task == {"ok": True}
+    await shutdown
+    assert AIClient._client is None
@@ -0,0 +1,82 @@
+import pytest
+from unittest.mock import patch
+
+from app.core.auth import CurrentUser, clear_current_user_cache
+from app.core.jwt_context import create_access_token, get_pwd_hash
+from app.db.schemas.user import PasswordUpdate, UserUpdate
+from app.services.user import UserService
+
+# --- get_current_user Cache Tests ---
+# 인증 요청마다 발생하던 users SELECT 가 캐시 hit 시 생략되는지(쿼리 수), 정보 변경/탈퇴시 무효화 검증
+
+
+@pytest.fixture(autouse=True)
+def reset_user_cache():
+    clear_current_user_cache()
+    yield
+    clear_current_user_cache()
+
+
+@pytest.fixture
+def cookie_client(client, mock_db_session, mock_current_user):
+    # dependency override 없이 실제 get_current_user (쿠키 JWT -> 캐시 -> DB)
+    mock_db_session.execute.return_value.scalar_one_or_none.return_value = mock_current_user
+    client.cookies.set("access_token", create_access_token(mock_current_user.id))
+    return client
+
+
+def test_stats_daily_skips_user_query_on_cache_hit(cookie_client, mock_db_session):
+    first = cookie_client.get("/api/v1/stats/daily", params={"date": "2025-12-06"})
+    first_queries = mock_db_session.execute.await_count
+
+    second = cookie_client.get("/api/v1/stats/daily", params={"date": "2025-12-06"})
+    second_queries = mock_db_session.execute.await_count - first_queries
+
+    assert first.status_code == second.status_code == 200
+    # 두번째 요청은 users 조회 1회 생략
+    assert second_queries == first_queries - 1
+
+
+def test_me_returns_principal_without_password(cookie_client):
+    response = cookie_client.get("/api/v1/users/me")
+
+    assert response.status_code == 200
+    assert response.json()["email"] == "test@example.com"
+    assert "password" not in response.json()
+
+
+def test_cache_disabled_with_zero_ttl(cookie_client, mock_db_session):
+    with patch("app.core.auth.settings.auth_user_cache_ttl_sec", 0):
+        cookie_client.get("/api/v1/users/me")
+        cookie_client.get("/api/v1/users/me")
+
+    assert mock_db_session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "action",
+    [
+        lambda db: UserService.update_user(db, 1, UserUpdate(nickname="new")),
+        lambda db: UserService.update_pw(
+            db, 1, PasswordUpdate(old_password="old", new_password="new")
+        ),
+        lambda db: UserService.delete_user(db, 1),
+    ],
+    ids=["update_user", "update_pw", "delete_user"],
+)
+async def test_user_changes_invalidate_cache(action, mock_db_session, mock_current_user):
+    from app.core import auth
+
+    mock_current_user.password = get_pwd_hash("old")
+    principal = CurrentUser.from_user(mock_current_user)
+    auth._current_user_cache.set(1, principal)
+
+    with (
+        patch("app.services.user.UserCrud.get_user_by_id", return_value=mock_current_user),
+        patch("app.services.user.UserCrud.update_user", return_value=mock_current_user),
+        patch("app.services.user.UserCrud.delete_user_by_id", return_value=True),
+    ):
+        await action(mock_db_session)
+
+    assert auth._current_user_cache.get(1) is None
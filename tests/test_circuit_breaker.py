@@ -0,0 +1,234 @@
+import asyncio
+import pytest
+import pytest_asyncio
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from unittest.mock import AsyncMock, patch
+
+from app.clients.ai_client import AIClient
+from app.clients.circuit_breaker import (
+    AIServiceOverloaded,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+# --- AI Circuit Breaker Tests ---
+# 장애 주입 stub AI 서버(ASGITransport)로 closed -> open -> half-open -> closed 전이,
+# 지연/동시 요청 제한, 503 + Retry-After 응답 검증
+
+NUTRITION = "/nutrition"
+
+
+class FaultStub:
+    """mode: ok / error(500) / bad_request(400) / slow(delay 후 200)"""
+
+    def __init__(self):
+        self.mode = "ok"
+        self.delay = 0.0
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.app = FastAPI()
+
+        @self.app.post(NUTRITION)
+        async def nutrition():
+            self.calls += 1
+            if self.mode == "error":
+                return JSONResponse({"detail": "boom"}, status_code=500)
+            if self.mode == "bad_request":
+                return JSONResponse({"detail": "bad"}, status_code=400)
+            if self.mode == "slow":
+                await asyncio.sleep(self.delay)
+            if self.mode == "hang":
+                await self.release.wait()
+            return {"food_name": "stub"}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest_asyncio.fixture
+async def stub():
+    fault = FaultStub()
+    await AIClient.shutdown(grace_sec=0)
+    await AIClient.startup(transport=httpx.ASGITransport(app=fault.app))
+    yield fault
+    await AIClient.shutdown(grace_sec=0)
+
+
+def install_breaker(clock=None, **kwargs) -> CircuitBreaker:
+    options = dict(
+        window_size=10,
+        min_calls=4,
+        failure_rate=0.5,
+        slow_call_sec=5.0,
+        slow_call_rate=0.5,
+        open_sec=30,
+        half_open_calls=2,
+        max_inflight=8,
+    )
+    options.update(kwargs)
+    breaker = CircuitBreaker(NUTRITION, clock=clock or FakeClock(), **options)
+    CircuitBreaker._registry[NUTRITION] = breaker
+    return breaker
+
+
+async def call_many(count: int):
+    return await asyncio.gather(
+        *(AIClient.request_single_analysis("a") for _ in range(count)), return_exceptions=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_failures_open_circuit_and_fast_fail(stub):
+    breaker = install_breaker()
+    stub.mode = "error"
+
+    results = await call_many(4)
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+    assert breaker.state == "open"
+
+    # open 상태: stub 호출 없이 즉시 실패
+    with pytest.raises(CircuitOpenError) as exc:
+        await AIClient.request_single_analysis("a")
+    assert stub.calls == 4
+    assert exc.value.retry_after == 30
+
+
+@pytest.mark.asyncio
+async def test_half_open_probes_close_circuit(stub):
+    clock = FakeClock()
+    breaker = install_breaker(clock)
+    stub.mode = "error"
+    await call_many(4)
+
+    stub.mode = "ok"
+    clock.now += 31
+    await AIClient.request_single_analysis("a")
+    assert breaker.state == "half_open"
+    await AIClient.request_single_analysis("a")
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_failure_reopens(stub):
+    clock = FakeClock()
+    breaker = install_breaker(clock)
+    stub.mode = "error"
+    await call_many(4)
+
+    clock.now += 31
+    with pytest.raises(httpx.HTTPStatusError):
+        await AIClient.request_single_analysis("a")
+    assert breaker.state == "open"
+    assert breaker.stats()["opened"] == 2
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_open_circuit(stub):
+    breaker = install_breaker()
+    stub.mode = "bad_request"
+
+    await call_many(6)
+
+    assert breaker.state == "closed"
+    assert breaker.stats()["failures"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_calls_open_circuit(stub):
+    breaker = install_breaker(clock=None, slow_call_sec=0.01)
+    # 실제 시간 기준 지연 측정
+    breaker._clock = asyncio.get_running_loop().time
+    stub.mode, stub.delay = "slow", 0.03
+
+    await call_many(4)
+
+    assert breaker.state == "open"
+    assert breaker.stats()["slow_calls"] == 4
+
+
+@pytest.mark.asyncio
+async def test_inflight_limit_sheds_load(stub):
+    breaker = install_breaker(max_inflight=2)
+    stub.mode = "hang"
+
+    blocked = [asyncio.create_task(AIClient.request_single_analysis("a")) for _ in range(2)]
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(AIServiceOverloaded):
+        await AIClient.request_single_analysis("a")
+    assert breaker.stats()["rejected_overload"] == 1
+
+    stub.release.set()
+    await asyncio.gather(*blocked)
+    assert breaker.inflight == 0
+
+
+@pytest.mark.asyncio
+async def test_inflight_limit_applies_to_half_open_probes(stub):
+    clock = FakeClock()
+    breaker = install_breaker(clock, max_inflight=2)
+    stub.mode = "hang"
+
+    # closed 상태에서 시작된 요청이 아직 진행중인 채로 open -> half-open 전환
+    blocked = [asyncio.create_task(AIClient.request_single_analysis("a")) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    breaker._open()
+    clock.now += 31
+
+    with pytest.raises(AIServiceOverloaded):
+        # 제한 미적용시 시험 요청이 stub 에서 멈춤 -> timeout 으로 실패
+        await asyncio.wait_for(AIClient.request_single_analysis("a"), 1)
+    assert breaker.state == "half_open"
+    assert breaker._probes == 0  # 거절된 요청은 시험 슬롯 소모 x
+
+    stub.release.set()
+    await asyncio.gather(*blocked)
+    stub.mode = "ok"
+    await AIClient.request_single_analysis("a")
+    assert breaker._probes == 1
+
+
+@pytest.mark.asyncio
+async def test_breakers_are_per_endpoint(stub):
+    install_breaker()
+    stub.mode = "error"
+    await call_many(4)
+
+    other = CircuitBreaker.get("/api/inference/v4/analyze")
+    assert other.state == "closed"
+    assert set(CircuitBreaker.all_stats()) == {NUTRITION, "/api/inference/v4/analyze"}
+
+
+def test_open_circuit_returns_503_with_retry_after(client):
+    with (
+        patch(
+            "app.services.food.AIClient.request_single_analysis",
+            new_callable=AsyncMock,
+            side_effect=CircuitOpenError(NUTRITION, "circuit open", 12),
+        ),
+        patch("app.services.food.FoodCrud.get_food_by_key_db", new_callable=AsyncMock, return_value=None),
+    ):
+        single = client.post("/api/v1/meals/analyze/single", json={"foodname": "김치찌개"})
+        multi = client.post("/api/v1/meals/analyze", json={"foodnames": ["김치찌개", "된장찌개"]})
+
+    assert single.status_code == 503
+    assert single.headers["Retry-After"] == "12"
+    assert multi.status_code == 503
+
+
+def test_breaker_stats_endpoint(client):
+    breaker = install_breaker()
+    breaker._open()
+
+    response = client.get("/api/v1/logs/ai-breakers")
+
+    assert response.status_code == 200
+    assert response.json()[NUTRITION]["state"] == "open"
+    assert response.json()[NUTRITION]["retry_after"] == 30
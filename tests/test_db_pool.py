@@ -0,0 +1,102 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from app.db.database import engine_options, async_engine
+from app.db.pool_metrics import InstrumentedAsyncPool, PoolMetrics
+
+# --- DB Connection Pool Tests ---
+# Settings 기반 풀/asyncpg 옵션, checkout 대기 histogram / overflow / timeout 집계, 503 응답
+
+
+@pytest.fixture(autouse=True)
+def reset_pool_metrics():
+    PoolMetrics.reset()
+    yield
+    PoolMetrics.reset()
+
+
+def make_pool(**kwargs) -> InstrumentedAsyncPool:
+    return InstrumentedAsyncPool(creator=MagicMock, **kwargs)
+
+
+def test_engine_options_follow_settings():
+    with (
+        patch("app.db.database.settings.db_pool_size", 3),
+        patch("app.db.database.settings.db_statement_cache_size", 0),
+        patch("app.db.database.settings.db_statement_timeout_ms", 0),
+    ):
+        options = engine_options()
+
+    assert options["poolclass"] is InstrumentedAsyncPool
+    assert options["pool_size"] == 3
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["prepared_statement_cache_size"] == 0
+    # statement_timeout 0 -> 서버 설정 미전달
+    assert "statement_timeout" not in options["connect_args"]["server_settings"]
+
+    options = engine_options()
+    assert options["connect_args"]["server_settings"] == {
+        "application_name": "caloreat-api",
+        "statement_timeout": "30000",
+    }
+    assert isinstance(async_engine.pool, InstrumentedAsyncPool)
+
+
+@pytest.mark.asyncio
+async def test_waiting_checkout_recorded_in_histogram():
+    pool = make_pool(pool_size=1, max_overflow=0, timeout=2)
+    held = await greenlet_spawn(pool.connect)
+
+    waiter = asyncio.create_task(greenlet_spawn(pool.connect))
+    await asyncio.sleep(0.06)
+    assert not waiter.done()
+    await greenlet_spawn(held.close)
+    connection = await waiter
+    await greenlet_spawn(connection.close)
+
+    stats = PoolMetrics.stats(pool)
+    assert stats["checkouts"] == 2
+    assert stats["wait_histogram"]["<=1ms"] == 1
+    assert stats["wait_histogram"]["<=100ms"] + stats["wait_histogram"]["<=500ms"] == 1
+    assert stats["wait_max_ms"] >= 50
+    assert stats["checked_out"] == 0 and stats["checked_in"] == 1
+
+
+@pytest.mark.asyncio
+async def test_overflow_and_timeout_counted():
+    pool = make_pool(pool_size=1, max_overflow=1, timeout=0.05)
+    first = await greenlet_spawn(pool.connect)
+    second = await greenlet_spawn(pool.connect)  # overflow 연결
+
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    stats = PoolMetrics.stats(pool)
+    assert stats["new_connections"] == 2
+    assert stats["overflow_events"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["checked_out"] == 2 and stats["overflow"] == 1
+
+    await greenlet_spawn(first.close)
+    await greenlet_spawn(second.close)
+
+
+def test_pool_timeout_returns_503(client, mock_db_session):
+    mock_db_session.execute.side_effect = exc.TimeoutError("QueuePool limit reached")
+
+    response = client.get("/api/v1/users/checkemail?email=test@example.com")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_db_pool_stats_endpoint(client):
+    response = client.get("/api/v1/logs/db-pool")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["pool_size"] == 10
+    assert set(body) >= {"checkouts", "timeouts", "overflow_events", "wait_histogram", "checked_out"}
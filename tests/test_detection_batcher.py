@@ -0,0 +1,141 @@
+import asyncio
+import pytest
+import pytest_asyncio
+import httpx
+from fastapi import FastAPI, File, Form, UploadFile
+from unittest.mock import patch
+
+from app.clients.ai_client import AIClient
+from app.clients.detection_batcher import DetectionBatcher, DetectionBatchItemError
+
+# --- Detection Batcher Tests ---
+# 동시 감지 요청을 N장 / M ms 단위로 묶어 analyze-batch 1회 전송 + 호출자별 결과 분배
+# AI 서버는 배치 계약을 구현한 로컬 stub app (ASGITransport 로 AIClient 에 주입)
+
+
+def build_stub_app(batches: list, fail_ids: set = frozenset(), status_code: int = 200):
+    stub = FastAPI()
+
+    @stub.post("/api/inference/v4/analyze-batch")
+    async def analyze_batch(
+        images: list[UploadFile] = File(...), image_ids: list[str] = Form(...)
+    ):
+        if status_code != 200:
+            from fastapi.responses import JSONResponse
+
+            return JSONResponse({"detail": "error"}, status_code=status_code)
+        batches.append(image_ids)
+        results = []
+        # 응답 순서와 무관하게 image_id 로 매칭되는지 확인하기 위해 역순 반환
+        for image, image_id in reversed(list(zip(images, image_ids))):
+            if image_id in fail_ids:
+                results.append({"image_id": image_id, "error": "decode failed"})
+                continue
+            size = len(await image.read())
+            results.append({"image_id": image_id, "food_name": f"size-{size}", "candidates": []})
+        return {"results": results}
+
+    return stub
+
+
+@pytest_asyncio.fixture
+async def use_stub():
+    async def _use(**kwargs):
+        batches = []
+        await AIClient.shutdown(grace_sec=0)
+        await AIClient.startup(
+            transport=httpx.ASGITransport(app=build_stub_app(batches, **kwargs))
+        )
+        return batches
+
+    DetectionBatcher.reset()
+    with patch("app.clients.ai_client.settings.ai_detection_batch_enabled", True):
+        yield _use
+        await DetectionBatcher.shutdown()
+    await AIClient.shutdown(grace_sec=0)
+    DetectionBatcher.reset()
+
+
+async def detect_many(count: int):
+    return await asyncio.gather(
+        *(AIClient.request_detection(b"x" * (i + 1), f"id-{i}") for i in range(count)),
+        return_exceptions=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_sent_as_one_batch(use_stub):
+    batches = await use_stub()
+    DetectionBatcher.startup(max_batch_size=8, max_wait_ms=50)
+
+    results = await detect_many(5)
+
+    assert batches == [[f"id-{i}" for i in range(5)]]
+    # 각 호출자는 자신의 이미지 결과 수신
+    assert [r["image_id"] for r in results] == [f"id-{i}" for i in range(5)]
+    assert [r["food_name"] for r in results] == [f"size-{i + 1}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_batches_split_by_max_size(use_stub):
+    batches = await use_stub()
+    DetectionBatcher.startup(max_batch_size=2, max_wait_ms=50)
+
+    await detect_many(5)
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    stats = DetectionBatcher.stats()
+    assert stats["requests"] == 5
+    assert stats["batches"] == 3
+    assert stats["max_batch_size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_single_request_flushed_after_max_wait(use_stub):
+    batches = await use_stub()
+    DetectionBatcher.startup(max_batch_size=8, max_wait_ms=20)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result = await AIClient.request_detection(b"img", "solo")
+
+    assert result["image_id"] == "solo"
+    assert batches == [["solo"]]
+    assert loop.time() - start < 1.0
+
+
+@pytest.mark.asyncio
+async def test_item_error_only_fails_that_caller(use_stub):
+    await use_stub(fail_ids={"id-1"})
+    DetectionBatcher.startup(max_batch_size=8, max_wait_ms=50)
+
+    results = await detect_many(3)
+
+    assert isinstance(results[1], DetectionBatchItemError)
+    assert results[0]["image_id"] == "id-0"
+    assert results[2]["image_id"] == "id-2"
+
+
+@pytest.mark.asyncio
+async def test_batch_http_error_fails_all_callers(use_stub):
+    await use_stub(status_code=503)
+    DetectionBatcher.startup(max_batch_size=8, max_wait_ms=50)
+
+    results = await detect_many(3)
+
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+    assert DetectionBatcher.stats()["failed_batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_pending_requests(use_stub):
+    batches = await use_stub()
+    DetectionBatcher.startup(max_batch_size=8, max_wait_ms=10_000)
+
+    tasks = [asyncio.create_task(AIClient.request_detection(b"x", f"id-{i}")) for i in range(3)]
+    await asyncio.sleep(0.01)
+    await DetectionBatcher.shutdown()
+
+    results = await asyncio.wait_for(asyncio.gather(*tasks), 1)
+    assert [r["image_id"] for r in results] == ["id-0", "id-1", "id-2"]
+    assert batches == [["id-0", "id-1", "id-2"]]
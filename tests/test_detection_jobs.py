@@ -0,0 +1,186 @@
+import asyncio
+import io
+import json
+import pytest
+import pytest_asyncio
+import httpx
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+from fastapi import HTTPException, status
+from PIL import Image
+
+from main import app
+from app.common.image_executor import ImageExecutor
+from app.services.detection_jobs import DetectionJobQueue
+
+# --- Detection Job Tests ---
+# 업로드 즉시 202 -> worker 감지 -> polling / SSE 결과 수신, 대기열 포화시 503, 타인 job 404
+# TestClient 는 요청마다 event loop 가 달라짐 -> 같은 loop 에서 도는 AsyncClient(ASGITransport) 사용
+
+PREFIX = "/api/v1/meals/upload/jobs"
+
+
+def make_image_bytes(size=(800, 600)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "red").save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def upload_files():
+    return {"file": ("test.jpg", make_image_bytes(), "image/jpeg")}
+
+
+async def stub_detection(image_data, image_id, content_type="image/jpeg"):
+    return {"image_id": image_id, "food_name": "된장찌개", "candidates": []}
+
+
+@pytest_asyncio.fixture
+async def job_client(override_get_db, override_get_current_user, mock_db_session):
+    @asynccontextmanager
+    async def session_factory():
+        yield mock_db_session
+
+    ImageExecutor.startup(mode="inline")
+    DetectionJobQueue.reset()
+    DetectionJobQueue.startup(workers=1, max_queue=2)
+    transport = httpx.ASGITransport(app=app)
+    with (
+        patch.object(DetectionJobQueue, "session_factory", session_factory),
+        patch("app.services.meal_image.FileManager.save_tmp_image", new_callable=AsyncMock),
+    ):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+    await DetectionJobQueue.shutdown(grace_sec=1)
+    DetectionJobQueue.reset()
+    ImageExecutor.shutdown()
+
+
+async def wait_finished(job_id: str) -> None:
+    job = DetectionJobQueue._jobs.get(job_id)
+    assert await job.wait(2)
+
+
+@pytest.mark.asyncio
+async def test_submit_returns_202_then_poll_result(job_client, mock_db_session):
+    with patch(
+        "app.services.meal_image.AIClient.request_detection", side_effect=stub_detection
+    ) as mock_ai:
+        response = await job_client.post(PREFIX, files=upload_files())
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        body = response.json()
+        assert body["status"] in ("queued", "running")
+        assert body["result"] is None
+
+        await wait_finished(body["job_id"])
+        polled = await job_client.get(f"{PREFIX}/{body['job_id']}")
+
+    assert polled.status_code == status.HTTP_200_OK
+    assert polled.json()["status"] == "succeeded"
+    assert polled.json()["result"]["image_id"] == body["image_id"]
+    mock_ai.assert_called_once()
+    # 감지 결과 Prediction Log 는 job 전용 세션으로 저장
+    mock_db_session.add.assert_called_once()
+    mock_db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_sse_streams_done_event(job_client):
+    release = asyncio.Event()
+
+    async def slow_detection(image_data, image_id, content_type="image/jpeg"):
+        await release.wait()
+        return await stub_detection(image_data, image_id, content_type)
+
+    with (
+        patch("app.services.meal_image.AIClient.request_detection", side_effect=slow_detection),
+        patch("app.routers.meal.settings.detection_job_sse_keepalive_sec", 0.01),
+    ):
+        job_id = (await job_client.post(PREFIX, files=upload_files())).json()["job_id"]
+        asyncio.get_running_loop().call_later(0.2, release.set)
+
+        async with job_client.stream("GET", f"{PREFIX}/{job_id}/events") as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            body = "".join([chunk async for chunk in response.aiter_text()])
+
+    assert ": keepalive" in body
+    event, data = body.strip().split("\n\n")[-1].split("\n")
+    assert event == "event: done"
+    assert json.loads(data.removeprefix("data: "))["status"] == "succeeded"
+
+
+@pytest.mark.asyncio
+async def test_failed_detection_reports_error(job_client):
+    with patch(
+        "app.services.meal_image.AIClient.request_detection",
+        new_callable=AsyncMock,
+        side_effect=HTTPException(status_code=502, detail="AI server error"),
+    ):
+        job_id = (await job_client.post(PREFIX, files=upload_files())).json()["job_id"]
+        await wait_finished(job_id)
+
+    body = (await job_client.get(f"{PREFIX}/{job_id}")).json()
+    assert body["status"] == "failed"
+    assert body["error"] == "AI server error"
+    assert DetectionJobQueue.stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_full_returns_503(job_client):
+    release = asyncio.Event()
+
+    async def blocked_detection(image_data, image_id, content_type="image/jpeg"):
+        await release.wait()
+        return await stub_detection(image_data, image_id, content_type)
+
+    with patch(
+        "app.services.meal_image.AIClient.request_detection", side_effect=blocked_detection
+    ):
+        # worker 1 (실행중) + 대기열 2 -> 4번째 요청 거절
+        statuses = []
+        for _ in range(4):
+            statuses.append((await job_client.post(PREFIX, files=upload_files())).status_code)
+            await asyncio.sleep(0.01)
+        release.set()
+
+        assert statuses[:3] == [status.HTTP_202_ACCEPTED] * 3
+        assert statuses[3] == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert DetectionJobQueue.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_other_users_job_is_not_found(job_client):
+    with patch(
+        "app.services.meal_image.AIClient.request_detection", side_effect=stub_detection
+    ):
+        job_id = (await job_client.post(PREFIX, files=upload_files())).json()["job_id"]
+        await wait_finished(job_id)
+
+    DetectionJobQueue._jobs.get(job_id).user_id = 999
+
+    assert (await job_client.get(f"{PREFIX}/{job_id}")).status_code == 404
+    assert (await job_client.get(f"{PREFIX}/{job_id}/events")).status_code == 404
+    assert (await job_client.get(f"{PREFIX}/unknown")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_shutdown_fails_running_job():
+    # grace 초과로 취소된 실행중 job -> failed 로 마무리 (대기중인 polling/SSE 깨움)
+    started = asyncio.Event()
+
+    async def slow_detection():
+        started.set()
+        await asyncio.sleep(10)
+
+    DetectionJobQueue.reset()
+    DetectionJobQueue.startup(workers=1, max_queue=2)
+    job = DetectionJobQueue.submit(1, "image-id", slow_detection)
+    await started.wait()
+
+    await asyncio.wait_for(DetectionJobQueue.shutdown(grace_sec=0.05), 1)
+
+    assert job.status == "failed"
+    assert job.error == "Detection server is shutting down"
+    assert job._done.is_set()
+    assert DetectionJobQueue.stats()["failed"] == 1
+    DetectionJobQueue.reset()
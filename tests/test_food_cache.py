@@ -0,0 +1,182 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.common.cache import TTLCache
+from app.services.food import FoodNutritionService, normalize_food_name
+
+# --- Food Nutrition Cache Tests ---
+# 메모리 LRU -> foods 테이블 -> LLM 순서, write-through, single-flight, 카운터 검증 (CRUD/AIClient Mocking)
+
+
+class FakeSession:
+    def __init__(self):
+        self.commit = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def food_service():
+    FoodNutritionService.reset()
+    with (
+        patch.object(FoodNutritionService, "session_factory", FakeSession),
+        patch("app.services.food.FoodCrud.get_food_by_key_db", new_callable=AsyncMock) as mock_get,
+        patch("app.services.food.FoodCrud.upsert_food_db", new_callable=AsyncMock) as mock_upsert,
+        patch("app.services.food.AIClient.request_single_analysis", new_callable=AsyncMock) as mock_llm,
+    ):
+        mock_get.return_value = None
+        yield SimpleNamespace(get=mock_get, upsert=mock_upsert, llm=mock_llm)
+    FoodNutritionService.reset()
+
+
+def test_normalize_food_name():
+    assert normalize_food_name("  김치   찌개 ") == "김치 찌개"
+    assert normalize_food_name("Pizza") == normalize_food_name("PIZZA")
+    # 호환 문자(전각) 정규화
+    assert normalize_food_name("Ｐｉｚｚａ") == "pizza"
+
+
+def test_ttl_cache_lru_and_expiry():
+    now = [100.0]
+    with patch("app.common.cache.time.monotonic", side_effect=lambda: now[0]):
+        cache = TTLCache(maxsize=2, ttl_sec=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a 최근 사용
+        cache.set("c", 3)  # b 제거
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+        now[0] += 11
+        assert cache.get("a") is None
+        assert len(cache) == 1  # c는 아직 저장됨 (조회시 만료 처리)
+
+
+@pytest.mark.asyncio
+async def test_llm_miss_writes_through_then_memory_hit(food_service):
+    food_service.llm.return_value = {"foodname": "김치찌개", "nutritions": {"calories": 200}}
+
+    first = await FoodNutritionService.get_nutrition("김치찌개")
+    second = await FoodNutritionService.get_nutrition(" 김치찌개 ")
+
+    assert first == second
+    food_service.llm.assert_awaited_once_with("김치찌개")
+    food_service.upsert.assert_awaited_once()
+    assert food_service.upsert.await_args.args[1:3] == ("김치찌개", "김치찌개")
+    stats = FoodNutritionService.stats()
+    assert stats["llm_calls"] == 1
+    assert stats["memory_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_db_hit_skips_llm(food_service):
+    food_service.get.return_value = SimpleNamespace(nutrition={"foodname": "된장찌개", "nutritions": {}})
+
+    result = await FoodNutritionService.get_nutrition("된장찌개")
+
+    assert result["foodname"] == "된장찌개"
+    food_service.llm.assert_not_awaited()
+    assert FoodNutritionService.stats()["db_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_call_llm_once(food_service):
+    async def slow_llm(name):
+        await asyncio.sleep(0.05)
+        return {"foodname": name, "nutritions": {"calories": 100}}
+
+    food_service.llm.side_effect = slow_llm
+
+    results = await asyncio.gather(*(FoodNutritionService.get_nutrition("비빔밥") for _ in range(10)))
+
+    assert all(r == results[0] for r in results)
+    assert food_service.llm.await_count == 1
+    stats = FoodNutritionService.stats()
+    assert stats["shared_waits"] == 9
+    assert stats["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_llm_error_is_not_cached(food_service):
+    food_service.llm.side_effect = [RuntimeError("llm down"), {"foodname": "라면", "nutritions": {}}]
+
+    with pytest.raises(RuntimeError):
+        await FoodNutritionService.get_nutrition("라면")
+    result = await FoodNutritionService.get_nutrition("라면")
+
+    assert result["foodname"] == "라면"
+    assert FoodNutritionService.stats()["llm_errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_db_write_failure_still_returns(food_service):
+    food_service.llm.return_value = {"foodname": "김밥", "nutritions": {}}
+    food_service.upsert.side_effect = RuntimeError("db down")
+
+    result = await FoodNutritionService.get_nutrition("김밥")
+
+    assert result["foodname"] == "김밥"
+    assert FoodNutritionService.stats()["db_errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_timeout_issues_fresh_llm_call(food_service):
+    from app.services.meal_item import MealItemService
+
+    stuck = asyncio.Event()
+    calls = 0
+
+    async def llm(name):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await stuck.wait()  # 첫 요청 응답 없음
+        return {"foodname": name, "nutritions": {"calories": calls}}
+
+    food_service.llm.side_effect = llm
+    with (
+        patch("app.services.meal_item.settings.analysis_item_timeout_sec", 0.05),
+        patch("app.services.meal_item.settings.analysis_max_retries", 1),
+        patch("app.services.meal_item.random.uniform", return_value=0),
+    ):
+        result = await MealItemService._analyze_with_retry("떡볶이")
+
+    assert result["nutritions"]["calories"] == 2
+    assert food_service.llm.await_count == 2
+
+    # 멈췄던 첫 요청이 끝나도 새 조회 결과를 덮어쓰지 않고 inflight 정리
+    stuck.set()
+    await asyncio.sleep(0.01)
+    assert FoodNutritionService.stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_forget_keeps_new_inflight_entry():
+    from app.common.cache import SingleFlight
+
+    flight = SingleFlight()
+    release_old, release_new = asyncio.Event(), asyncio.Event()
+
+    async def wait_for(event, value):
+        await event.wait()
+        return value
+
+    old = asyncio.create_task(flight.do("k", lambda: wait_for(release_old, "old")))
+    await asyncio.sleep(0)
+    flight.forget("k")
+    new = asyncio.create_task(flight.do("k", lambda: wait_for(release_new, "new")))
+    await asyncio.sleep(0)
+
+    release_old.set()
+    assert await old == ("old", False)
+    assert len(flight) == 1  # 기존 작업 완료가 새 작업 entry 를 지우지 않음
+
+    release_new.set()
+    assert await new == ("new", False)
+    assert len(flight) == 0
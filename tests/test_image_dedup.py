@@ -0,0 +1,205 @@
+import asyncio
+import io
+import os
+import uuid
+import pytest
+from PIL import Image
+from fastapi import UploadFile
+from unittest.mock import AsyncMock, patch
+
+from app.common.cache import TTLCache
+from app.common.image_executor import ImageExecutor
+from app.common.image_utils import perceptual_hash
+from app.services.detection_jobs import DetectionJobQueue
+from app.services.file_manager import FileManager
+from app.services.image_dedup import ImageDedupService
+from app.services.meal_image import MealImageService
+
+# --- Upload Dedup Tests ---
+# 같은 사진 재업로드시 감지 결과 재사용 (AI 호출 / PredictionLog 생략), 사용자별 분리, perceptual hash
+
+
+@pytest.fixture(autouse=True)
+def image_env(tmp_path):
+    ImageExecutor.startup(mode="inline")
+    with patch.object(FileManager, "TEMP_DIR", str(tmp_path / "caloreat_images")):
+        yield
+    ImageExecutor.shutdown()
+
+
+@pytest.fixture
+def mock_ai():
+    async def detect(image_data, image_id, content_type="image/jpeg"):
+        return {"image_id": image_id, "food_name": "김밥", "candidates": []}
+
+    with patch(
+        "app.services.meal_image.AIClient.request_detection", side_effect=detect
+    ) as mock:
+        yield mock
+
+
+# 같은 사진 (구도 있는 gradient) -> 저장 품질만 바꿔 재인코딩
+PHOTO = Image.merge(
+    "RGB",
+    [
+        Image.linear_gradient("L").resize((800, 600)),
+        Image.radial_gradient("L").resize((800, 600)),
+        Image.linear_gradient("L").rotate(90).resize((800, 600)),
+    ],
+)
+
+
+def make_photo(quality=90) -> bytes:
+    buffer = io.BytesIO()
+    PHOTO.save(buffer, "JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+async def upload(db, data: bytes, user_id: int = 1) -> dict:
+    file = UploadFile(file=io.BytesIO(data), filename="photo.jpg")
+    return await MealImageService.image_detection(db, file, user_id)
+
+
+@pytest.mark.asyncio
+async def test_reupload_reuses_detection(mock_ai, mock_db_session):
+    photo = make_photo()
+
+    first = await upload(mock_db_session, photo)
+    second = await upload(mock_db_session, photo)
+
+    assert second == first
+    assert mock_ai.await_count == 1
+    mock_db_session.add.assert_called_once()  # PredictionLog 1건
+
+    stats = ImageDedupService.stats()
+    assert stats["hash_hits"] == 1
+    assert stats["inference_calls"] == 1
+    assert stats["inference_saved"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reupload_restores_consumed_tmp_file(mock_ai, mock_db_session):
+    photo = make_photo()
+    first = await upload(mock_db_session, photo)
+    tmp_path = FileManager.get_tmp_file_path(first["image_id"])
+    os.remove(tmp_path)  # 식단 저장으로 tmp 삭제됨
+
+    second = await upload(mock_db_session, photo)
+
+    assert second["image_id"] == first["image_id"]
+    assert os.path.exists(tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_detection_job_reupload_saves_issued_image_id(mock_ai, mock_db_session):
+    # 비동기 job: 재사용 결과(result.image_id)와 별개로 job 응답 image_id 도 tmp 에 존재해야 함
+    from contextlib import asynccontextmanager
+
+    @asynccontextmanager
+    async def session_factory():
+        yield mock_db_session
+
+    photo = make_photo()
+    first = await upload(mock_db_session, photo)
+
+    DetectionJobQueue.reset()
+    DetectionJobQueue.startup(workers=1, max_queue=2)
+    try:
+        with patch.object(DetectionJobQueue, "session_factory", session_factory):
+            file = UploadFile(file=io.BytesIO(photo), filename="photo.jpg")
+            submitted = await MealImageService.submit_detection_job(file, 1)
+            job = DetectionJobQueue._jobs.get(submitted["job_id"])
+            assert await job.wait(2)
+    finally:
+        await DetectionJobQueue.shutdown(grace_sec=1)
+        DetectionJobQueue.reset()
+
+    assert job.to_dict()["result"]["image_id"] == first["image_id"]
+    assert mock_ai.await_count == 1
+    assert os.path.exists(FileManager.get_tmp_file_path(submitted["image_id"]))
+
+
+@pytest.mark.asyncio
+async def test_shared_detection_saves_issued_image_id(mock_db_session):
+    release = asyncio.Event()
+
+    async def slow_detect(image_data, image_id, content_type="image/jpeg"):
+        await release.wait()
+        return {"image_id": image_id, "food_name": "김밥", "candidates": []}
+
+    resized = make_photo()
+    issued_ids = [str(uuid.uuid4()) for _ in range(2)]
+    with patch(
+        "app.services.meal_image.AIClient.request_detection", side_effect=slow_detect
+    ):
+        tasks = [
+            asyncio.create_task(
+                MealImageService._detect(
+                    mock_db_session, resized, "jpg", "image/jpeg", 1, image_id
+                )
+            )
+            for image_id in issued_ids
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+    assert results[0] == results[1]
+    for image_id in issued_ids:
+        assert os.path.exists(FileManager.get_tmp_file_path(image_id))
+
+
+@pytest.mark.asyncio
+async def test_dedup_is_per_user_and_window(mock_ai, mock_db_session):
+    photo = make_photo()
+
+    await upload(mock_db_session, photo, user_id=1)
+    await upload(mock_db_session, photo, user_id=2)
+    assert mock_ai.await_count == 2
+
+    # 재사용 기간 경과
+    with patch.object(ImageDedupService, "_cache", TTLCache(maxsize=10, ttl_sec=0)):
+        await upload(mock_db_session, photo, user_id=1)
+        await upload(mock_db_session, photo, user_id=1)
+    assert mock_ai.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_uploads_call_ai_once(mock_db_session):
+    release = asyncio.Event()
+
+    async def slow_detect(image_data, image_id, content_type="image/jpeg"):
+        await release.wait()
+        return {"image_id": image_id, "food_name": "김밥", "candidates": []}
+
+    photo = make_photo()
+    with patch(
+        "app.services.meal_image.AIClient.request_detection", side_effect=slow_detect
+    ) as mock_ai:
+        tasks = [asyncio.create_task(upload(mock_db_session, photo)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+    assert mock_ai.await_count == 1
+    assert len({result["image_id"] for result in results}) == 1
+    mock_db_session.add.assert_called_once()
+    assert ImageDedupService.stats()["shared_waits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_perceptual_hash_matches_reencoded_photo(mock_ai, mock_db_session):
+    original, reencoded = make_photo(quality=95), make_photo(quality=60)
+    assert perceptual_hash(original) == perceptual_hash(reencoded)
+
+    # 기본(sha256 만): 재인코딩된 사진은 다른 사진
+    await upload(mock_db_session, original)
+    await upload(mock_db_session, reencoded)
+    assert mock_ai.await_count == 2
+
+    ImageDedupService.reset()
+    with patch("app.services.image_dedup.settings.upload_dedup_phash", True):
+        await upload(mock_db_session, original)
+        await upload(mock_db_session, reencoded)
+    assert mock_ai.await_count == 3
+    assert ImageDedupService.stats()["phash_hits"] == 1
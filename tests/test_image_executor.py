@@ -0,0 +1,78 @@
+import asyncio
+import io
+import threading
+import pytest
+from PIL import Image
+from unittest.mock import AsyncMock, patch
+
+from app.common.image_executor import ImageExecutor, ImageExecutorBusy
+from app.common.image_utils import resize_image
+
+# --- Image Executor Tests ---
+# 리사이즈 오프로딩(thread/process), 대기열 포화시 503 검증
+
+
+def create_image_bytes(size=(320, 240)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "red").save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def reset_executor():
+    ImageExecutor.shutdown()
+    yield
+    ImageExecutor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_thread_mode_runs_off_event_loop():
+    ImageExecutor.startup(mode="thread", workers=1)
+
+    thread_name = await ImageExecutor.run(lambda: threading.current_thread().name)
+
+    assert thread_name.startswith("image")
+    assert ImageExecutor.pending() == 0
+
+
+@pytest.mark.asyncio
+async def test_process_mode_resizes_image():
+    ImageExecutor.startup(mode="process", workers=1)
+
+    resized = await ImageExecutor.run(resize_image, create_image_bytes(), format="JPEG")
+
+    assert Image.open(io.BytesIO(resized)).size == (640, 640)
+
+
+@pytest.mark.asyncio
+async def test_run_raises_busy_when_saturated():
+    ImageExecutor.startup(mode="thread", workers=1)
+    release = threading.Event()
+
+    with patch("app.common.image_executor.settings.image_executor_max_pending", 1):
+        blocked = asyncio.create_task(ImageExecutor.run(release.wait))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ImageExecutorBusy):
+            await ImageExecutor.run(resize_image, create_image_bytes())
+
+        release.set()
+        await blocked
+
+
+def test_upload_returns_503_when_executor_busy(authorized_client):
+    files = {"file": ("test.jpg", create_image_bytes(), "image/jpeg")}
+
+    with (
+        patch(
+            "app.services.meal_image.ImageExecutor.run",
+            new_callable=AsyncMock,
+            side_effect=ImageExecutorBusy("busy"),
+        ),
+        patch("app.clients.ai_client.AIClient.request_detection", new_callable=AsyncMock) as mock_ai,
+    ):
+        response = authorized_client.post("/api/v1/meals/upload", files=files)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    mock_ai.assert_not_awaited()
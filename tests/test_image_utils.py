@@ -0,0 +1,117 @@
+import io
+import pytest
+from unittest.mock import patch
+from PIL import Image
+
+from app.common.image_utils import resize_image, sniff_image_format
+
+# --- Image Resize Tests ---
+# fast path(draft/reducing_gap) 결과 크기, EXIF 회전, 재인코딩 생략, 옵션 검증
+
+
+def make_image(size, format="JPEG", color=(200, 30, 30), orientation=None) -> bytes:
+    image = Image.new("RGB", size, color)
+    # 왼쪽 절반 검정 -> 회전 방향 확인용
+    image.paste((0, 0, 0), (0, 0, size[0] // 2, size[1]))
+    buffer = io.BytesIO()
+    kwargs = {}
+    if orientation:
+        exif = Image.Exif()
+        exif[0x0112] = orientation
+        kwargs["exif"] = exif
+    image.save(buffer, format, **kwargs)
+    return buffer.getvalue()
+
+
+def open_image(data: bytes) -> Image.Image:
+    return Image.open(io.BytesIO(data))
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_resize_outputs_target_size(fast):
+    result = open_image(resize_image(make_image((2000, 1500)), fast=fast))
+    assert result.size == (640, 640)
+    assert result.format == "JPEG"
+
+
+def test_fast_path_honors_exif_orientation():
+    # orientation 6 = 시계방향 90도 회전 필요 -> 왼쪽 검정 영역이 위쪽으로 이동
+    data = make_image((1600, 1200), orientation=6)
+
+    result = open_image(resize_image(data, fast=True)).convert("RGB")
+
+    top, bottom = result.getpixel((320, 100)), result.getpixel((320, 540))
+    assert sum(top) < 60
+    assert sum(bottom) > 150
+
+
+def test_fast_path_skips_reencode_when_already_target():
+    data = make_image((640, 640))
+    assert resize_image(data, fast=True) is data
+    # 포맷이 다르면 변환
+    assert open_image(resize_image(data, format="PNG", fast=True)).format == "PNG"
+
+
+def test_fast_path_converts_png_and_non_rgb():
+    data = make_image((1000, 800), format="PNG")
+    rgba = io.BytesIO()
+    open_image(data).convert("RGBA").save(rgba, "PNG")
+
+    result = open_image(resize_image(rgba.getvalue(), format="PNG", fast=True))
+
+    assert result.size == (640, 640)
+    assert result.mode == "RGB"
+
+
+def test_quality_and_resample_are_configurable():
+    data = make_image((1200, 900))
+    low = resize_image(data, fast=True, quality=30, resample="bilinear")
+    high = resize_image(data, fast=True, quality=95, resample="bilinear")
+    assert len(low) < len(high)
+
+    with pytest.raises(ValueError):
+        resize_image(data, fast=True, resample="unknown")
+
+
+def test_invalid_image_raises_value_error():
+    with pytest.raises(ValueError):
+        resize_image(b"not-an-image", fast=True)
+
+
+@pytest.mark.parametrize(
+    "format, expected",
+    [("JPEG", "JPEG"), ("PNG", "PNG"), ("WEBP", "WEBP"), ("GIF", None), ("BMP", None)],
+)
+def test_sniff_image_format_uses_magic_bytes(format, expected):
+    buffer = io.BytesIO()
+    Image.new("RGB", (10, 10)).save(buffer, format)
+    assert sniff_image_format(buffer.getvalue()[:12]) == expected
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_resize_accepts_file_path(tmp_path, fast):
+    path = tmp_path / "spooled"
+    path.write_bytes(make_image((1200, 900)))
+
+    result = open_image(resize_image(str(path), fast=fast))
+    assert result.size == (640, 640)
+
+
+@pytest.mark.asyncio
+async def test_default_settings_keep_legacy_resize_output():
+    # IMAGE_RESIZE_FAST 기본값 false -> 업로드 리사이즈 결과가 기존 경로와 byte 단위로 동일
+    from app.common.image_executor import ImageExecutor
+    from app.core.settings import Settings
+    from app.services.meal_image import MealImageService
+
+    assert Settings.model_fields["image_resize_fast"].default is False
+
+    data = make_image((1600, 1200), orientation=6)
+    ImageExecutor.startup(mode="inline")
+    try:
+        with patch("app.services.meal_image.settings.image_resize_fast", False):
+            resized = await MealImageService._resize(data, "JPEG")
+    finally:
+        ImageExecutor.shutdown()
+
+    assert resized == resize_image(data)
@@ -38,6 +38,104 @@ def test_upload_image_authorized(authorized_client):
         mock_service.assert_called_once()
 
 
+# --- Upload Ingestion (size limit / magic bytes) ---
+
+
+@pytest.fixture
+def inline_image_executor():
+    from app.common.image_executor import ImageExecutor
+
+    ImageExecutor.startup(mode="inline")
+    yield
+    ImageExecutor.shutdown()
+
+
+def make_image_bytes(format="JPEG", size=(800, 600)) -> bytes:
+    import io
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "red").save(buffer, format)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "path, service_method",
+    [
+        ("/api/v1/meals/upload", "image_detection"),
+        ("/api/v1/meals/upload/jobs", "submit_detection_job"),
+    ],
+)
+def test_upload_rejects_oversized_content_length(authorized_client, path, service_method):
+    # Content-Length 초과 -> multipart 파싱 전 413 (서비스 호출 x)
+    body = b"\xff\xd8\xff" + b"x" * (10 * 1024 * 1024 + 128 * 1024)
+
+    with patch(
+        f"app.services.meal_image.MealImageService.{service_method}", new_callable=AsyncMock
+    ) as mock_service:
+        response = authorized_client.post(path, files={"file": ("big.jpg", body, "image/jpeg")})
+
+    assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    mock_service.assert_not_called()
+
+
+def test_upload_rejects_oversized_stream(authorized_client):
+    # 미들웨어 통과 크기라도 청크 읽기 중 제한 초과 -> 413
+    body = make_image_bytes() + b"x" * (2 * 1024 * 1024)
+
+    with (
+        patch("app.services.meal_image.settings.upload_max_mb", 1),
+        patch("app.clients.ai_client.AIClient.request_detection", new_callable=AsyncMock) as mock_ai,
+    ):
+        response = authorized_client.post(
+            "/api/v1/meals/upload", files={"file": ("big.jpg", body, "image/jpeg")}
+        )
+
+    assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    mock_ai.assert_not_awaited()
+
+
+def test_upload_rejects_truncated_image(authorized_client, inline_image_executor):
+    truncated = make_image_bytes()[:600]
+
+    with patch("app.clients.ai_client.AIClient.request_detection", new_callable=AsyncMock) as mock_ai:
+        response = authorized_client.post(
+            "/api/v1/meals/upload", files={"file": ("cut.jpg", truncated, "image/jpeg")}
+        )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    mock_ai.assert_not_awaited()
+
+
+def test_upload_uses_sniffed_format_for_mislabeled_file(
+    authorized_client, inline_image_executor
+):
+    # 파일명/Content-Type 은 JPEG 이지만 실제는 PNG
+    with (
+        patch("app.clients.ai_client.AIClient.request_detection", new_callable=AsyncMock) as mock_ai,
+        patch(
+            "app.services.file_manager.FileManager.save_tmp_image", new_callable=AsyncMock
+        ) as mock_save,
+    ):
+        mock_ai.return_value = {"image_id": "x", "food_name": "x", "candidates": []}
+        response = authorized_client.post(
+            "/api/v1/meals/upload",
+            files={"file": ("photo.jpg", make_image_bytes("PNG"), "image/jpeg")},
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    resized, _, content_type = mock_ai.call_args.args
+    assert content_type == "image/png"
+    assert resized.startswith(b"\x89PNG")
+    assert mock_save.call_args.args[1].endswith(".png")
+
+    # 이미지가 아닌 파일 -> 415
+    response = authorized_client.post(
+        "/api/v1/meals/upload", files={"file": ("photo.jpg", b"not an image", "image/jpeg")}
+    )
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
 def test_override_prediction_unauthorized(client):
     response = client.post("/api/v1/meals/override/image")
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
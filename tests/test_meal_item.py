@@ -0,0 +1,112 @@
+import asyncio
+import httpx
+import pytest
+from fastapi import HTTPException
+from unittest.mock import AsyncMock, patch
+
+from app.services.meal_item import MealItemService
+
+# --- MealItemService Batch Analysis Tests ---
+# 동시성 제한, 요청 내 중복 제거, 항목별 timeout/재시도, 부분 실패 응답 검증 (FoodNutritionService Mocking)
+
+
+def http_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://test/nutrition")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+@pytest.fixture
+def analysis_settings():
+    with (
+        patch("app.services.meal_item.settings.analysis_concurrency", 2),
+        patch("app.services.meal_item.settings.analysis_item_timeout_sec", 0.2),
+        patch("app.services.meal_item.settings.analysis_max_retries", 2),
+        patch("app.services.meal_item.random.uniform", return_value=0) as mock_jitter,
+    ):
+        yield mock_jitter
+
+
+@pytest.mark.asyncio
+async def test_batch_dedupes_and_limits_concurrency(analysis_settings):
+    running = 0
+    peak = 0
+
+    async def fake_get(name, fresh=False):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"foodname": name.strip(), "nutritions": {}}
+
+    with patch(
+        "app.services.meal_item.FoodNutritionService.get_nutrition", side_effect=fake_get
+    ) as mock_get:
+        result = await MealItemService.food_analysis(["김치", "밥", " 김치", "국", "반찬", "밥"])
+
+    assert mock_get.call_count == 4  # 김치, 밥, 국, 반찬
+    assert peak <= 2
+    assert [r["foodname"] for r in result["results"]] == ["김치", "밥", "김치", "국", "반찬", "밥"]
+    assert result["errors"] == []
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_partial_failures(analysis_settings):
+    async def fake_get(name, fresh=False):
+        if name == "없는음식":
+            raise http_error(404)
+        return {"foodname": name, "nutritions": {}}
+
+    with patch("app.services.meal_item.FoodNutritionService.get_nutrition", side_effect=fake_get) as mock_get:
+        result = await MealItemService.food_analysis(["김치", "없는음식", "없는음식"])
+
+    assert [r["foodname"] for r in result["results"]] == ["김치"]
+    assert result["errors"] == [
+        {"foodname": "없는음식", "code": "CLIENT_ERROR", "detail": "error"}
+    ]
+    assert mock_get.call_count == 2  # 4xx 재시도 x
+
+
+@pytest.mark.asyncio
+async def test_retries_5xx_with_backoff(analysis_settings):
+    mock_get = AsyncMock(side_effect=[http_error(503), http_error(502), {"foodname": "김치", "nutritions": {}}])
+
+    with patch("app.services.meal_item.FoodNutritionService.get_nutrition", mock_get):
+        result = await MealItemService.food_analysis(["김치"])
+
+    assert result["results"][0]["foodname"] == "김치"
+    assert mock_get.await_count == 3
+    assert analysis_settings.call_count == 2  # backoff (jitter) 2회
+
+
+@pytest.mark.asyncio
+async def test_item_timeout_reported(analysis_settings):
+    async def fake_get(name, fresh=False):
+        if name == "느림":
+            await asyncio.Event().wait()
+        return {"foodname": name, "nutritions": {}}
+
+    with patch("app.services.meal_item.FoodNutritionService.get_nutrition", side_effect=fake_get) as mock_get:
+        result = await MealItemService.food_analysis(["김치", "느림"])
+
+    assert result["errors"][0]["foodname"] == "느림"
+    assert result["errors"][0]["code"] == "TIMEOUT"
+    assert mock_get.call_count == 1 + 3  # 김치 1회 + 느림 (1 + 재시도 2)
+    # timeout 후 재시도는 진행중 조회에 합류 x
+    slow_calls = [c.kwargs["fresh"] for c in mock_get.call_args_list if c.args[0] == "느림"]
+    assert slow_calls == [False, True, True]
+
+
+@pytest.mark.asyncio
+async def test_all_failed_raises_502(analysis_settings):
+    with patch(
+        "app.services.meal_item.FoodNutritionService.get_nutrition",
+        AsyncMock(side_effect=http_error(500)),
+    ):
+        with pytest.raises(HTTPException) as exc:
+            await MealItemService.food_analysis(["김치", "밥"])
+
+    assert exc.value.status_code == 502
+    assert [e["code"] for e in exc.value.detail["errors"]] == ["UPSTREAM_ERROR", "UPSTREAM_ERROR"]
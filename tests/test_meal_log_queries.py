@@ -0,0 +1,120 @@
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+
+from app.common.time_utils import day_range, local_date
+from app.db.crud.meal_log import MealLogCrud
+
+# --- MealLog Date Range Query Tests ---
+# 날짜 필터가 half-open timestamp 범위로 생성되는지(sargable) + 실제 실행계획의 인덱스 사용 검증
+
+
+def compiled_sql(stmt) -> str:
+    return str(
+        stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def test_day_range_uses_app_timezone():
+    with patch("app.common.time_utils.settings.app_timezone", "Asia/Seoul"):
+        start, end = day_range(date(2025, 12, 6), date(2025, 12, 7))
+        # KST 12/07 08:00 == UTC 12/06 23:00 -> KST 기준 12/07
+        assert local_date(datetime(2025, 12, 6, 23, 0, tzinfo=timezone.utc)) == date(2025, 12, 7)
+
+    assert start.astimezone(timezone.utc) == datetime(2025, 12, 5, 15, 0, tzinfo=timezone.utc)
+    assert end - start == timedelta(days=2)
+
+
+@pytest.mark.asyncio
+async def test_date_filters_are_sargable(mock_db_session):
+    mock_db_session.execute.return_value.scalar_one_or_none.return_value = None
+    target = date(2025, 12, 6)
+
+    await MealLogCrud.get_meal_logs_db(mock_db_session, 1, target)
+    await MealLogCrud.get_meal_logs_by_range_db(mock_db_session, 1, target - timedelta(days=6), target)
+    await MealLogCrud.aggregate_nutrients_by_day_db(mock_db_session, 1, target, target)
+    await MealLogCrud.aggregate_nutrients_by_meal_log_db(mock_db_session, 1, target, target)
+
+    for call in mock_db_session.execute.await_args_list:
+        sql = compiled_sql(call.args[0])
+        where = sql.split("WHERE", 1)[1]
+        # 컬럼에 함수/cast 적용 x -> 인덱스 range scan 가능
+        assert "CAST(meal_logs.eaten_at" not in where
+        assert "meal_logs.eaten_at >= '" in where
+        assert "meal_logs.eaten_at < '2025-12-07 00:00:00+00:00'" in where
+
+
+# --- EXPLAIN (실제 PostgreSQL) ---
+
+
+async def _explain_queries(db, call) -> list[str]:
+    """
+    call 실행 중 발생한 SQL을 캡처하여 각각 EXPLAIN 결과 반환
+    (selectinload 2차 쿼리 포함)
+    """
+    conn = await db.connection()
+    captured = []
+
+    def _capture(_conn, _cursor, statement, parameters, _context, _executemany):
+        captured.append((statement, parameters))
+
+    event.listen(conn.sync_connection, "before_cursor_execute", _capture)
+    try:
+        await call()
+    finally:
+        event.remove(conn.sync_connection, "before_cursor_execute", _capture)
+
+    plans = []
+    for statement, parameters in captured:
+        result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        plans.append("\n".join(row[0] for row in result.all()))
+    return plans
+
+
+@pytest.mark.asyncio
+async def test_date_range_queries_use_indexes(pg_session):
+    from sqlalchemy import text
+    from app.db.models import User, MealLog, MealItem
+
+    pg_session.add(User(id=900002, email="explain@example.com", username="explain", password="x"))
+    await pg_session.flush()
+    base = datetime(2025, 12, 1, 12, 0, tzinfo=timezone.utc)
+    for i in range(10):
+        pg_session.add(
+            MealLog(
+                user_id=900002,
+                meal_type="lunch",
+                eaten_at=base + timedelta(days=i),
+                image_urls=[],
+                meal_items=[MealItem(foodname="밥", quantity=1, nutritions={"calories": 300})],
+            )
+        )
+    await pg_session.flush()
+
+    # 소량 데이터에서도 planner가 seq scan 대신 사용 가능한 인덱스를 선택하도록 강제
+    # (cast 필터였다면 인덱스 조건으로 쓸 수 없어 여전히 user_id 만 사용)
+    await pg_session.execute(text("SET LOCAL enable_seqscan = off"))
+    target = date(2025, 12, 6)
+
+    daily = await _explain_queries(
+        pg_session, lambda: MealLogCrud.get_meal_logs_db(pg_session, 900002, target)
+    )
+    ranged = await _explain_queries(
+        pg_session,
+        lambda: MealLogCrud.get_meal_logs_by_range_db(pg_session, 900002, target - timedelta(days=6), target),
+    )
+    first = await _explain_queries(
+        pg_session, lambda: MealLogCrud.get_first_meal_log_date_db(pg_session, 900002)
+    )
+
+    for plans in (daily, ranged):
+        assert "ix_meal_logs_user_id_eaten_at" in plans[0]
+        assert "eaten_at >=" in plans[0] and "Index Cond" in plans[0]
+        # selectinload(meal_items) 2차 쿼리
+        assert "ix_meal_items_meal_log_id" in plans[1]
+    assert "ix_meal_logs_user_id_eaten_at" in first[0]
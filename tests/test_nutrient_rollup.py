@@ -0,0 +1,241 @@
+import asyncio
+import pytest
+from datetime import date, datetime, timezone, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.nutrient_rollup import NutrientRollupService
+from app.services.stats import StatsService
+
+# --- Daily Nutrient Rollup Tests ---
+# 증분 갱신 delta 계산, stats 집계 row 사용, 정합성 체크 검증 (CRUD Mocking)
+
+
+def make_rollup(day, **values):
+    row = {
+        "calories": 0.0,
+        "carbs": 0.0,
+        "protein": 0.0,
+        "fat": 0.0,
+        "sugar": 0.0,
+        "fiber": 0.0,
+        "sodium": 0.0,
+        "cholesterol": 0.0,
+        "saturated_fat": 0.0,
+        "meal_count": 1,
+    }
+    row.update(values)
+    return SimpleNamespace(day=day, **row)
+
+
+def test_summarize_items_applies_quantity():
+    totals = NutrientRollupService.summarize_items(
+        [
+            {"nutritions": {"calories": 100, "carbs_g": 10, "sodium_mg": None}, "quantity": 2},
+            {"nutritions": None, "quantity": 1},
+            {"nutritions": {"calories": 50, "protein_g": 5}, "quantity": 0},  # 0 -> 1.0
+        ]
+    )
+    assert totals["calories"] == 250
+    assert totals["carbs"] == 20
+    assert totals["protein"] == 5
+    assert totals["sodium"] == 0
+
+
+def test_rollup_day_uses_utc_date():
+    kst = timezone(timedelta(hours=9))
+    # KST 12/07 08:00 == UTC 12/06 23:00
+    assert NutrientRollupService.rollup_day(datetime(2025, 12, 7, 8, 0, tzinfo=kst)) == date(2025, 12, 6)
+    assert NutrientRollupService.rollup_day(datetime(2025, 12, 7, 8, 0)) == date(2025, 12, 7)
+
+
+@pytest.mark.asyncio
+async def test_weekly_stats_reads_rollups():
+    end = date(2025, 12, 7)
+    rollups = [
+        make_rollup(date(2025, 12, 1), calories=1000, carbs=100, protein=50, fat=20),
+        make_rollup(date(2025, 12, 7), calories=400, carbs=40, protein=10, fat=10, sodium=700),
+    ]
+
+    with (
+        patch("app.services.stats.DailyNutrientRollupCrud.get_rollups_by_range_db", new_callable=AsyncMock) as mock_rollups,
+        patch("app.services.stats.MealLogCrud.get_first_meal_log_date_db", new_callable=AsyncMock) as mock_first,
+        patch("app.services.stats.StatsService.calculate_goal_calories", new_callable=AsyncMock) as mock_goal,
+    ):
+        mock_rollups.return_value = rollups
+        mock_first.return_value = date(2025, 11, 1)
+        mock_goal.return_value = 2000.0
+
+        result = await StatsService.get_weekly_stats(None, 1, end)
+
+    mock_rollups.assert_awaited_once_with(None, 1, date(2025, 12, 1), end)
+    assert result.totalCalories == round(1400 / 7, 1)
+    assert result.nutrients.carbs.amount == round(140 / 7, 1)
+    assert result.nutrients.sodium == 100.0
+    assert [c.calories for c in result.chartData] == [1000, 0, 0, 0, 0, 0, 400]
+
+
+@pytest.mark.asyncio
+async def test_create_meal_log_applies_rollup_delta():
+    from app.services.meal_log import MealLogService
+    from app.db.schemas.meal_log import MealLogCreate
+
+    meal = MealLogCreate(
+        meal_type="lunch",
+        eaten_at=datetime(2025, 12, 6, 12, 0, tzinfo=timezone.utc),
+        tmp_image_ids=[],
+        meal_items=[
+            {"foodname": "a", "quantity": 2, "nutritions": {"calories": 100, "fat_g": 3}},
+        ],
+    )
+    db = AsyncMock()
+
+    with (
+        patch("app.services.meal_log.MealLogCrud.create_meal_log_db", new_callable=AsyncMock) as mock_create,
+        patch("app.services.meal_log.MealLogCrud.get_meal_log_by_id_db", new_callable=AsyncMock),
+        patch("app.services.meal_log.MealLogRead.model_validate"),
+        patch("app.services.nutrient_rollup.DailyNutrientRollupCrud.apply_delta_db", new_callable=AsyncMock) as mock_delta,
+    ):
+        mock_create.return_value = SimpleNamespace(id=10)
+        await MealLogService.create_meal_log(db, 1, meal)
+
+    args = mock_delta.await_args.args
+    assert args[1:3] == (1, date(2025, 12, 6))
+    assert args[3]["calories"] == 200
+    assert args[3]["fat"] == 6
+    assert args[3]["meal_count"] == 1
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_find_inconsistencies_reports_diff():
+    expected = [make_rollup(date(2025, 12, 6), calories=300)]
+    stored = [make_rollup(date(2025, 12, 6), calories=250)]
+
+    with (
+        patch("app.services.nutrient_rollup.MealLogCrud.aggregate_nutrients_by_day_db", new_callable=AsyncMock) as mock_recompute,
+        patch("app.services.nutrient_rollup.DailyNutrientRollupCrud.get_rollups_by_range_db", new_callable=AsyncMock) as mock_rollups,
+    ):
+        mock_recompute.return_value = expected
+        mock_rollups.return_value = stored
+
+        diffs = await NutrientRollupService.find_inconsistencies(None, 1)
+
+    assert diffs == [
+        {"day": date(2025, 12, 6), "column": "calories", "stored": 250, "expected": 300}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_apply_delta_compiles_to_atomic_upsert():
+    from sqlalchemy.dialects import postgresql
+    from app.db.crud.daily_nutrient_rollup import DailyNutrientRollupCrud
+
+    db = AsyncMock()
+    await DailyNutrientRollupCrud.apply_delta_db(
+        db, 1, date(2025, 12, 6), {"calories": 10, "meal_count": 1}
+    )
+
+    stmt = db.execute.await_args_list[0].args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (user_id, day) DO UPDATE" in sql
+    assert "calories = (daily_nutrient_rollups.calories + excluded.calories)" in sql
+
+
+class FakeMealStore:
+    """
+    식단 1건 + 일별 칼로리 rollup 을 가진 in-memory DB 대체
+    for_update 조회는 row lock 획득 (세션 commit/rollback 시 해제) -> PostgreSQL row lock 흉내
+    """
+
+    def __init__(self, eaten_at, calories):
+        self.log = {"eaten_at": eaten_at, "items": [{"nutritions": {"calories": calories}, "quantity": 1}]}
+        self.rollup = {NutrientRollupService.rollup_day(eaten_at): calories}
+        self.row_lock = asyncio.Lock()
+
+    def session(self):
+        db = AsyncMock()
+
+        def release():
+            if getattr(db, "holds_lock", False):
+                db.holds_lock = False
+                self.row_lock.release()
+
+        db.commit.side_effect = release
+        db.rollback.side_effect = release
+        return db
+
+    async def get_meal_log(self, db, meal_id, for_update=False):
+        if for_update:
+            await self.row_lock.acquire()
+            db.holds_lock = True
+        if self.log is None:
+            return None
+        snapshot = SimpleNamespace(
+            id=meal_id,
+            user_id=1,
+            eaten_at=self.log["eaten_at"],
+            meal_items=[SimpleNamespace(**item) for item in self.log["items"]],
+        )
+        await asyncio.sleep(0.01)  # 다른 요청이 끼어들 수 있는 지점
+        return snapshot
+
+    async def update_meal_log(self, db, meal_id, user_id, update_data):
+        self.log["eaten_at"] = update_data["eaten_at"]
+        return SimpleNamespace(id=meal_id, eaten_at=self.log["eaten_at"])
+
+    async def delete_items(self, db, meal_log_id):
+        self.log["items"] = []
+
+    async def create_items(self, db, items):
+        self.log["items"] = [{"nutritions": i["nutritions"], "quantity": i["quantity"]} for i in items]
+
+    async def delete_meal_log(self, db, meal_id, user_id):
+        deleted, self.log = self.log is not None, None
+        return deleted
+
+    async def apply_delta(self, db, user_id, day, delta):
+        self.rollup[day] = self.rollup.get(day, 0) + delta["calories"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_update_then_delete_keeps_rollup_consistent():
+    # PUT (12/06 100kcal -> 12/07 300kcal) 과 DELETE 동시 요청
+    # 둘 다 같은 스냅샷을 차감하면 12/06 = -100, 12/07 = 300 으로 어긋남
+    from app.db.schemas.meal_log import MealLogUpdate
+    from app.services.meal_log import MealLogService
+
+    store = FakeMealStore(datetime(2025, 12, 6, 12, 0, tzinfo=timezone.utc), 100)
+    update_req = MealLogUpdate(
+        meal_type="dinner",
+        eaten_at=datetime(2025, 12, 7, 19, 0, tzinfo=timezone.utc),
+        meal_items=[{"foodname": "a", "quantity": 1, "nutritions": {"calories": 300}}],
+    )
+
+    with (
+        patch("app.services.meal_log.MealLogCrud.get_meal_log_by_id_db", side_effect=store.get_meal_log),
+        patch("app.services.meal_log.MealLogCrud.update_meal_log_db", side_effect=store.update_meal_log),
+        patch("app.services.meal_log.MealLogCrud.delete_meal_items_by_log_id", side_effect=store.delete_items),
+        patch("app.services.meal_log.MealLogCrud.create_meal_items_db", side_effect=store.create_items),
+        patch("app.services.meal_log.MealLogCrud.delete_meal_log_db", side_effect=store.delete_meal_log),
+        patch("app.services.nutrient_rollup.DailyNutrientRollupCrud.apply_delta_db", side_effect=store.apply_delta),
+    ):
+        update = asyncio.create_task(MealLogService.update_meal_log(store.session(), 1, 10, update_req))
+        await asyncio.sleep(0)
+        delete = asyncio.create_task(MealLogService.delete_meal_log(store.session(), 1, 10))
+        await asyncio.gather(update, delete)
+
+    assert store.log is None
+    assert store.rollup == {date(2025, 12, 6): 0, date(2025, 12, 7): 0}
+
+
+def test_meal_log_snapshot_for_update_locks_row():
+    from sqlalchemy.dialects import postgresql
+    from app.db.crud.meal_log import MealLogCrud
+
+    db = AsyncMock()
+    db.execute.return_value = MagicMock()
+    asyncio.run(MealLogCrud.get_meal_log_by_id_db(db, 10, for_update=True))
+
+    stmt = db.execute.await_args.args[0]
+    assert "FOR UPDATE OF meal_logs" in str(stmt.compile(dialect=postgresql.dialect()))
@@ -0,0 +1,64 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.sql import Select
+
+from app.services.nutrition_calculator import NutritionCalculatorService
+
+# --- Nutrition Advice Tests ---
+# 요청 단위 NutritionContext : profile/conditions 1회 조회 후 재사용 검증
+
+
+def test_advice_issues_at_most_two_selects(authorized_client, mock_db_session):
+    # 오늘 합계 row 없음 / 프로필·condition 없음 -> 기본 목표
+    mock_db_session.execute.return_value.all.return_value = []
+
+    response = authorized_client.get("/api/v1/nutrition/advice")
+
+    assert response.status_code == 200
+    assert response.json()["target"]["calorie"] == 2000
+    statements = [call.args[0] for call in mock_db_session.execute.await_args_list]
+    assert len(statements) <= 2
+    assert all(isinstance(stmt, Select) for stmt in statements)
+
+
+@pytest.mark.asyncio
+async def test_advice_loads_context_once():
+    profile = SimpleNamespace(
+        gender="female", birthdate=date(1995, 1, 1), height=160, weight=55, goal_type="loss"
+    )
+    intake = {"calorie": 2500, "carb": 400, "protein": 50, "fat": 80, "sodium": 2500}
+
+    with patch(
+        "app.services.nutrition_calculator.UserProfileCrud.get_profile_with_conditions_db",
+        new_callable=AsyncMock,
+    ) as mock_load:
+        mock_load.return_value = (profile, ["diabetes", "hypertension", "hyperlipidemia"])
+        result = await NutritionCalculatorService.get_nutrition_advice(None, 1, intake)
+
+    mock_load.assert_awaited_once()
+    assert result["warnings"] == [
+        "GOAL_CALORIE_OVER",
+        "DIABETES_CARB_OVER",
+        "HYPERTENSION_SODIUM_OVER",
+        "HYPERLIPIDEMIA_FAT_OVER",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_profile_with_conditions_single_query():
+    from app.db.crud.user_profile import UserProfileCrud
+
+    profile = SimpleNamespace(goal_type="gain")
+    result = MagicMock()
+    result.all.return_value = [(profile, "diabetes"), (profile, None)]
+    db = AsyncMock()
+    db.execute.return_value = result
+
+    loaded, conditions = await UserProfileCrud.get_profile_with_conditions_db(db, 1)
+
+    db.execute.assert_awaited_once()
+    assert loaded is profile
+    assert conditions == ["diabetes"]
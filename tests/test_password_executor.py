@@ -0,0 +1,163 @@
+import asyncio
+import threading
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import HTTPException
+
+from app.common.password_executor import PasswordExecutor, PasswordExecutorBusy
+from app.core.jwt_context import get_pwd_hash, pwd_needs_rehash, verify_pwd_async
+from app.db.schemas.user import UserLogin
+from app.services.user import UserService
+
+# --- Password Executor Tests ---
+# bcrypt 해시/검증 thread pool 오프로딩, 대기열 포화시 503, cost 설정, 로그인시 재해시
+# 테스트 속도를 위해 cost 4 사용
+
+
+@pytest.fixture(autouse=True)
+def reset_executor():
+    PasswordExecutor.shutdown()
+    with patch("app.core.jwt_context.settings.bcrypt_rounds", 4):
+        yield
+    PasswordExecutor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_verify_runs_off_event_loop():
+    PasswordExecutor.startup(workers=1)
+    hashed = get_pwd_hash("secret")
+
+    assert await verify_pwd_async("secret", hashed)
+    assert not await verify_pwd_async("wrong", hashed)
+    thread_name = await PasswordExecutor.run(lambda: threading.current_thread().name)
+    assert thread_name.startswith("bcrypt")
+
+
+def test_cost_factor_is_configurable():
+    assert get_pwd_hash("secret").startswith("$2b$04$")
+    assert get_pwd_hash("secret", rounds=5).startswith("$2b$05$")
+
+    assert not pwd_needs_rehash(get_pwd_hash("secret"))
+    assert pwd_needs_rehash(get_pwd_hash("secret", rounds=5))
+    assert not pwd_needs_rehash("not-a-bcrypt-hash")
+
+
+@pytest.mark.asyncio
+async def test_saturated_executor_raises_503():
+    PasswordExecutor.startup(workers=1)
+    release = threading.Event()
+
+    with patch("app.common.password_executor.settings.password_hash_max_pending", 1):
+        blocked = asyncio.create_task(PasswordExecutor.run(release.wait))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(HTTPException) as exc:
+            await verify_pwd_async("secret", get_pwd_hash("secret"))
+        assert exc.value.status_code == 503
+        assert exc.value.headers["Retry-After"] == "1"
+
+        release.set()
+        await blocked
+
+
+def test_login_returns_503_when_executor_busy(client, mock_current_user):
+    mock_current_user.password = get_pwd_hash("password123")
+    with (
+        patch("app.services.user.UserCrud.get_user_by_username", new_callable=AsyncMock) as mock_get,
+        patch(
+            "app.common.password_executor.PasswordExecutor.run",
+            new_callable=AsyncMock,
+            side_effect=PasswordExecutorBusy("busy"),
+        ),
+    ):
+        mock_get.return_value = mock_current_user
+        response = client.post(
+            "/api/v1/users/login", json={"account": "testuser", "password": "password123"}
+        )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_cost(mock_db_session, mock_current_user):
+    mock_current_user.password = get_pwd_hash("password123", rounds=5)
+
+    with patch("app.services.user.UserCrud.get_user_by_username", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = mock_current_user
+        user, _, _ = await UserService.login(
+            mock_db_session, UserLogin(account="testuser", password="password123")
+        )
+
+    assert user.password.startswith("$2b$04$")
+    assert await verify_pwd_async("password123", user.password)
+    mock_db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_login_skips_rehash_when_cost_current(mock_db_session, mock_current_user):
+    mock_current_user.password = get_pwd_hash("password123")
+
+    with patch("app.services.user.UserCrud.get_user_by_username", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = mock_current_user
+        await UserService.login(
+            mock_db_session, UserLogin(account="testuser", password="password123")
+        )
+
+    mock_db_session.commit.assert_not_awaited()
+
+
+def expire_on_commit(session, user):
+    # AsyncSessionLocal(expire_on_commit=True) 흉내: commit/rollback 시 expire, refresh 시 다시 로드
+    from sqlalchemy.orm.attributes import instance_state, set_committed_value
+
+    loaded = {}
+
+    async def expire():
+        loaded.update(
+            {key: value for key, value in vars(user).items() if not key.startswith("_")}
+        )
+        state = instance_state(user)
+        state._expire(state.dict, set())
+
+    async def refresh(instance):
+        for column in instance.__table__.columns:
+            set_committed_value(instance, column.key, loaded.get(column.key))
+
+    session.commit.side_effect = expire
+    session.rollback.side_effect = expire
+    session.refresh.side_effect = refresh
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("commit_fails", [False, True])
+async def test_login_after_rehash_survives_expired_instance(
+    mock_db_session, mock_current_user, commit_fails
+):
+    from sqlalchemy.orm.exc import DetachedInstanceError
+    from app.db.schemas.user import UserRead
+
+    mock_current_user.password = get_pwd_hash("password123", rounds=5)
+    expire_on_commit(mock_db_session, mock_current_user)
+    if commit_fails:
+        commit = mock_db_session.commit.side_effect
+
+        async def failing_commit():
+            await commit()
+            raise RuntimeError("db down")
+
+        mock_db_session.commit.side_effect = failing_commit
+
+    with patch("app.services.user.UserCrud.get_user_by_username", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = mock_current_user
+        user, access_token, _ = await UserService.login(
+            mock_db_session, UserLogin(account="testuser", password="password123")
+        )
+
+    assert access_token
+    mock_db_session.refresh.assert_awaited_once_with(mock_current_user)
+    # expire 상태였다면 속성 접근(lazy load) 실패
+    try:
+        assert UserRead.model_validate(user).username == "testuser"
+    except DetachedInstanceError:
+        pytest.fail("user instance still expired after rehash")
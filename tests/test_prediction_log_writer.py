@@ -0,0 +1,137 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, patch
+from sqlalchemy.dialects import postgresql
+
+from app.services.prediction_log_writer import PredictionLogWriter
+from app.services.meal_image import MealImageService
+
+# --- PredictionLog Writer Tests ---
+# 큐 -> N건 / T ms 배치 bulk INSERT (별도 세션), 종료시 drain, 실패/drop 카운터, 미실행시 직접 저장
+
+
+class RecordingSession:
+    """execute 된 INSERT 의 row 목록 기록"""
+
+    batches: list = []
+    fail = False
+
+    def __init__(self):
+        self.commit = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        if RecordingSession.fail:
+            raise RuntimeError("db down")
+        compiled = statement.compile(dialect=postgresql.dialect())
+        RecordingSession.batches.append((str(compiled), compiled.params))
+
+
+@pytest_asyncio.fixture
+async def writer():
+    RecordingSession.batches, RecordingSession.fail = [], False
+    PredictionLogWriter.reset()
+    with patch.object(PredictionLogWriter, "session_factory", RecordingSession):
+        yield PredictionLogWriter
+        await PredictionLogWriter.shutdown()
+    PredictionLogWriter.reset()
+
+
+async def enqueue_many(count: int, start: int = 0):
+    for i in range(start, start + count):
+        await PredictionLogWriter.enqueue(f"img-{i}", 1, {"food_name": "x"}, "v4")
+
+
+def image_ids(params: dict) -> list[str]:
+    return [v for k, v in sorted(params.items()) if k.startswith("image_id")]
+
+
+@pytest.mark.asyncio
+async def test_flushes_bulk_insert_by_batch_size(writer):
+    writer.startup(batch_size=3, flush_ms=10_000)
+
+    await enqueue_many(7)
+    await asyncio.sleep(0.05)
+
+    # 3건 단위 2배치 저장, 나머지 1건은 flush 대기
+    assert len(RecordingSession.batches) == 2
+    sql, params = RecordingSession.batches[0]
+    assert sql.count("VALUES") == 1 and "ON CONFLICT (image_id) DO NOTHING" in sql
+    assert sorted(image_ids(params)) == ["img-0", "img-1", "img-2"]
+
+    await writer.shutdown()
+    assert len(RecordingSession.batches) == 3
+    assert writer.stats()["written"] == 7
+
+
+@pytest.mark.asyncio
+async def test_flushes_partial_batch_after_interval(writer):
+    writer.startup(batch_size=100, flush_ms=20)
+
+    await enqueue_many(2)
+    await asyncio.sleep(0.1)
+
+    assert len(RecordingSession.batches) == 1
+    assert writer.stats()["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_write_failure_counted(writer):
+    RecordingSession.fail = True
+    writer.startup(batch_size=2, flush_ms=10)
+
+    await enqueue_many(2)
+    await writer.shutdown()
+
+    stats = writer.stats()
+    assert stats["failed_batches"] == 1
+    assert stats["failed_rows"] == 2
+    assert stats["written"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure_then_drops(writer):
+    writer.startup(batch_size=1, flush_ms=0, max_queue=1)
+    # writer 가 첫 배치 저장중 멈춘 상태 -> 큐 1칸만 남음
+    release = asyncio.Event()
+
+    async def blocked_write(rows):
+        await release.wait()
+
+    with (
+        patch.object(PredictionLogWriter, "_write", side_effect=blocked_write),
+        patch("app.services.prediction_log_writer.settings.prediction_log_enqueue_timeout_sec", 0.01),
+    ):
+        await enqueue_many(3)
+        assert writer.stats()["dropped"] == 1
+        release.set()
+        await writer.shutdown()
+
+    assert writer.stats()["enqueued"] == 2
+
+
+@pytest.mark.asyncio
+async def test_save_prediction_log_uses_writer_when_running(writer, mock_db_session):
+    writer.startup(batch_size=10, flush_ms=10)
+
+    await MealImageService._save_prediction_log(mock_db_session, "img-a", 1, {"a": 1})
+    await writer.shutdown()
+
+    # 요청 세션 사용 x
+    mock_db_session.add.assert_not_called()
+    mock_db_session.commit.assert_not_awaited()
+    assert image_ids(RecordingSession.batches[0][1]) == ["img-a"]
+
+
+@pytest.mark.asyncio
+async def test_save_prediction_log_inline_when_writer_stopped(writer, mock_db_session):
+    await MealImageService._save_prediction_log(mock_db_session, "img-a", 1, {"a": 1})
+
+    mock_db_session.add.assert_called_once()
+    mock_db_session.commit.assert_awaited_once()
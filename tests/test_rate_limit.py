@@ -0,0 +1,197 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.common.rate_limit import (
+    MemoryRateLimitBackend,
+    RateLimiter,
+    RedisRateLimitBackend,
+    client_ip,
+    parse_rate,
+)
+
+# --- Rate Limit Tests ---
+# token bucket 허용/충전, 429 + Retry-After 가 DB 조회/bcrypt 전에 반환되는지,
+# redis backend 는 EVAL 호출 형태만 검증 (로컬 stand-in client)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """redis.asyncio 대체: EVAL 을 memory bucket 으로 처리, 호출 인자 기록"""
+
+    def __init__(self):
+        self.calls = []
+        self._memory = MemoryRateLimitBackend(1000)
+
+    async def eval(self, script, numkeys, key, capacity, period_sec):
+        self.calls.append((numkeys, key, capacity, period_sec))
+        return str(await self._memory.hit(key, int(capacity), float(period_sec))).encode()
+
+
+def test_parse_rate():
+    assert parse_rate("5/60") == (5, 60.0)
+
+
+@pytest.mark.asyncio
+async def test_memory_bucket_allows_burst_then_refills():
+    clock = FakeClock()
+    backend = MemoryRateLimitBackend(100, clock=clock)
+
+    assert [await backend.hit("k", 3, 30) for _ in range(3)] == [0, 0, 0]
+    # 4번째: 다음 토큰까지 10초 (3개/30초)
+    assert await backend.hit("k", 3, 30) == pytest.approx(10)
+    # 다른 키는 독립
+    assert await backend.hit("other", 3, 30) == 0
+
+    clock.now += 10
+    assert await backend.hit("k", 3, 30) == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_uses_single_eval_per_hit():
+    redis = FakeRedis()
+    RateLimiter.startup(RedisRateLimitBackend(redis))
+
+    await RateLimiter.enforce(("login:ip:1.2.3.4", "2/60"), ("login:account:bob", "5/60"))
+
+    assert redis.calls == [
+        (1, "ratelimit:login:ip:1.2.3.4", 2, 60.0),
+        (1, "ratelimit:login:account:bob", 5, 60.0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backend_error_fails_open():
+    backend = AsyncMock()
+    backend.hit.side_effect = ConnectionError("redis down")
+    RateLimiter.startup(backend)
+
+    await RateLimiter.enforce(("login:ip:1.2.3.4", "1/60"))
+
+    assert RateLimiter.stats()["backend_errors"] == 1
+
+
+def test_login_limited_by_account_before_db_and_bcrypt(client):
+    with (
+        patch("app.routers.user.settings.rate_limit_login_account", "2/60"),
+        patch("app.services.user.UserCrud.get_user_by_username", new_callable=AsyncMock) as mock_get,
+        patch("app.services.user.verify_pwd_async", new_callable=AsyncMock) as mock_verify,
+    ):
+        mock_get.return_value = None  # 없는 계정 -> 400
+        statuses = [
+            client.post(
+                "/api/v1/users/login", json={"account": "Victim ", "password": "guess"}
+            ).status_code
+            for _ in range(3)
+        ]
+
+    assert statuses == [400, 400, 429]
+    # 429 요청은 DB 조회 x
+    assert mock_get.await_count == 2
+    mock_verify.assert_not_awaited()
+
+
+def test_login_limited_by_ip_across_accounts(client):
+    with (
+        patch("app.routers.user.settings.rate_limit_login_ip", "3/60"),
+        patch("app.services.user.UserCrud.get_user_by_username", new_callable=AsyncMock) as mock_get,
+    ):
+        mock_get.return_value = None
+        responses = [
+            client.post("/api/v1/users/login", json={"account": f"user{i}", "password": "x"})
+            for i in range(4)
+        ]
+
+    assert [r.status_code for r in responses] == [400, 400, 400, 429]
+    assert int(responses[-1].headers["Retry-After"]) == 20
+
+
+def make_request(forwarded: str | None, peer: str = "10.0.0.5"):
+    from starlette.requests import Request
+
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "headers": headers, "client": (peer, 1234)})
+
+
+@pytest.mark.parametrize(
+    "hops, forwarded, expected",
+    [
+        (1, "203.0.113.7", "203.0.113.7"),  # ALB 가 추가한 클라이언트 주소
+        (1, "1.2.3.4, 203.0.113.7", "203.0.113.7"),  # 위조된 왼쪽 항목 무시
+        (2, "1.2.3.4, 203.0.113.7, 172.16.0.9", "203.0.113.7"),  # CDN -> ALB
+        (2, "203.0.113.7", "203.0.113.7"),  # 항목 수 < 신뢰 프록시 수
+        (1, None, "10.0.0.5"),  # 헤더 없음 -> peer
+        (0, "1.2.3.4", "10.0.0.5"),  # 직접 노출 -> 헤더 무시
+    ],
+)
+def test_client_ip_uses_trusted_hop_from_right(hops, forwarded, expected):
+    with patch("app.common.rate_limit.settings.rate_limit_trusted_proxies", hops):
+        assert client_ip(make_request(forwarded)) == expected
+
+
+def test_spoofed_forwarded_for_does_not_bypass_ip_limit(client):
+    # 공격자가 매 요청 다른 왼쪽 항목을 넣어도 ALB 가 붙인 실제 주소 기준으로 제한
+    with (
+        patch("app.routers.user.settings.rate_limit_login_ip", "3/60"),
+        patch("app.services.user.UserCrud.get_user_by_username", new_callable=AsyncMock) as mock_get,
+    ):
+        mock_get.return_value = None
+        responses = [
+            client.post(
+                "/api/v1/users/login",
+                json={"account": f"user{i}", "password": "x"},
+                headers={"X-Forwarded-For": f"198.51.100.{i}, 203.0.113.7"},
+            )
+            for i in range(4)
+        ]
+
+    assert [r.status_code for r in responses] == [400, 400, 400, 429]
+
+
+@pytest.mark.parametrize(
+    "path, setting",
+    [
+        ("/api/v1/users/checkemail?email=a@example.com", "rate_limit_check_ip"),
+        ("/api/v1/users/checkid?id=abc", "rate_limit_check_ip"),
+    ],
+)
+def test_check_endpoints_limited_by_ip(client, mock_user_crud, path, setting):
+    mock_user_crud.email_exists.return_value = False
+    mock_user_crud.username_exists.return_value = False
+
+    with patch(f"app.core.settings.settings.{setting}", "2/60"):
+        statuses = [client.get(path).status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 429]
+
+
+def test_signup_limited_by_ip(client, mock_current_user):
+    payload = {"email": "a@example.com", "username": "abc", "password": "pw", "nickname": "a"}
+    with (
+        patch("app.core.settings.settings.rate_limit_signup_ip", "1/60"),
+        patch("app.services.user.UserService.register_user", new_callable=AsyncMock) as mock_register,
+    ):
+        mock_register.return_value = mock_current_user
+        first = client.post("/api/v1/users/signup", json=payload)
+        second = client.post("/api/v1/users/signup", json=payload)
+
+    assert (first.status_code, second.status_code) == (200, 429)
+    mock_register.assert_awaited_once()
+
+
+def test_disabled_rate_limit(client, mock_user_crud):
+    mock_user_crud.email_exists.return_value = False
+    with (
+        patch("app.core.settings.settings.rate_limit_enabled", False),
+        patch("app.core.settings.settings.rate_limit_check_ip", "1/60"),
+    ):
+        statuses = [client.get("/api/v1/users/checkemail?email=a@b.com").status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 200]
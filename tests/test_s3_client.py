@@ -1,7 +1,15 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from botocore.exceptions import ClientError
-from app.clients.s3_client import S3Client
+from app.clients.s3_client import S3Client, S3ObjectTooLarge
+from app.common.cache import TTLCache
+
+
+@pytest.fixture(autouse=True)
+def reset_presign_cache():
+    S3Client.reset_presign_cache()
+    yield
+    S3Client.reset_presign_cache()
 
 
 @pytest.fixture
@@ -119,7 +127,7 @@ def test_convert_to_presigned_url_success(mock_boto_client):
 
 def test_convert_to_presigned_url_failure(mock_boto_client):
     # Given
-    original_url = "https://invalid-url.com"
+    original_url = "https://test-bucket.s3.ap-northeast-2.amazonaws.com/meals/x.jpg"
 
     mock_s3 = MagicMock()
     # Mocking failure inside generate_presigned_url
@@ -150,3 +158,175 @@ def test_convert_to_presigned_url_empty_input():
 
     # Then
     assert result == ""
+
+
+@pytest.mark.parametrize(
+    "url, expected_key",
+    [
+        (
+            "https://test-bucket.s3.ap-northeast-2.amazonaws.com/meals/a.jpg",
+            "meals/a.jpg",
+        ),
+        ("https://s3.ap-northeast-2.amazonaws.com/test-bucket/meals/a.jpg", "meals/a.jpg"),
+        ("https://test-bucket.s3.amazonaws.com/meals/a.jpg?X-Amz-Expires=3600", "meals/a.jpg"),
+        ("https://test-bucket.s3.amazonaws.com/meals/a%20b.jpg", "meals/a b.jpg"),
+        ("https://test-bucket.s3.amazonaws.com/users/1/meals/a.jpg", "users/1/meals/a.jpg"),
+        ("s3://test-bucket/meals/a.jpg", "meals/a.jpg"),
+        ("meals/a.jpg", "meals/a.jpg"),
+        ("https://invalid-url.com", None),
+    ],
+)
+def test_extract_object_key(url, expected_key):
+    assert S3Client.extract_object_key(url) == expected_key
+
+
+def test_presigned_url_is_reused_until_refresh_margin():
+    mock_s3 = MagicMock()
+    mock_s3.generate_presigned_url.side_effect = ["signed-1", "signed-2"]
+    url = "https://test-bucket.s3.ap-northeast-2.amazonaws.com/meals/a.jpg"
+
+    with patch.object(S3Client, "_client", mock_s3):
+        assert S3Client.convert_to_presigned_url(url) == "signed-1"
+        assert S3Client.convert_to_presigned_url(url) == "signed-1"
+        mock_s3.generate_presigned_url.assert_called_once()
+
+        # 만료 margin 진입 (캐시 ttl 0) -> 재서명
+        with patch.object(S3Client, "_presigned_cache", TTLCache(maxsize=10, ttl_sec=0)):
+            assert S3Client.convert_to_presigned_url(url) == "signed-2"
+
+    stats = S3Client.presign_stats()
+    assert stats["generated"] == 2
+    assert stats["reused"] == 1
+
+
+def test_bulk_conversion_signs_each_key_once():
+    mock_s3 = MagicMock()
+    mock_s3.generate_presigned_url.side_effect = lambda op, Params, ExpiresIn: (
+        f"signed:{Params['Key']}"
+    )
+    urls = [
+        "https://test-bucket.s3.ap-northeast-2.amazonaws.com/meals/a.jpg",
+        "https://test-bucket.s3.ap-northeast-2.amazonaws.com/meals/b.jpg",
+        "s3://test-bucket/meals/a.jpg",
+        "",
+        "https://invalid-url.com",
+    ]
+
+    with patch.object(S3Client, "_client", mock_s3):
+        result = S3Client.convert_to_presigned_urls(urls)
+
+    assert result == [
+        "signed:meals/a.jpg",
+        "signed:meals/b.jpg",
+        "signed:meals/a.jpg",
+        "",
+        "https://invalid-url.com",
+    ]
+    assert mock_s3.generate_presigned_url.call_count == 2
+    assert S3Client.presign_stats()["reused"] == 1
+
+
+def test_failed_signature_is_not_cached():
+    mock_s3 = MagicMock()
+    error_response = {"Error": {"Code": "500", "Message": "Error Generating"}}
+    mock_s3.generate_presigned_url.side_effect = [
+        ClientError(error_response, "GeneratePresignedUrl"),
+        "signed",
+    ]
+    url = "s3://test-bucket/meals/a.jpg"
+
+    with patch.object(S3Client, "_client", mock_s3):
+        assert S3Client.convert_to_presigned_url(url) == url
+        assert S3Client.convert_to_presigned_url(url) == "signed"
+
+    assert S3Client.presign_stats()["failed"] == 1
+
+
+# --- moto (local S3 stand-in) Tests ---
+# 실제 boto3 호출 경로(async wrapper, multipart upload) 검증, moto 미설치시 skip (conftest moto_s3)
+
+
+@pytest.mark.asyncio
+async def test_async_upload_and_delete_with_moto(moto_s3, tmp_path):
+    file_path = tmp_path / "meal.jpg"
+    file_path.write_bytes(b"jpeg-bytes")
+
+    url = await S3Client.upload_file_async(str(file_path), "meals/meal.jpg")
+
+    assert url.endswith("/meals/meal.jpg")
+    obj = moto_s3.get_object(Bucket=S3Client._bucket, Key="meals/meal.jpg")
+    assert obj["Body"].read() == b"jpeg-bytes"
+    assert obj["ContentType"] == "image/jpeg"
+
+    await S3Client.delete_file_async("meals/meal.jpg")
+    assert moto_s3.list_objects_v2(Bucket=S3Client._bucket)["KeyCount"] == 0
+
+
+@pytest.mark.asyncio
+async def test_large_file_uses_multipart_upload(moto_s3, tmp_path):
+    from boto3.s3.transfer import TransferConfig
+
+    file_path = tmp_path / "large.jpg"
+    file_path.write_bytes(b"x" * (6 * 1024 * 1024))
+    config = TransferConfig(
+        multipart_threshold=5 * 1024 * 1024, multipart_chunksize=5 * 1024 * 1024
+    )
+
+    with patch.object(S3Client, "_transfer_config", config):
+        await S3Client.upload_file_async(str(file_path), "meals/large.jpg")
+
+    # multipart 업로드 ETag 형식: "<md5>-<part 수>"
+    head = moto_s3.head_object(Bucket=S3Client._bucket, Key="meals/large.jpg")
+    assert head["ETag"].strip('"').endswith("-2")
+    assert head["ContentLength"] == 6 * 1024 * 1024
+
+
+@pytest.mark.asyncio
+async def test_generate_presigned_url_async_with_moto(moto_s3):
+    url = await S3Client.generate_presigned_url_async("meals/a.jpg", expiration=60)
+
+    assert "meals/a.jpg" in url
+    assert "Expires=" in url or "X-Amz-Expires=60" in url
+
+
+@pytest.mark.asyncio
+async def test_presigned_post_and_server_side_copy_with_moto(moto_s3):
+    presigned = await S3Client.generate_presigned_post_async(
+        "tmp/abc", "image/png", max_bytes=1024, expiration=300
+    )
+
+    assert presigned["fields"]["key"] == "tmp/abc"
+    assert presigned["fields"]["Content-Type"] == "image/png"
+    assert "policy" in presigned["fields"]
+
+    # 클라이언트 업로드 대신 put_object
+    moto_s3.put_object(
+        Bucket=S3Client._bucket, Key="tmp/abc", Body=b"png", ContentType="image/png"
+    )
+    assert await S3Client.download_bytes_async("tmp/abc") == (b"png", "image/png")
+
+    url = await S3Client.copy_object_async("tmp/abc", "meals/abc.jpg")
+    assert url.endswith("/meals/abc.jpg")
+    assert (await S3Client.head_object_async("meals/abc.jpg"))["ContentType"] == "image/png"
+
+    # 원본 없음 -> None
+    assert await S3Client.copy_object_async("tmp/missing", "meals/x.jpg") is None
+    assert await S3Client.download_bytes_async("tmp/missing") is None
+    assert await S3Client.head_object_async("tmp/missing") is None
+
+
+@pytest.mark.asyncio
+async def test_download_bytes_max_bytes_and_read_header_with_moto(moto_s3):
+    body = b"\xff\xd8\xff" + b"x" * 200_000
+    moto_s3.put_object(Bucket=S3Client._bucket, Key="tmp/big", Body=body)
+
+    assert await S3Client.download_bytes_async("tmp/big", max_bytes=len(body)) == (
+        body,
+        "binary/octet-stream",
+    )
+    with pytest.raises(S3ObjectTooLarge):
+        await S3Client.download_bytes_async("tmp/big", max_bytes=len(body) - 1)
+
+    # Range GET: 앞부분만 조회
+    assert await S3Client.read_header_async("tmp/big", 12) == body[:12]
+    assert await S3Client.read_header_async("tmp/missing", 12) is None
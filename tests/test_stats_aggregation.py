@@ -0,0 +1,188 @@
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.services.stats import StatsService
+from app.db.crud.meal_log import NUTRIENT_JSON_KEYS
+from app.db.schemas.stats import StatsResponse, ChartData, DailyLogItem
+
+# --- Stats SQL Aggregation Parity Tests ---
+# SQL 집계(tuple) 경로가 기존 Python(ORM 순회) 구현과 동일한 StatsResponse를 만드는지 검증
+# 기존 구현은 legacy_* 함수로 보존 (기준값)
+
+
+def _log_calories(log):
+    return sum(
+        item.nutritions.get("calories", 0) * (item.quantity or 1.0)
+        for item in log.meal_items
+        if item.nutritions
+    )
+
+
+def legacy_daily_stats(meal_logs, target_date, goal_calories) -> StatsResponse:
+    nutrients = StatsService.aggregate_nutrients(meal_logs, divisor=1)
+    total_calories = sum(_log_calories(log) for log in meal_logs)
+    daily_logs = [
+        DailyLogItem(
+            id=log.id,
+            mealType=log.meal_type,
+            timestamp=log.eaten_at.strftime("%H:%M"),
+            name=", ".join([item.foodname for item in log.meal_items]),
+            calories=round(_log_calories(log), 1),
+        )
+        for log in meal_logs
+    ]
+    return StatsResponse(
+        type="daily",
+        date=str(target_date),
+        totalCalories=round(total_calories, 1),
+        nutrients=nutrients,
+        goals=StatsService.get_nutrient_goals(goal_calories),
+        dailyLogs=daily_logs,
+        showAlert=total_calories > 0,
+    )
+
+
+def legacy_weekly_stats(meal_logs, end_date, goal_calories, divisor) -> StatsResponse:
+    start_date = end_date - timedelta(days=6)
+    nutrients = StatsService.aggregate_nutrients(meal_logs, divisor=divisor)
+    total_calories = sum(_log_calories(log) for log in meal_logs)
+    logs_by_date = {}
+    for log in meal_logs:
+        d = log.eaten_at.date()
+        logs_by_date[d] = logs_by_date.get(d, 0) + _log_calories(log)
+    chart_data = []
+    for i in range(7):
+        current = start_date + timedelta(days=i)
+        chart_data.append(
+            ChartData(
+                name=f"{current.month}/{current.day}",
+                calories=round(logs_by_date.get(current, 0), 1),
+                goal=goal_calories,
+            )
+        )
+    return StatsResponse(
+        type="weekly",
+        date=str(end_date),
+        totalCalories=round(total_calories / divisor, 1),
+        nutrients=nutrients,
+        goals=StatsService.get_nutrient_goals(goal_calories),
+        chartData=chart_data,
+        showAlert=total_calories > 0,
+    )
+
+
+def make_meal_logs(target_date: date):
+    def item(item_id, name, quantity, **nutritions):
+        return SimpleNamespace(id=item_id, foodname=name, quantity=quantity, nutritions=nutritions)
+
+    return [
+        SimpleNamespace(
+            id=2,
+            meal_type="dinner",
+            eaten_at=datetime.combine(target_date, datetime.min.time(), timezone.utc).replace(hour=19, minute=5),
+            meal_items=[
+                item(3, "김치찌개", 1.5, calories=420.3, carbs_g=20.1, protein_g=25.7, fat_g=18.2, sodium_mg=1800.4, sugar_g=4.1),
+                item(4, "공기밥", 1, calories=300, carbs_g=65.2, protein_g=5.1, fat_g=0.6, fiber_g=0.9),
+            ],
+        ),
+        SimpleNamespace(
+            id=1,
+            meal_type="breakfast",
+            eaten_at=datetime.combine(target_date, datetime.min.time(), timezone.utc).replace(hour=8, minute=30),
+            meal_items=[
+                item(1, "토스트", 2, calories=180.55, carbs_g=30.3, protein_g=6.05, fat_g=3.3, cholesterol_mg=12.0, saturated_fat_g=1.15),
+                item(2, "우유", 0.5, calories=130, carbs_g=9.7, protein_g=6.6, fat_g=7.1),
+            ],
+        ),
+    ]
+
+
+def sql_rows_by_meal_log(meal_logs):
+    """aggregate_nutrients_by_meal_log_db 와 동일한 형태의 tuple 생성"""
+    rows = []
+    for log in meal_logs:
+        sums = {
+            col: sum((i.nutritions.get(key, 0) or 0) * (i.quantity or 1.0) for i in log.meal_items)
+            for col, key in NUTRIENT_JSON_KEYS.items()
+        }
+        name = ", ".join(i.foodname for i in sorted(log.meal_items, key=lambda i: i.id))
+        rows.append(SimpleNamespace(id=log.id, meal_type=log.meal_type, eaten_at=log.eaten_at, name=name, **sums))
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_daily_stats_sql_path_matches_python_implementation():
+    target = date(2025, 12, 6)
+    meal_logs = make_meal_logs(target)
+    expected = legacy_daily_stats(meal_logs, target, 2000.0)
+
+    with (
+        patch("app.services.stats.MealLogCrud.aggregate_nutrients_by_meal_log_db", new_callable=AsyncMock) as mock_agg,
+        patch("app.services.stats.StatsService.calculate_goal_calories", new_callable=AsyncMock) as mock_goal,
+    ):
+        mock_agg.return_value = sql_rows_by_meal_log(meal_logs)
+        mock_goal.return_value = 2000.0
+
+        result = await StatsService.get_daily_stats(None, 1, target)
+
+    assert result.model_dump_json() == expected.model_dump_json()
+
+
+def test_aggregate_queries_use_jsonb_group_by():
+    from sqlalchemy.dialects import postgresql
+    from app.db.crud import meal_log as meal_log_crud
+
+    columns = meal_log_crud._nutrient_sum_columns()
+    sql = str(columns[0].compile(dialect=postgresql.dialect()))
+    assert "CAST(meal_items.nutritions AS JSONB) ->>" in sql
+    assert "nullif(meal_items.quantity" in sql
+
+
+# --- Real PostgreSQL parity (DB 접속 가능 시) ---
+
+
+async def _seed(db, target: date):
+    from app.db.models import User, MealLog, MealItem
+
+    db.add(User(id=900001, email="parity@example.com", username="parity", password="x"))
+    await db.flush()
+    for log in make_meal_logs(target) + make_meal_logs(target - timedelta(days=3)):
+        db.add(
+            MealLog(
+                user_id=900001,
+                meal_type=log.meal_type,
+                eaten_at=log.eaten_at,
+                image_urls=[],
+                meal_items=[
+                    MealItem(foodname=i.foodname, quantity=i.quantity, nutritions=i.nutritions)
+                    for i in log.meal_items
+                ],
+            )
+        )
+    await db.flush()
+
+
+@pytest.mark.asyncio
+async def test_stats_parity_on_postgres(pg_session):
+    from app.db.crud.meal_log import MealLogCrud
+    from app.services.nutrient_rollup import NutrientRollupService
+
+    target = date(2025, 12, 6)
+    await _seed(pg_session, target)
+    await NutrientRollupService.backfill_user(pg_session, 900001)
+
+    with patch("app.services.stats.StatsService.calculate_goal_calories", new_callable=AsyncMock) as mock_goal:
+        mock_goal.return_value = 2000.0
+
+        daily = await StatsService.get_daily_stats(pg_session, 900001, target)
+        weekly = await StatsService.get_weekly_stats(pg_session, 900001, target)
+
+    logs = await MealLogCrud.get_meal_logs_db(pg_session, 900001, target)
+    assert daily.model_dump_json() == legacy_daily_stats(logs, target, 2000.0).model_dump_json()
+
+    week_logs = await MealLogCrud.get_meal_logs_by_range_db(
+        pg_session, 900001, target - timedelta(days=6), target
+    )
+    assert weekly.model_dump_json() == legacy_weekly_stats(week_logs, target, 2000.0, 4).model_dump_json()
@@ -1,8 +1,18 @@
+import io
 import pytest
 import os
+import threading
+import time
 import uuid
-from unittest.mock import patch, MagicMock
-from app.services.file_manager import FileManager
+from unittest.mock import AsyncMock, patch, MagicMock
+from app.clients.s3_client import S3Client
+from app.common.image_executor import ImageExecutor
+from fastapi import UploadFile
+from app.services.file_manager import (
+    FileManager,
+    UploadTooLarge,
+    UnsupportedImageFormat,
+)
 from app.services.meal_image import MealImageService
 
 # --- TMP Image Lifecycle Tests ---
@@ -20,6 +30,11 @@ def mock_temp_dir(tmp_path):
         yield tmp_dir
 
 
+def list_tmp_files(tmp_dir: str) -> list[str]:
+    # shard 하위 디렉토리 포함 전체 파일
+    return [name for _, _, files in os.walk(tmp_dir) for name in files]
+
+
 @pytest.mark.asyncio
 async def test_file_manager_save_and_get(mock_temp_dir):
     # Given
@@ -43,6 +58,32 @@ async def test_file_manager_save_and_get(mock_temp_dir):
     assert found_path == saved_path
 
 
+@pytest.mark.asyncio
+async def test_tmp_path_is_sharded_and_lookup_is_direct(mock_temp_dir):
+    image_id = str(uuid.uuid4())
+    saved_path = await FileManager.save_tmp_image(b"png", f"{image_id}.png")
+
+    assert saved_path == os.path.join(mock_temp_dir, image_id[:2], f"{image_id}.png")
+
+    # 디렉토리 scan 없이 고정 확장자 후보 경로만 확인
+    with patch("app.services.file_manager.os.listdir") as mock_listdir:
+        assert FileManager.get_tmp_file_path(image_id) == saved_path
+    mock_listdir.assert_not_called()
+
+    # shard 도입 전 경로(TEMP_DIR 바로 아래)도 조회
+    legacy_id = str(uuid.uuid4())
+    legacy_path = os.path.join(mock_temp_dir, f"{legacy_id}.jpg")
+    with open(legacy_path, "wb") as f:
+        f.write(b"jpg")
+    assert FileManager.get_tmp_file_path(legacy_id) == legacy_path
+
+
+@pytest.mark.parametrize("image_id", ["../etc/passwd", "abc", "", str(uuid.uuid4()).upper()])
+def test_get_tmp_file_path_rejects_invalid_id(mock_temp_dir, image_id):
+    with pytest.raises(FileNotFoundError):
+        FileManager.get_tmp_file_path(image_id)
+
+
 @pytest.mark.asyncio
 async def test_file_manager_delete(mock_temp_dir):
     # Given
@@ -96,3 +137,298 @@ async def test_upload_service_lifecycle(mock_temp_dir):
         assert not os.path.exists(
             saved_path
         ), "S3 업로드 후 로컬 파일이 삭제되지 않았습니다."
+
+
+@pytest.mark.asyncio
+async def test_upload_runs_concurrently_with_limit(mock_temp_dir):
+    """
+    여러 이미지 동시 업로드 (S3_UPLOAD_CONCURRENCY 제한) + 입력 순서대로 URL 반환
+    """
+    image_ids = [str(uuid.uuid4()) for _ in range(5)]
+    for image_id in image_ids:
+        await FileManager.save_tmp_image(b"data", f"{image_id}.jpg")
+
+    lock = threading.Lock()
+    state = {"running": 0, "max": 0}
+
+    def slow_upload(file_path, object_name):
+        with lock:
+            state["running"] += 1
+            state["max"] = max(state["max"], state["running"])
+        time.sleep(0.05)
+        with lock:
+            state["running"] -= 1
+        return f"https://s3.bucket.com/{object_name}"
+
+    with (
+        patch("app.clients.s3_client.S3Client.upload_file", side_effect=slow_upload),
+        patch("app.services.meal_image.settings.s3_upload_concurrency", 2),
+    ):
+        uploaded_urls = await MealImageService.upload_tmp_images_to_s3(image_ids)
+
+    assert uploaded_urls == [
+        f"https://s3.bucket.com/meals/{image_id}.jpg" for image_id in image_ids
+    ]
+    assert state["max"] == 2
+    assert list_tmp_files(mock_temp_dir) == []
+
+
+@pytest.mark.asyncio
+async def test_upload_failure_keeps_tmp_files(mock_temp_dir):
+    """
+    일부 업로드 실패시 예외 전파 + tmp 파일 유지 (재요청 가능)
+    """
+    image_ids = [str(uuid.uuid4()) for _ in range(3)]
+    for image_id in image_ids:
+        await FileManager.save_tmp_image(b"data", f"{image_id}.jpg")
+
+    def flaky_upload(file_path, object_name):
+        if image_ids[1] in object_name:
+            raise Exception("S3 Upload Error: boom")
+        return f"https://s3.bucket.com/{object_name}"
+
+    with patch("app.clients.s3_client.S3Client.upload_file", side_effect=flaky_upload):
+        with pytest.raises(Exception, match="S3 Upload Error"):
+            await MealImageService.upload_tmp_images_to_s3(image_ids)
+
+    assert len(list_tmp_files(mock_temp_dir)) == 3
+
+
+# --- Streaming Upload (spool_upload) Tests ---
+
+JPEG_HEADER = b"\xff\xd8\xff\xe0" + b"\x00" * 8
+
+
+def make_upload(data: bytes, size: int | None = None) -> UploadFile:
+    return UploadFile(file=io.BytesIO(data), size=size, filename="photo.png")
+
+
+@pytest.mark.asyncio
+async def test_spool_upload_keeps_small_file_in_memory():
+    data = JPEG_HEADER + b"x" * 100
+
+    upload = await FileManager.spool_upload(
+        make_upload(data), max_bytes=1024, spool_threshold=512, chunk_size=16
+    )
+
+    # 파일명(.png) 무시, magic bytes 기준 JPEG
+    assert upload.format == "JPEG"
+    assert upload.source == data
+    assert upload.path is None
+
+
+@pytest.mark.asyncio
+async def test_spool_upload_spools_large_file_to_disk():
+    data = JPEG_HEADER + b"x" * 4000
+
+    upload = await FileManager.spool_upload(
+        make_upload(data), max_bytes=8192, spool_threshold=1024, chunk_size=256
+    )
+
+    assert upload.data is None
+    assert upload.size == len(data)
+    with open(upload.source, "rb") as f:
+        assert f.read() == data
+
+    path = upload.path
+    await upload.cleanup()
+    assert not os.path.exists(path)
+
+
+@pytest.mark.asyncio
+async def test_spool_upload_rejects_oversized_and_removes_spool(tmp_path):
+    data = JPEG_HEADER + b"x" * 5000
+
+    with patch("tempfile.tempdir", str(tmp_path)):
+        with pytest.raises(UploadTooLarge):
+            await FileManager.spool_upload(
+                make_upload(data), max_bytes=4096, spool_threshold=1024, chunk_size=256
+            )
+    assert os.listdir(tmp_path) == []
+
+    # multipart 파싱 단계에서 크기를 알면 읽기 전에 거절
+    file = make_upload(data, size=len(data))
+    with pytest.raises(UploadTooLarge):
+        await FileManager.spool_upload(
+            file, max_bytes=4096, spool_threshold=1024, chunk_size=256
+        )
+    assert file.file.tell() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("data", [b"GIF89a" + b"\x00" * 100, b"<html></html>", b""])
+async def test_spool_upload_rejects_unsupported_format(data):
+    with pytest.raises(UnsupportedImageFormat):
+        await FileManager.spool_upload(
+            make_upload(data), max_bytes=4096, spool_threshold=1024, chunk_size=256
+        )
+
+
+# --- Direct Upload (client -> S3 tmp/) Tests ---
+
+
+@pytest.fixture
+def direct_upload_enabled():
+    with patch("app.services.meal_image.settings.s3_direct_upload", True):
+        yield
+
+
+def jpeg_bytes(size=(1200, 900)) -> bytes:
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "red").save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_direct_upload_detect_and_save_cycle(
+    moto_s3, direct_upload_enabled, mock_temp_dir, mock_db_session
+):
+    """
+    presign 발급 -> (클라이언트 S3 업로드) -> detect(fetch) -> 식단 저장시 tmp/ -> meals/ copy
+    """
+    from PIL import Image
+
+    # 1. presign
+    upload = await MealImageService.create_direct_upload("image/jpeg", 1)
+    image_id = upload["image_id"]
+    tmp_key = upload["fields"]["key"]
+    assert tmp_key == f"tmp/1/{image_id}"
+
+    # 2. 클라이언트 업로드 (S3 직접), Content-Type 은 클라이언트가 정한 값
+    moto_s3.put_object(
+        Bucket=S3Client._bucket, Key=tmp_key, Body=jpeg_bytes(), ContentType="image/png"
+    )
+
+    # 3. detect: S3 에서 받아 리사이즈 후 analyze, 로컬 tmp 저장 x
+    ImageExecutor.startup(mode="inline")
+    try:
+        with (
+            patch("app.services.meal_image.settings.s3_direct_upload_detection", "fetch"),
+            patch(
+                "app.services.meal_image.AIClient.request_detection", new_callable=AsyncMock
+            ) as mock_ai,
+        ):
+            mock_ai.return_value = {"image_id": image_id, "food_name": "x", "candidates": []}
+            await MealImageService.direct_image_detection(mock_db_session, image_id, 1)
+    finally:
+        ImageExecutor.shutdown()
+
+    resized, sent_id, content_type = mock_ai.call_args.args
+    assert Image.open(io.BytesIO(resized)).size == (640, 640)
+    # 포맷은 magic bytes 기준
+    assert (sent_id, content_type) == (image_id, "image/jpeg")
+    mock_db_session.add.assert_called_once()
+    assert not os.path.exists(mock_temp_dir) or os.listdir(mock_temp_dir) == []
+
+    # 4. 식단 저장: 다른 사용자는 copy x
+    assert await MealImageService.upload_tmp_images_to_s3([image_id], 2) == []
+
+    # 5. 식단 저장: server-side copy + tmp 객체 삭제
+    urls = await MealImageService.upload_tmp_images_to_s3([image_id], 1)
+
+    assert urls[0].endswith(f"/meals/{image_id}.jpg")
+    keys = [obj["Key"] for obj in moto_s3.list_objects_v2(Bucket=S3Client._bucket)["Contents"]]
+    assert keys == [f"meals/{image_id}.jpg"]
+
+
+@pytest.mark.asyncio
+async def test_direct_upload_detect_by_url(moto_s3, direct_upload_enabled, mock_db_session):
+    # 기본값 url 모드
+    image_id = str(uuid.uuid4())
+    moto_s3.put_object(Bucket=S3Client._bucket, Key=f"tmp/1/{image_id}", Body=jpeg_bytes())
+
+    with patch(
+        "app.services.meal_image.AIClient.request_detection_by_url",
+        new_callable=AsyncMock,
+    ) as mock_ai:
+        mock_ai.return_value = {"image_id": image_id, "food_name": "x", "candidates": []}
+        await MealImageService.direct_image_detection(mock_db_session, image_id, 1)
+
+    image_url, sent_id = mock_ai.call_args.args
+    assert f"tmp/1/{image_id}" in image_url
+    assert sent_id == image_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["url", "fetch"])
+async def test_direct_upload_detect_rejects_other_users_image(
+    moto_s3, direct_upload_enabled, mode
+):
+    from fastapi import HTTPException
+
+    upload = await MealImageService.create_direct_upload("image/jpeg", 1)
+    moto_s3.put_object(Bucket=S3Client._bucket, Key=upload["fields"]["key"], Body=jpeg_bytes())
+
+    with (
+        patch("app.services.meal_image.settings.s3_direct_upload_detection", mode),
+        patch("app.services.meal_image.AIClient") as mock_ai,
+    ):
+        with pytest.raises(HTTPException) as excinfo:
+            await MealImageService.direct_image_detection(AsyncMock(), upload["image_id"], 2)
+    assert excinfo.value.status_code == 404
+    assert not mock_ai.mock_calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["url", "fetch"])
+async def test_direct_upload_detect_rejects_non_image(moto_s3, direct_upload_enabled, mode):
+    from fastapi import HTTPException
+
+    image_id = str(uuid.uuid4())
+    moto_s3.put_object(
+        Bucket=S3Client._bucket,
+        Key=f"tmp/1/{image_id}",
+        Body=b"<html></html>",
+        ContentType="image/jpeg",
+    )
+
+    with (
+        patch("app.services.meal_image.settings.s3_direct_upload_detection", mode),
+        patch("app.services.meal_image.AIClient") as mock_ai,
+    ):
+        with pytest.raises(HTTPException) as excinfo:
+            await MealImageService.direct_image_detection(AsyncMock(), image_id, 1)
+    assert excinfo.value.status_code == 415
+    assert not mock_ai.mock_calls
+
+
+@pytest.mark.asyncio
+async def test_direct_upload_fetch_rejects_oversized(moto_s3, direct_upload_enabled):
+    from fastapi import HTTPException
+
+    image_id = str(uuid.uuid4())
+    moto_s3.put_object(
+        Bucket=S3Client._bucket,
+        Key=f"tmp/1/{image_id}",
+        Body=b"\xff\xd8\xff" + b"x" * (1024 * 1024),
+    )
+
+    with (
+        patch("app.services.meal_image.settings.s3_direct_upload_detection", "fetch"),
+        patch("app.services.meal_image.settings.s3_direct_upload_max_mb", 1),
+    ):
+        with pytest.raises(HTTPException) as excinfo:
+            await MealImageService.direct_image_detection(AsyncMock(), image_id, 1)
+    assert excinfo.value.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_direct_upload_detect_missing_or_invalid(moto_s3, direct_upload_enabled):
+    from fastapi import HTTPException
+
+    with pytest.raises(HTTPException) as excinfo:
+        await MealImageService.direct_image_detection(AsyncMock(), str(uuid.uuid4()), 1)
+    assert excinfo.value.status_code == 404
+
+    with pytest.raises(HTTPException) as excinfo:
+        await MealImageService.direct_image_detection(AsyncMock(), "../meals/x", 1)
+    assert excinfo.value.status_code == 400
+
+
+def test_direct_upload_endpoints_disabled_by_default(authorized_client):
+    response = authorized_client.post(
+        "/api/v1/meals/upload/presign", json={"content_type": "image/jpeg"}
+    )
+    assert response.status_code == 404
@@ -0,0 +1,112 @@
+import asyncio
+import os
+import time
+import uuid
+import pytest
+from unittest.mock import patch
+
+from app.services.file_manager import FileManager
+from app.services.tmp_janitor import TmpJanitor
+from app.commands import tmp_janitor as tmp_janitor_command
+
+# --- Tmp Janitor Tests ---
+# TTL 만료 삭제, quota 초과시 오래된 파일부터 삭제(LRU), 통계, lifespan task / CLI
+
+
+@pytest.fixture
+def temp_dir(tmp_path):
+    tmp_dir = str(tmp_path / "caloreat_images")
+    with patch.object(FileManager, "TEMP_DIR", tmp_dir):
+        TmpJanitor.reset()
+        yield tmp_dir
+        TmpJanitor.reset()
+
+
+async def make_tmp_file(size: int, age_sec: float, now: float) -> str:
+    path = await FileManager.save_tmp_image(b"x" * size, f"{uuid.uuid4()}.jpg")
+    os.utime(path, (now - age_sec, now - age_sec))
+    return path
+
+
+@pytest.mark.asyncio
+async def test_sweep_deletes_expired_files(temp_dir):
+    now = time.time()
+    old = await make_tmp_file(100, age_sec=7200, now=now)
+    fresh = await make_tmp_file(100, age_sec=60, now=now)
+
+    stats = TmpJanitor.sweep(ttl_sec=3600, quota_bytes=10_000, now=now)
+
+    assert not os.path.exists(old)
+    assert os.path.exists(fresh)
+    assert stats["scanned_files"] == 2
+    assert stats["expired_files"] == 1
+    assert stats["evicted_files"] == 0
+    assert stats["reclaimed_bytes"] == 100
+    assert stats["remaining_files"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sweep_evicts_oldest_files_over_quota(temp_dir):
+    now = time.time()
+    oldest = await make_tmp_file(400, age_sec=300, now=now)
+    middle = await make_tmp_file(400, age_sec=200, now=now)
+    newest = await make_tmp_file(400, age_sec=100, now=now)
+
+    stats = TmpJanitor.sweep(ttl_sec=3600, quota_bytes=900, now=now)
+
+    assert not os.path.exists(oldest)
+    assert os.path.exists(middle) and os.path.exists(newest)
+    assert stats["evicted_files"] == 1
+    assert stats["remaining_bytes"] == 800
+
+
+@pytest.mark.asyncio
+async def test_sweep_dry_run_keeps_files(temp_dir):
+    now = time.time()
+    old = await make_tmp_file(100, age_sec=7200, now=now)
+
+    stats = TmpJanitor.sweep(ttl_sec=3600, quota_bytes=10_000, dry_run=True, now=now)
+
+    assert os.path.exists(old)
+    assert stats["expired_files"] == 1
+    assert stats["reclaimed_bytes"] == 100
+
+
+def test_sweep_handles_missing_temp_dir(temp_dir):
+    stats = TmpJanitor.sweep()
+    assert stats["scanned_files"] == 0
+
+
+@pytest.mark.asyncio
+async def test_background_task_runs_and_records_stats(temp_dir):
+    now = time.time()
+    old = await make_tmp_file(100, age_sec=10**6, now=now)
+
+    with patch("app.services.tmp_janitor.settings.tmp_janitor_enabled", True):
+        TmpJanitor.startup(interval_sec=0.01)
+        try:
+            for _ in range(100):
+                if TmpJanitor.stats()["runs"] >= 1:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await TmpJanitor.shutdown()
+
+    stats = TmpJanitor.stats()
+    assert not os.path.exists(old)
+    assert stats["running"] is False
+    assert stats["runs"] >= 1
+    assert stats["deleted_files"] == 1
+    assert stats["reclaimed_bytes"] == 100
+
+
+@pytest.mark.asyncio
+async def test_cli_one_shot(temp_dir, capsys):
+    now = time.time()
+    old = await make_tmp_file(100, age_sec=7200, now=now)
+
+    exit_code = tmp_janitor_command.main(["--ttl-sec", "3600"])
+
+    assert exit_code == 0
+    assert not os.path.exists(old)
+    assert "expired=1" in capsys.readouterr().out
@@ -5,25 +5,25 @@ from fastapi import status
 # --- User Router Tests ---
 
 def test_checkemail_available(client, mock_user_crud):
-    mock_user_crud.get_user_by_email.return_value = None
+    mock_user_crud.email_exists.return_value = False
     response = client.get("/api/v1/users/checkemail?email=test@example.com")
     assert response.status_code == 200
     assert response.json() == {"message": "사용 가능한 이메일입니다"}
 
-def test_checkemail_unavailable(client, mock_user_crud, mock_current_user):
-    mock_user_crud.get_user_by_email.return_value = mock_current_user
+def test_checkemail_unavailable(client, mock_user_crud):
+    mock_user_crud.email_exists.return_value = True
     response = client.get("/api/v1/users/checkemail?email=test@example.com")
     assert response.status_code == 400
     assert response.json()["detail"] == "이미 사용중인 이메일입니다"
 
 def test_checkid_available(client, mock_user_crud):
-    mock_user_crud.get_user_by_username.return_value = None
+    mock_user_crud.username_exists.return_value = False
     response = client.get("/api/v1/users/checkid?id=testuser")
     assert response.status_code == 200
     assert response.json() == {"message": "사용 가능한 아이디입니다"}
 
-def test_checkid_unavailable(client, mock_user_crud, mock_current_user):
-    mock_user_crud.get_user_by_username.return_value = mock_current_user
+def test_checkid_unavailable(client, mock_user_crud):
+    mock_user_crud.username_exists.return_value = True
     response = client.get("/api/v1/users/checkid?id=testuser")
     assert response.status_code == 400
     assert response.json()["detail"] == "이미 사용중인 아이디입니다"
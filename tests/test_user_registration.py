@@ -0,0 +1,181 @@
+import asyncio
+import httpx
+from datetime import datetime, timezone
+import pytest
+from unittest.mock import AsyncMock, patch
+from sqlalchemy.exc import IntegrityError
+
+from main import app
+from app.db.crud.user import UserCrud
+from app.db.models.user import User
+from app.db.schemas.user import UserUpdate
+from app.services.user import UserService
+
+# --- User Registration Tests ---
+# 중복체크 단일 쿼리, unique 제약 위반 -> 400, 동시 가입 race, index-only scan 검증
+
+
+def unique_violation(constraint: str) -> IntegrityError:
+    return IntegrityError(
+        "INSERT INTO users ...",
+        {},
+        Exception(f'duplicate key value violates unique constraint "{constraint}"'),
+    )
+
+
+@pytest.fixture
+def fast_hash():
+    with patch(
+        "app.services.user.get_pwd_hash_async", new_callable=AsyncMock, return_value="hashed"
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_register_checks_email_and_username_in_one_query(mock_db_session, fast_hash):
+    mock_db_session.execute.return_value.one.return_value = (False, True)
+
+    with pytest.raises(Exception) as exc:
+        await UserService.register_user(mock_db_session, "a@example.com", "taken", "pw", None)
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail == "이미 사용중인 이름입니다"
+    assert mock_db_session.execute.await_count == 1
+    sql = str(mock_db_session.execute.await_args.args[0])
+    assert "lower(users.email)" in sql and "lower(users.username)" in sql
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "constraint, detail",
+    [
+        ("uq_users_email_lower", "이미 사용중인 이메일입니다"),
+        ("users_username_key", "이미 사용중인 이름입니다"),
+    ],
+)
+async def test_register_maps_unique_violation_to_400(mock_db_session, fast_hash, constraint, detail):
+    mock_db_session.execute.return_value.one.return_value = (False, False)
+
+    with patch.object(UserCrud, "create_user", side_effect=unique_violation(constraint)):
+        with pytest.raises(Exception) as exc:
+            await UserService.register_user(mock_db_session, "a@example.com", "a", "pw", None)
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail == detail
+    mock_db_session.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_register_reraises_unrelated_integrity_error(mock_db_session, fast_hash):
+    mock_db_session.execute.return_value.one.return_value = (False, False)
+
+    with patch.object(UserCrud, "create_user", side_effect=unique_violation("fk_something")):
+        with pytest.raises(IntegrityError):
+            await UserService.register_user(mock_db_session, "a@example.com", "a", "pw", None)
+
+
+@pytest.mark.asyncio
+async def test_update_user_relies_on_unique_constraint(mock_db_session, mock_current_user):
+    with (
+        patch.object(UserCrud, "get_user_by_id", new_callable=AsyncMock, return_value=mock_current_user),
+        patch.object(UserCrud, "update_user", side_effect=unique_violation("uq_users_email_lower")),
+    ):
+        with pytest.raises(Exception) as exc:
+            await UserService.update_user(mock_db_session, 1, UserUpdate(email="Other@example.com"))
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail == "이미 사용중인 이메일입니다"
+    # 이메일 중복 사전 조회 없음 (get_user_by_id 외 쿼리 x)
+    mock_db_session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_signups_same_email(override_get_db, mock_db_session, fast_hash):
+    # 동시 요청 모두 중복체크 통과 후 insert -> 첫 insert 만 성공, 나머지는 unique 위반 -> 400 (500 x)
+    signups = 3
+    checked = asyncio.Barrier(signups)
+    committed_emails = set()
+
+    async def get_signup_conflicts(db, email, username):
+        taken = email.lower() in committed_emails
+        await checked.wait()
+        return taken, False
+
+    async def create_user(db, user):
+        await asyncio.sleep(0)
+        if user.email.lower() in committed_emails:
+            raise unique_violation("uq_users_email_lower")
+        committed_emails.add(user.email.lower())
+        return User(id=len(committed_emails), email=user.email, username=user.username, nickname=user.nickname)
+
+    async def refresh(db_user):
+        # server/INSERT default 값 반영 흉내
+        db_user.created_at = datetime.now(timezone.utc)
+        db_user.is_active = True
+
+    mock_db_session.refresh.side_effect = refresh
+    transport = httpx.ASGITransport(app=app)
+    with (
+        patch.object(UserCrud, "get_signup_conflicts", side_effect=get_signup_conflicts),
+        patch.object(UserCrud, "create_user", side_effect=create_user),
+    ):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(
+                *(
+                    client.post(
+                        "/api/v1/users/signup",
+                        json={
+                            "email": "Race@example.com" if i % 2 else "race@example.com",
+                            "username": f"racer{i}",
+                            "password": "pw",
+                        },
+                    )
+                    for i in range(signups)
+                )
+            )
+
+    codes = sorted(r.status_code for r in responses)
+    assert codes == [200, 400, 400]
+    for response in responses:
+        if response.status_code == 400:
+            assert response.json()["detail"] == "이미 사용중인 이메일입니다"
+
+
+async def _explain(db, stmt) -> str:
+    compiled = stmt.compile(dialect=db.bind.dialect)
+    conn = await db.connection()
+    result = await conn.exec_driver_sql(
+        f"EXPLAIN {compiled.string}", tuple(compiled.params[k] for k in compiled.positiontup)
+    )
+    return "\n".join(row[0] for row in result.all())
+
+
+@pytest.mark.asyncio
+async def test_existence_checks_use_index_only_scan(pg_session):
+    from sqlalchemy import select, text
+    from app.db.crud.user import _email_taken, _username_taken
+
+    pg_session.add(User(id=900003, email="Case@Example.com", username="CaseUser", password="x"))
+    await pg_session.flush()
+
+    assert await UserCrud.email_exists(pg_session, "case@example.COM")
+    assert await UserCrud.username_exists(pg_session, "caseuser")
+    assert await UserCrud.get_signup_conflicts(pg_session, "new@example.com", "CASEUSER") == (False, True)
+
+    await pg_session.execute(text("SET LOCAL enable_seqscan = off"))
+    email_plan = await _explain(pg_session, select(_email_taken("case@example.com")))
+    username_plan = await _explain(pg_session, select(_username_taken("caseuser")))
+
+    assert "Index Only Scan using uq_users_email_lower" in email_plan
+    assert "Index Only Scan using uq_users_username_lower" in username_plan
+
+
+@pytest.mark.asyncio
+async def test_case_insensitive_duplicate_violates_unique_index(pg_session):
+    pg_session.add(User(id=900004, email="dup@example.com", username="dupuser", password="x"))
+    await pg_session.flush()
+
+    pg_session.add(User(id=900005, email="DUP@example.com", username="dupuser2", password="x"))
+    with pytest.raises(IntegrityError) as exc:
+        await pg_session.flush()
+    assert "uq_users_email_lower" in str(exc.value.orig)